@@ -0,0 +1,146 @@
+# ruff: noqa: T201
+
+import argparse
+from typing import Sequence
+
+from dagster import In, Nothing, Out, job, op
+from dagster._core.definitions.job_definition import JobDefinition
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.outputs import StepOutputHandle
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.retries import RetryMode
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the scheduling overhead of `ActiveExecution` for large synthetic execution plans. Two plan
+shapes are benchmarked for each step count N:
+
+    wide:  (root) --> N ops --> (sink)
+    deep:  N / D parallel chains of D ops, (op_0) --> (op_1) --> ... --> (op_D)
+
+The benchmark drives the `ActiveExecution` state machine directly, without executing any ops:
+every step that is vended by `get_steps_to_execute` is immediately marked as successful. Execution
+time is logged for building and scheduling each (shape, N) plan, followed by the scheduling time
+per step, which should stay roughly constant as N grows.
+
+The chain depth D is configurable via the `--chain-depth` arg. It is bounded by the recursion limit
+used when traversing the job's dependency structure.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="active_execution",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-steps",
+    type=int,
+    nargs="+",
+    default=[1000, 2000, 4000, 8000],
+    help="Set the step counts to benchmark for each plan shape.",
+)
+
+parser.add_argument(
+    "--chain-depth",
+    type=int,
+    default=250,
+    help="Set the number of ops in each chain of the deep plan.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def define_wide_job(num_steps: int) -> JobDefinition:
+    @op(out=Out(Nothing))
+    def root():
+        ...
+
+    @op(ins={"start": In(Nothing)}, out=Out(Nothing))
+    def fan_out():
+        ...
+
+    @op(ins={"starts": In(Nothing)})
+    def sink():
+        ...
+
+    @job(name=f"wide_{num_steps}")
+    def wide_job():
+        start = root()
+        sink([fan_out.alias(f"fan_out_{i}")(start) for i in range(num_steps)])
+
+    return wide_job
+
+
+def define_deep_job(num_steps: int, chain_depth: int) -> JobDefinition:
+    @op(ins={"start": In(Nothing)}, out=Out(Nothing))
+    def link():
+        ...
+
+    @job(name=f"deep_{num_steps}")
+    def deep_job():
+        for chain in range(max(num_steps // chain_depth, 1)):
+            last = link.alias(f"link_{chain}_0")()
+            for i in range(1, chain_depth):
+                last = link.alias(f"link_{chain}_{i}")(last)
+
+    return deep_job
+
+
+def drive_active_execution(execution_plan: ExecutionPlan) -> int:
+    num_executed = 0
+    with execution_plan.start(RetryMode.DISABLED) as active_execution:
+        while not active_execution.is_complete:
+            steps = active_execution.get_steps_to_execute()
+            assert steps, "Expected steps to execute"
+            for step in steps:
+                for step_output in step.step_outputs:
+                    active_execution.mark_step_produced_output(
+                        StepOutputHandle(step.key, step_output.name)
+                    )
+                active_execution.mark_success(step.key)
+            num_executed += len(steps)
+
+    return num_executed
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_steps: Sequence[int], chain_depth: int) -> None:
+    session = ProfilingSession(
+        name="ActiveExecution scheduling",
+        experiment_settings={"num_steps": list(num_steps), "chain_depth": chain_depth},
+    ).start()
+
+    session.log_start_message()
+
+    per_step_times = {}
+    for shape, define_job in [
+        ("wide", define_wide_job),
+        ("deep", lambda n: define_deep_job(n, chain_depth)),
+    ]:
+        for n in num_steps:
+            with session.logged_execution_time(f"Build {shape} plan with {n} steps"):
+                execution_plan = create_execution_plan(define_job(n))
+
+            with session.logged_execution_time(f"Schedule {shape} plan with {n} steps"):
+                num_executed = drive_active_execution(execution_plan)
+
+            scheduling_time = session.entries[-1].time - session.entries[-2].time
+            per_step_times[(shape, n)] = scheduling_time / num_executed
+
+    session.log_result_summary()
+
+    print()
+    for (shape, n), per_step_time in per_step_times.items():
+        print(f"{shape} ({n} steps): {per_step_time * 1e6:.1f} us/step")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_steps, args.chain_depth)
@@ -0,0 +1,178 @@
+# ruff: noqa: T201
+
+import argparse
+import logging
+from typing import Optional, Sequence
+
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    AssetsDefinition,
+    AutoMaterializePolicy,
+    DagsterInstance,
+    DailyPartitionsDefinition,
+    Definitions,
+    asset,
+    materialize,
+)
+from dagster._core.definitions.asset_daemon_context import AssetDaemonContext
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.test_utils import instance_for_test
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the time taken by `AssetDaemonContext` to evaluate the auto-materialize policies of a large
+asset graph, with assets evaluated one at a time and with the assets of each level of the graph
+evaluated in parallel on `--num-workers` threads. The graph has `--num-levels` levels of
+`--width` assets each, every asset depending on two assets of the previous level. With
+`--partitioned`, every other asset is daily partitioned. Half of the unpartitioned root assets are
+materialized before the first tick.
+
+Execution time is logged for a tick with each number of workers, on a SQLite instance. Then, on a
+new instance where every unpartitioned asset is materialized, a tick is run after one root asset is
+updated, both evaluating every asset and evaluating incrementally, which reuses the previous
+evaluation of the assets that are not downstream of the updated asset.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="asset_daemon_evaluation",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-levels",
+    type=int,
+    default=5,
+    help="Set the number of levels in the asset graph.",
+)
+
+parser.add_argument(
+    "--width",
+    type=int,
+    default=200,
+    help="Set the number of assets in each level of the asset graph.",
+)
+
+parser.add_argument(
+    "--partitioned",
+    action="store_true",
+    help="Daily partition every other asset.",
+)
+
+parser.add_argument(
+    "--num-workers",
+    type=int,
+    nargs="+",
+    default=[4, 8],
+    help="Set the numbers of threads to benchmark, in addition to serial evaluation.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+partitions_def = DailyPartitionsDefinition(start_date="2023-01-01")
+
+
+def build_asset(level: int, i: int, width: int, partitioned: bool) -> AssetsDefinition:
+    deps = (
+        [AssetKey(f"asset_{level - 1}_{i}"), AssetKey(f"asset_{level - 1}_{(i + 1) % width}")]
+        if level > 0
+        else []
+    )
+
+    @asset(
+        name=f"asset_{level}_{i}",
+        deps=deps,
+        partitions_def=partitions_def if partitioned and i % 2 == 0 else None,
+        auto_materialize_policy=AutoMaterializePolicy.eager(),
+    )
+    def _asset() -> None:
+        ...
+
+    return _asset
+
+
+def evaluate(
+    instance: DagsterInstance,
+    defs: Definitions,
+    num_workers: Optional[int],
+    cursor: Optional[AssetDaemonCursor] = None,
+    incremental_evaluation: bool = False,
+) -> AssetDaemonCursor:
+    asset_graph = defs.get_repository_def().asset_graph
+    cursor = cursor or AssetDaemonCursor.empty()
+    _, new_cursor, _ = AssetDaemonContext(
+        evaluation_id=cursor.evaluation_id + 1,
+        instance=instance,
+        asset_graph=asset_graph,
+        cursor=cursor,
+        materialize_run_tags=None,
+        observe_run_tags=None,
+        auto_observe_asset_keys=None,
+        auto_materialize_asset_keys=asset_graph.materializable_asset_keys,
+        respect_materialization_data_versions=False,
+        logger=logging.getLogger("dagster.amp"),
+        num_evaluation_workers=num_workers,
+        incremental_evaluation=incremental_evaluation,
+    ).evaluate()
+    return new_cursor
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_levels: int, width: int, partitioned: bool, num_workers: Sequence[int]) -> None:
+    session = ProfilingSession(
+        name="Asset daemon evaluation",
+        experiment_settings={
+            "num_levels": num_levels,
+            "width": width,
+            "partitioned": partitioned,
+            "num_workers": list(num_workers),
+        },
+    ).start()
+
+    session.log_start_message()
+
+    assets = [
+        build_asset(level, i, width, partitioned)
+        for level in range(num_levels)
+        for i in range(width)
+    ]
+    defs = Definitions(assets=assets)
+
+    with instance_for_test() as instance:
+        with session.logged_execution_time("Materialize root assets"):
+            materialize(
+                [a for a in assets if a.partitions_def is None][: width // 2],
+                instance=instance,
+            )
+
+        for workers in [None, *num_workers]:
+            label = f"{workers} workers" if workers else "serial"
+            with session.logged_execution_time(f"Tick with {len(assets)} assets ({label})"):
+                evaluate(instance, defs, workers)
+
+    with instance_for_test() as instance:
+        with session.logged_execution_time("Report materializations of unpartitioned assets"):
+            for assets_def in assets:
+                if assets_def.partitions_def is None:
+                    instance.report_runless_asset_event(AssetMaterialization(assets_def.key))
+
+        cursor = evaluate(instance, defs, None, incremental_evaluation=True)
+        instance.report_runless_asset_event(AssetMaterialization(assets[0].key))
+        with session.logged_execution_time("Tick after a root update (all assets)"):
+            evaluate(instance, defs, None, cursor=cursor)
+        with session.logged_execution_time("Tick after a root update (incremental)"):
+            evaluate(instance, defs, None, cursor=cursor, incremental_evaluation=True)
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_levels, args.width, args.partitioned, args.num_workers)
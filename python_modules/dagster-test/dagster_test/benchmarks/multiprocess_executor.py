@@ -0,0 +1,148 @@
+# ruff: noqa: T201
+
+import argparse
+import resource
+from typing import Sequence
+
+from dagster import DagsterInstance, JobDefinition, execute_job, job, multiprocess_executor, op
+from dagster._core.definitions.reconstruct import build_reconstructable_job
+from dagster._core.test_utils import instance_for_test
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the orchestration overhead of the multiprocess executor for jobs with many parallel steps.
+For each step count N, a job of N independent ops is executed with the multiprocess executor, each
+op logging `--events-per-step` messages. Execution time is logged for each run, followed by the
+CPU time consumed by the orchestrating (parent) process, which excludes the time spent in child
+processes.
+
+Child processes are started with `forkserver`, preloading this module, so that process startup
+does not dominate the measurements. Pass `--worker-pool` to execute steps in a pool of reused worker
+processes instead of a new process per step.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="multiprocess_executor",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-steps",
+    type=int,
+    nargs="+",
+    default=[100, 200],
+    help="Set the step counts to benchmark.",
+)
+
+parser.add_argument(
+    "--events-per-step",
+    type=int,
+    default=20,
+    help="Set the number of messages logged by each op.",
+)
+
+parser.add_argument(
+    "--max-concurrent",
+    type=int,
+    default=16,
+    help="Set the maximum number of concurrent child processes.",
+)
+
+parser.add_argument(
+    "--worker-pool",
+    action="store_true",
+    help="Execute steps in a pool of reused worker processes.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def define_parallel_job(num_steps: int, events_per_step: int) -> JobDefinition:
+    @op
+    def emit(context):
+        for i in range(events_per_step):
+            context.log.info(f"event {i}")
+
+    @job(name=f"parallel_{num_steps}", executor_def=multiprocess_executor)
+    def parallel_job():
+        for i in range(num_steps):
+            emit.alias(f"emit_{i}")()
+
+    return parallel_job
+
+
+def execute_parallel_job(
+    instance: DagsterInstance,
+    num_steps: int,
+    events_per_step: int,
+    max_concurrent: int,
+    worker_pool: bool,
+) -> None:
+    recon_job = build_reconstructable_job(
+        "dagster_test.benchmarks.multiprocess_executor",
+        "define_parallel_job",
+        reconstructable_kwargs={"num_steps": num_steps, "events_per_step": events_per_step},
+    )
+    run_config = {
+        "execution": {
+            "config": {
+                "max_concurrent": max_concurrent,
+                "start_method": {
+                    "forkserver": {
+                        "preload_modules": ["dagster_test.benchmarks.multiprocess_executor"]
+                    }
+                },
+                **({"worker_pool": {}} if worker_pool else {}),
+            }
+        }
+    }
+    with execute_job(recon_job, instance=instance, run_config=run_config) as result:
+        assert result.success
+
+
+def parent_cpu_time() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(
+    num_steps: Sequence[int], events_per_step: int, max_concurrent: int, worker_pool: bool
+) -> None:
+    session = ProfilingSession(
+        name="Multiprocess executor orchestration",
+        experiment_settings={
+            "num_steps": list(num_steps),
+            "events_per_step": events_per_step,
+            "max_concurrent": max_concurrent,
+            "worker_pool": worker_pool,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    cpu_times = {}
+    with instance_for_test() as instance:
+        for n in num_steps:
+            start_cpu_time = parent_cpu_time()
+            with session.logged_execution_time(f"Execute job with {n} steps"):
+                execute_parallel_job(instance, n, events_per_step, max_concurrent, worker_pool)
+            cpu_times[n] = parent_cpu_time() - start_cpu_time
+
+    session.log_result_summary()
+
+    print()
+    for n, cpu_time in cpu_times.items():
+        print(f"{n} steps: orchestrator CPU time {cpu_time:.2f}s")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_steps, args.events_per_step, args.max_concurrent, args.worker_pool)
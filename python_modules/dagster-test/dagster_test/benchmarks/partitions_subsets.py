@@ -0,0 +1,142 @@
+# ruff: noqa: T201
+
+import argparse
+from typing import Sequence
+
+from dagster import (
+    DailyPartitionsDefinition,
+    MultiPartitionsDefinition,
+    StaticPartitionsDefinition,
+)
+from dagster._core.definitions.partition import DefaultPartitionsSubset, PartitionsSubset
+from dagster._seven.compat.pendulum import create_pendulum_time
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the time taken by common operations on the partitions subsets of a multi-partitioned asset
+with a daily dimension starting on 2015-01-01 and a static dimension of `--num-static-keys` keys,
+and of a static-partitioned asset with `--num-keys` keys.
+
+For the multi-partitioned asset, each subset includes the first half of the partitions of every
+static key. Execution time is logged for building, serializing, deserializing and computing the
+partition key ranges of a `MultiPartitionsSubset`, which stores a time window subset of the daily
+dimension for each static key, and of a `DefaultPartitionsSubset` of the same partition keys, which
+is how subsets of multi-partitioned assets used to be represented. Each operation runs before the
+partition keys of the multi-partitions definition are cached.
+
+For the static-partitioned asset, one subset includes every other partition and another includes
+the first half of the partitions. Execution time is logged for the same operations and for the
+union and intersection of the two subsets, both for a `StaticPartitionsSubset`, which stores a
+bitmap of the indices of the partition keys, and for a `DefaultPartitionsSubset`.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="partitions_subsets",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-static-keys",
+    type=int,
+    nargs="+",
+    default=[10, 100],
+    help="Set the numbers of keys of the static dimension to benchmark.",
+)
+
+parser.add_argument(
+    "--num-keys",
+    type=int,
+    nargs="+",
+    default=[100000],
+    help="Set the numbers of keys of the static partitions definition to benchmark.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+current_time = create_pendulum_time(2023, 1, 1)
+
+
+def build_partitions_def(num_static_keys: int) -> MultiPartitionsDefinition:
+    return MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2015-01-01"),
+            "static": StaticPartitionsDefinition([f"key_{i}" for i in range(num_static_keys)]),
+        }
+    )
+
+
+def build_subset(
+    partitions_def: MultiPartitionsDefinition, subset: PartitionsSubset
+) -> PartitionsSubset:
+    date_keys = partitions_def.primary_dimension.partitions_def.get_partition_keys(
+        current_time=current_time
+    )
+    static_keys = partitions_def.secondary_dimension.partitions_def.get_partition_keys()
+    return subset.with_partition_keys(
+        f"{date_key}|{static_key}"
+        for date_key in date_keys[: len(date_keys) // 2]
+        for static_key in static_keys
+    )
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_static_keys: Sequence[int], num_keys: Sequence[int]) -> None:
+    session = ProfilingSession(
+        name="Partitions subsets",
+        experiment_settings={"num_static_keys": list(num_static_keys), "num_keys": list(num_keys)},
+    ).start()
+
+    session.log_start_message()
+
+    for n in num_static_keys:
+        for subset_class in [DefaultPartitionsSubset, None]:
+            # use a new partitions definition so that its partition keys are not cached
+            partitions_def = build_partitions_def(n)
+            empty_subset = (
+                DefaultPartitionsSubset(set()) if subset_class else partitions_def.empty_subset()
+            )
+            label = f"[{n} static keys] {type(empty_subset).__name__}"
+
+            with session.logged_execution_time(f"{label} build"):
+                subset = build_subset(partitions_def, empty_subset)
+            with session.logged_execution_time(f"{label} get_partition_key_ranges"):
+                subset.get_partition_key_ranges(partitions_def, current_time=current_time)
+            with session.logged_execution_time(f"{label} serialize"):
+                serialized = subset.serialize()
+            print(f"{label} serialized size: {len(serialized)} characters")
+            with session.logged_execution_time(f"{label} deserialize"):
+                partitions_def.deserialize_subset(serialized)
+
+    for n in num_keys:
+        static_partitions_def = StaticPartitionsDefinition([f"key_{i}" for i in range(n)])
+        keys = static_partitions_def.get_partition_keys()
+        for empty_subset in [DefaultPartitionsSubset(set()), static_partitions_def.empty_subset()]:
+            label = f"[{n} keys] {type(empty_subset).__name__}"
+
+            with session.logged_execution_time(f"{label} build"):
+                subset = empty_subset.with_partition_keys(keys[::2])
+                other_subset = empty_subset.with_partition_keys(keys[: n // 2])
+            with session.logged_execution_time(f"{label} union and intersection"):
+                subset | other_subset
+                subset & other_subset
+            with session.logged_execution_time(f"{label} get_partition_key_ranges"):
+                subset.get_partition_key_ranges(static_partitions_def)
+            with session.logged_execution_time(f"{label} serialize"):
+                serialized = subset.serialize()
+            print(f"{label} serialized size: {len(serialized)} characters")
+            with session.logged_execution_time(f"{label} deserialize"):
+                static_partitions_def.deserialize_subset(serialized)
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_static_keys, args.num_keys)
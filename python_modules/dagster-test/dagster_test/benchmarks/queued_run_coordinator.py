@@ -0,0 +1,154 @@
+# ruff: noqa: T201
+
+import argparse
+from typing import Sequence
+
+from dagster import DagsterEvent, DagsterEventType, DagsterInstance
+from dagster._core.host_representation.origin import (
+    ExternalJobOrigin,
+    ExternalRepositoryOrigin,
+    RegisteredCodeLocationOrigin,
+)
+from dagster._core.storage.dagster_run import DagsterRunStatus
+from dagster._core.storage.tags import PRIORITY_TAG
+from dagster._core.test_utils import create_run_for_test, instance_for_test
+from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import (
+    QueuedRunCoordinatorDaemon,
+)
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the time taken by `QueuedRunCoordinatorDaemon` to pick the runs to dequeue from a large run
+queue. For each queue size N, N runs are queued on a SQLite instance, 1 in 10 with a higher priority
+and 1 in 3 with a tag that is limited to a single concurrent run. The daemon then picks runs to
+dequeue for `--num-ticks` ticks, launching up to `--max-concurrent-runs` runs per tick. Every picked
+run is immediately marked as successful, so that each tick frees all run slots for the next one.
+
+Execution time is logged for queueing the runs, for the first tick (which reads the whole queue)
+and for the remaining ticks, followed by the average time per tick after the first one.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="queued_run_coordinator",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-runs",
+    type=int,
+    nargs="+",
+    default=[1000, 5000],
+    help="Set the queue sizes to benchmark.",
+)
+
+parser.add_argument(
+    "--num-ticks",
+    type=int,
+    default=20,
+    help="Set the number of daemon ticks to time for each queue size.",
+)
+
+parser.add_argument(
+    "--max-concurrent-runs",
+    type=int,
+    default=10,
+    help="Set the maximum number of concurrent runs.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def queue_runs(instance: DagsterInstance, num_runs: int) -> None:
+    external_job_origin = ExternalJobOrigin(
+        ExternalRepositoryOrigin(RegisteredCodeLocationOrigin("test_location"), "test_repo"), "foo"
+    )
+    for i in range(num_runs):
+        tags = {}
+        if i % 10 == 0:
+            tags[PRIORITY_TAG] = "1"
+        if i % 3 == 0:
+            tags["database"] = "tiny"
+        create_run_for_test(
+            instance,
+            job_name="foo",
+            status=DagsterRunStatus.QUEUED,
+            external_job_origin=external_job_origin,
+            tags=tags,
+        )
+
+
+def complete_runs(instance: DagsterInstance, run_ids: Sequence[str]) -> None:
+    for run_id in run_ids:
+        instance.handle_run_event(
+            run_id,
+            DagsterEvent(event_type_value=DagsterEventType.PIPELINE_SUCCESS.value, job_name="foo"),
+        )
+
+
+def run_tick(instance: DagsterInstance, daemon: QueuedRunCoordinatorDaemon) -> None:
+    run_queue_config = instance.run_coordinator.get_run_queue_config()  # type: ignore
+    runs = daemon._get_runs_to_dequeue(  # noqa: SLF001
+        instance, run_queue_config, fixed_iteration_time=None
+    )
+    complete_runs(instance, [run.run_id for run in runs])
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_runs: Sequence[int], num_ticks: int, max_concurrent_runs: int) -> None:
+    session = ProfilingSession(
+        name="Queued run coordinator dequeue",
+        experiment_settings={
+            "num_runs": list(num_runs),
+            "num_ticks": num_ticks,
+            "max_concurrent_runs": max_concurrent_runs,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    per_tick_times = {}
+    for n in num_runs:
+        with instance_for_test(
+            overrides={
+                "run_coordinator": {
+                    "module": "dagster._core.run_coordinator",
+                    "class": "QueuedRunCoordinator",
+                    "config": {
+                        "max_concurrent_runs": max_concurrent_runs,
+                        "tag_concurrency_limits": [
+                            {"key": "database", "value": "tiny", "limit": 1}
+                        ],
+                    },
+                }
+            }
+        ) as instance:
+            with session.logged_execution_time(f"Queue {n} runs"):
+                queue_runs(instance, n)
+
+            daemon = QueuedRunCoordinatorDaemon(interval_seconds=1)
+            with session.logged_execution_time(f"First tick with {n} queued runs"):
+                run_tick(instance, daemon)
+
+            with session.logged_execution_time(f"{num_ticks} ticks with {n} queued runs"):
+                for _ in range(num_ticks):
+                    run_tick(instance, daemon)
+
+            per_tick_times[n] = (session.entries[-1].time - session.entries[-2].time) / num_ticks
+
+    session.log_result_summary()
+
+    print()
+    for n, per_tick_time in per_tick_times.items():
+        print(f"{n} queued runs: {per_tick_time * 1000:.1f} ms/tick")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_runs, args.num_ticks, args.max_concurrent_runs)
@@ -0,0 +1,161 @@
+# ruff: noqa: T201
+
+import argparse
+from typing import Sequence
+
+from dagster import DagsterInstance
+from dagster._core.host_representation.origin import (
+    ExternalJobOrigin,
+    ExternalRepositoryOrigin,
+    RegisteredCodeLocationOrigin,
+)
+from dagster._core.storage.dagster_run import (
+    IN_PROGRESS_RUN_STATUSES,
+    DagsterRun,
+    DagsterRunStatus,
+    RunsFilter,
+)
+from dagster._core.storage.runs.schema import RunsTable, RunTagsTable
+from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+from dagster._core.storage.sql import serialize_column_value
+from dagster._core.storage.tags import PARTITION_NAME_TAG
+from dagster._core.test_utils import instance_for_test
+from dagster._core.utils import make_new_run_id
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the time taken to read runs from a large SQLite run table with `get_runs`/`get_run_records`,
+which read and deserialize the run bodies, and with `get_run_projections`, which only read indexed
+columns and the requested tags. N runs are written to the run table in bulk, 1 in 100 of them in
+progress, 1 in 20 of them failed and every run with a run config and a few tags.
+
+Execution time is logged for writing the runs and for each query pattern with both APIs:
+- the in progress runs and their concurrency-limited tags, as read by the run queue daemon;
+- the failed runs and their partitions, as read when retrying failed partitions;
+- the `--num-recent` most recent runs.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="run_projections",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-runs",
+    type=int,
+    nargs="+",
+    default=[10000, 100000],
+    help="Set the run table sizes to benchmark, e.g. 1000000.",
+)
+
+parser.add_argument(
+    "--num-recent",
+    type=int,
+    default=10000,
+    help="Set the number of recent runs to read.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+INSERT_BATCH_SIZE = 10000
+
+
+def write_runs(storage: SqlRunStorage, num_runs: int) -> None:
+    external_job_origin = ExternalJobOrigin(
+        ExternalRepositoryOrigin(RegisteredCodeLocationOrigin("test_location"), "test_repo"), "foo"
+    )
+    run_config = {"ops": {f"op_{i}": {"config": {"value": i, "name": "x" * 20}} for i in range(20)}}
+    for start in range(0, num_runs, INSERT_BATCH_SIZE):
+        run_rows = []
+        tag_rows = []
+        for i in range(start, min(start + INSERT_BATCH_SIZE, num_runs)):
+            tags = {
+                "team": f"team_{i % 7}",
+                "database": f"db_{i % 3}",
+                PARTITION_NAME_TAG: f"partition_{i}",
+            }
+            if i % 100 == 0:
+                status = DagsterRunStatus.STARTED
+            elif i % 20 == 1:
+                status = DagsterRunStatus.FAILURE
+            else:
+                status = DagsterRunStatus.SUCCESS
+            run = DagsterRun(
+                job_name="foo",
+                run_id=make_new_run_id(),
+                run_config=run_config,
+                tags=tags,
+                status=status,
+                external_job_origin=external_job_origin,
+            )
+            run_rows.append(
+                dict(
+                    run_id=run.run_id,
+                    pipeline_name=run.job_name,
+                    status=run.status.value,
+                    run_body=serialize_column_value(storage, "runs.run_body", run),
+                )
+            )
+            tag_rows.extend(
+                dict(run_id=run.run_id, key=key, value=value)
+                for key, value in run.tags_for_storage().items()
+            )
+        with storage.connect() as conn:
+            conn.execute(RunsTable.insert(), run_rows)
+            conn.execute(RunTagsTable.insert(), tag_rows)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_runs: Sequence[int], num_recent: int) -> None:
+    session = ProfilingSession(
+        name="Run projections",
+        experiment_settings={"num_runs": list(num_runs), "num_recent": num_recent},
+    ).start()
+
+    session.log_start_message()
+
+    for n in num_runs:
+        with instance_for_test() as instance:
+            storage = instance.run_storage
+            assert isinstance(storage, SqlRunStorage)
+            with session.logged_execution_time(f"Write {n} runs"):
+                write_runs(storage, n)
+
+            query_instance_patterns(session, instance, n, num_recent)
+
+    session.log_result_summary()
+
+
+def query_instance_patterns(
+    session: ProfilingSession, instance: DagsterInstance, n: int, num_recent: int
+) -> None:
+    in_progress_filter = RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES)
+    with session.logged_execution_time(f"[{n} runs] In progress runs with get_runs"):
+        instance.get_runs(in_progress_filter)
+    with session.logged_execution_time(f"[{n} runs] In progress runs with get_run_projections"):
+        instance.get_run_projections(in_progress_filter, tag_keys=["database"])
+
+    failed_filter = RunsFilter(statuses=[DagsterRunStatus.FAILURE])
+    with session.logged_execution_time(f"[{n} runs] Failed runs with get_runs"):
+        instance.get_runs(failed_filter)
+    with session.logged_execution_time(f"[{n} runs] Failed runs with get_run_projections"):
+        instance.get_run_projections(failed_filter, tag_keys=[PARTITION_NAME_TAG])
+
+    with session.logged_execution_time(f"[{n} runs] {num_recent} recent runs with get_run_records"):
+        instance.get_run_records(limit=num_recent)
+    with session.logged_execution_time(
+        f"[{n} runs] {num_recent} recent runs with get_run_projections"
+    ):
+        instance.get_run_projections(limit=num_recent, tag_keys=[])
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_runs, args.num_recent)
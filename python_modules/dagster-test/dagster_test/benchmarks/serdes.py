@@ -0,0 +1,225 @@
+# ruff: noqa: T201
+
+import argparse
+import time
+from typing import Callable, List, Mapping, NamedTuple, Sequence
+
+from dagster import AssetKey, AssetMaterialization, AssetsDefinition, Definitions, asset
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.host_representation.external_data import external_repository_data_from_def
+from dagster._core.snap import JobSnapshot, create_job_snapshot_id, snapshot_from_execution_plan
+from dagster._core.utils import make_new_run_id
+from dagster._serdes import deserialize_value, pack_value, serialize_value
+from dagster._serdes.serdes import PackableValue, serialize_value_compact
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze serialization and deserialization time for large objects that are routinely written to and
+read from storage or sent over gRPC:
+
+    ExternalRepositoryData:  snapshot of a repository containing N assets
+    JobSnapshot:             snapshot of the asset job materializing all N assets
+    ExecutionPlanSnapshot:   snapshot of the execution plan for the asset job
+    EventLogEntry:           N asset materialization events, serialized one at a time
+
+Each asset depends on up to `--fan-in` upstream assets and carries some metadata. For each object,
+`pack_value`, `serialize_value` and `deserialize_value` are timed over `--iterations` iterations.
+`serialize_value_compact` and `deserialize_value` of the compact encoding are timed as well, and the
+serialized size of both encodings is reported.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-assets",
+    type=int,
+    default=1000,
+    help="Set the number of assets in the repository.",
+)
+
+parser.add_argument(
+    "--fan-in",
+    type=int,
+    default=3,
+    help="Set the maximum number of upstream assets for each asset.",
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=5,
+    help="Set the number of times each operation is timed.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def define_assets(num_assets: int, fan_in: int) -> Sequence[AssetsDefinition]:
+    def _define_asset(i: int) -> AssetsDefinition:
+        @asset(
+            name=f"asset_{i}",
+            key_prefix=["benchmark", f"group_{i % 10}"],
+            group_name=f"group_{i % 10}",
+            deps=[
+                AssetKey(["benchmark", f"group_{j % 10}", f"asset_{j}"])
+                for j in range(max(i - fan_in, 0), i)
+            ],
+            metadata={"owner": f"team_{i % 7}", "index": i},
+            description=f"Benchmark asset {i}",
+        )
+        def _asset():
+            ...
+
+        return _asset
+
+    return [_define_asset(i) for i in range(num_assets)]
+
+
+def define_materialization_events(
+    assets: Sequence[AssetsDefinition],
+) -> Sequence[EventLogEntry]:
+    run_id = make_new_run_id()
+    return [
+        EventLogEntry(
+            error_info=None,
+            user_message="",
+            level="debug",
+            run_id=run_id,
+            timestamp=time.time(),
+            step_key=assets_def.key.path[-1],
+            job_name="__ASSET_JOB",
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_MATERIALIZATION.value,
+                "__ASSET_JOB",
+                event_specific_data=StepMaterializationData(
+                    AssetMaterialization(
+                        asset_key=assets_def.key,
+                        metadata={"row_count": 100, "path": f"/data/{assets_def.key.path[-1]}"},
+                    )
+                ),
+            ),
+        )
+        for assets_def in assets
+    ]
+
+
+def define_benchmark_objects(
+    num_assets: int, fan_in: int
+) -> Mapping[str, Sequence[PackableValue]]:
+    assets = define_assets(num_assets, fan_in)
+    defs = Definitions(assets=assets)
+    repository_def = defs.get_repository_def()
+    job_def = defs.get_implicit_global_asset_job_def()
+    job_snapshot = JobSnapshot.from_job_def(job_def)
+    execution_plan_snapshot = snapshot_from_execution_plan(
+        create_execution_plan(job_def), create_job_snapshot_id(job_snapshot)
+    )
+
+    return {
+        "ExternalRepositoryData": [external_repository_data_from_def(repository_def)],
+        "JobSnapshot": [job_snapshot],
+        "ExecutionPlanSnapshot": [execution_plan_snapshot],
+        "EventLogEntry": define_materialization_events(assets),
+    }
+
+
+class BenchmarkResult(NamedTuple):
+    name: str
+    pack_time: float
+    serialize_time: float
+    deserialize_time: float
+    size: int
+    compact_serialize_time: float
+    compact_deserialize_time: float
+    compact_size: int
+
+
+def time_operation(fn: Callable[[], object], iterations: int) -> float:
+    times: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, fan_in: int, iterations: int) -> None:
+    session = ProfilingSession(
+        name="Serdes",
+        experiment_settings={
+            "num_assets": num_assets,
+            "fan_in": fan_in,
+            "iterations": iterations,
+        },
+    ).start()
+
+    session.log_start_message()
+
+    with session.logged_execution_time("Build benchmark objects"):
+        objects = define_benchmark_objects(num_assets, fan_in)
+
+    results: List[BenchmarkResult] = []
+    for name, values in objects.items():
+        with session.logged_execution_time(f"Benchmark {name}"):
+            serialized = [serialize_value(value) for value in values]
+            compact_serialized = [serialize_value_compact(value) for value in values]
+            results.append(
+                BenchmarkResult(
+                    name=name,
+                    pack_time=time_operation(
+                        lambda values=values: [pack_value(v) for v in values], iterations
+                    ),
+                    serialize_time=time_operation(
+                        lambda values=values: [serialize_value(v) for v in values], iterations
+                    ),
+                    deserialize_time=time_operation(
+                        lambda serialized=serialized: [deserialize_value(s) for s in serialized],
+                        iterations,
+                    ),
+                    size=sum(len(s) for s in serialized),
+                    compact_serialize_time=time_operation(
+                        lambda values=values: [serialize_value_compact(v) for v in values],
+                        iterations,
+                    ),
+                    compact_deserialize_time=time_operation(
+                        lambda serialized=compact_serialized: [
+                            deserialize_value(s) for s in serialized
+                        ],
+                        iterations,
+                    ),
+                    compact_size=sum(len(s) for s in compact_serialized),
+                )
+            )
+
+    session.log_result_summary()
+
+    print()
+    print("Best time over all iterations (seconds):")
+    for result in results:
+        print(
+            f"{result.name}: pack {result.pack_time:.4f}, serialize {result.serialize_time:.4f},"
+            f" deserialize {result.deserialize_time:.4f}, serialized size {result.size} bytes"
+        )
+        print(
+            f"{result.name} (compact): serialize {result.compact_serialize_time:.4f}, deserialize"
+            f" {result.compact_deserialize_time:.4f}, serialized size {result.compact_size} bytes"
+            f" ({result.compact_size / result.size:.1%} of JSON)"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.fan_in, args.iterations)
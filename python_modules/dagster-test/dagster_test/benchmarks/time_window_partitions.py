@@ -0,0 +1,106 @@
+# ruff: noqa: T201
+
+import argparse
+from typing import Sequence
+
+from dagster import (
+    DailyPartitionsDefinition,
+    HourlyPartitionsDefinition,
+    TimeWindowPartitionsDefinition,
+)
+from dagster._seven.compat.pendulum import create_pendulum_time
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Analyze the time taken by `TimeWindowPartitionsDefinition` to compute the partition keys, the
+number of partitions and the time windows of partition keys, for hourly partitions over
+`--num-years` years in each of the `--timezones`, and for daily partitions in the same timezones.
+
+Execution time is logged for `get_partition_keys`, `get_num_partitions`,
+`time_windows_for_partition_keys` of every partition key, and for building a subset of every other
+partition key and serializing it, which merges the time windows of the partition keys.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="time_window_partitions",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-years",
+    type=int,
+    default=5,
+    help="Set the number of years of partitions.",
+)
+
+parser.add_argument(
+    "--timezones",
+    type=str,
+    nargs="+",
+    default=["UTC", "America/Los_Angeles"],
+    help="Set the timezones of the partitions definitions to benchmark.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+current_time = create_pendulum_time(2024, 1, 1)
+
+
+def build_partitions_def(
+    cadence: str, num_years: int, timezone: str
+) -> TimeWindowPartitionsDefinition:
+    start_date = f"{2024 - num_years}-01-01"
+    if cadence == "hourly":
+        return HourlyPartitionsDefinition(start_date=f"{start_date}-00:00", timezone=timezone)
+    else:
+        return DailyPartitionsDefinition(start_date=start_date, timezone=timezone)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_years: int, timezones: Sequence[str]) -> None:
+    session = ProfilingSession(
+        name="Time window partitions",
+        experiment_settings={"num_years": num_years, "timezones": list(timezones)},
+    ).start()
+
+    session.log_start_message()
+
+    for timezone in timezones:
+        for cadence in ["hourly", "daily"]:
+            partition_keys = build_partitions_def(cadence, num_years, timezone).get_partition_keys(
+                current_time=current_time
+            )
+            label = f"[{len(partition_keys)} {cadence} {timezone}]"
+
+            # use a new partitions definition for each operation so that cached results of the
+            # previous operations are not used
+            with session.logged_execution_time(f"{label} get_partition_keys"):
+                build_partitions_def(cadence, num_years, timezone).get_partition_keys(
+                    current_time=current_time
+                )
+            with session.logged_execution_time(f"{label} get_num_partitions"):
+                build_partitions_def(cadence, num_years, timezone).get_num_partitions(
+                    current_time=current_time
+                )
+            with session.logged_execution_time(f"{label} time_windows_for_partition_keys"):
+                build_partitions_def(cadence, num_years, timezone).time_windows_for_partition_keys(
+                    frozenset(partition_keys)
+                )
+            with session.logged_execution_time(f"{label} build and serialize a subset"):
+                build_partitions_def(
+                    cadence, num_years, timezone
+                ).empty_subset().with_partition_keys(partition_keys[::2]).serialize()
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_years, args.timezones)
@@ -1,4 +1,9 @@
-from typing import TYPE_CHECKING, Mapping
+import gzip
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Mapping, Optional
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
@@ -7,21 +12,141 @@
     ExternalRepositoryErrorData,
 )
 from dagster._serdes import deserialize_value
+from dagster._serdes.utils import hash_str
+from dagster._utils.log import get_dagster_logger
 
 if TYPE_CHECKING:
     from dagster._core.host_representation import CodeLocation
     from dagster._grpc.client import DagsterGrpcClient
 
+# Number of deserialized repositories kept in memory, keyed by snapshot id
+EXTERNAL_REPOSITORY_DATA_CACHE_SIZE = 128
+
+# Number of serialized repositories kept on disk when DAGSTER_REPOSITORY_SNAPSHOT_CACHE_DIR is set
+EXTERNAL_REPOSITORY_DATA_DISK_CACHE_SIZE = 256
+
+_external_repository_data_cache: "OrderedDict[str, ExternalRepositoryData]" = OrderedDict()
+_external_repository_data_cache_lock = threading.Lock()
+
+
+def repository_snapshot_cache_dir() -> Optional[str]:
+    return os.getenv("DAGSTER_REPOSITORY_SNAPSHOT_CACHE_DIR")
+
+
+def _snapshot_cache_path(cache_dir: str, snapshot_id: str) -> str:
+    return os.path.join(cache_dir, f"{snapshot_id}.json.gz")
+
+
+def _read_serialized_snapshot(snapshot_id: str) -> Optional[str]:
+    cache_dir = repository_snapshot_cache_dir()
+    if not cache_dir:
+        return None
+
+    path = _snapshot_cache_path(cache_dir, snapshot_id)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            serialized = f.read()
+        # bump the file so that it is evicted last
+        os.utime(path)
+    except (OSError, EOFError):
+        return None
+
+    # ignore files that are truncated or were written by something else
+    return serialized if hash_str(serialized) == snapshot_id else None
+
+
+def _write_serialized_snapshot(snapshot_id: str, serialized: str) -> None:
+    cache_dir = repository_snapshot_cache_dir()
+    if not cache_dir:
+        return
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+                f.write(serialized)
+            os.replace(tmp_path, _snapshot_cache_path(cache_dir, snapshot_id))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        cached_paths = [
+            os.path.join(cache_dir, name)
+            for name in os.listdir(cache_dir)
+            if name.endswith(".json.gz")
+        ]
+        num_evicted = len(cached_paths) - EXTERNAL_REPOSITORY_DATA_DISK_CACHE_SIZE
+        if num_evicted > 0:
+            cached_paths.sort(key=os.path.getmtime)
+            for path in cached_paths[:num_evicted]:
+                os.unlink(path)
+    except OSError:
+        # the cache is an optimization, so failing to write to it is not an error
+        get_dagster_logger().warning(
+            f"Could not write repository snapshot to {cache_dir}", exc_info=True
+        )
+
+
+def get_cached_external_repository_data(snapshot_id: str) -> Optional[ExternalRepositoryData]:
+    """Returns the ExternalRepositoryData with the given snapshot id if it was previously
+    fetched by this process, or was written to DAGSTER_REPOSITORY_SNAPSHOT_CACHE_DIR.
+    """
+    with _external_repository_data_cache_lock:
+        if snapshot_id in _external_repository_data_cache:
+            _external_repository_data_cache.move_to_end(snapshot_id)
+            return _external_repository_data_cache[snapshot_id]
+
+    serialized = _read_serialized_snapshot(snapshot_id)
+    if serialized is None:
+        return None
+
+    repository_data = deserialize_value(serialized, ExternalRepositoryData)
+    _cache_external_repository_data(snapshot_id, repository_data)
+    return repository_data
+
+
+def _cache_external_repository_data(
+    snapshot_id: str, repository_data: ExternalRepositoryData
+) -> None:
+    with _external_repository_data_cache_lock:
+        _external_repository_data_cache[snapshot_id] = repository_data
+        _external_repository_data_cache.move_to_end(snapshot_id)
+        while len(_external_repository_data_cache) > EXTERNAL_REPOSITORY_DATA_CACHE_SIZE:
+            _external_repository_data_cache.popitem(last=False)
+
+
+def clear_external_repository_data_cache() -> None:
+    with _external_repository_data_cache_lock:
+        _external_repository_data_cache.clear()
+
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient",
+    code_location: "CodeLocation",
+    repository_snapshot_ids: Optional[Mapping[str, str]] = None,
 ) -> Mapping[str, ExternalRepositoryData]:
+    """Fetches the ExternalRepositoryData of each repository in the code location.
+
+    `repository_snapshot_ids` are the snapshot ids that the server reported in its
+    ListRepositoriesResponse. Repositories whose snapshot is already cached are not fetched again.
+    """
     from dagster._core.host_representation import CodeLocation, ExternalRepositoryOrigin
 
     check.inst_param(code_location, "code_location", CodeLocation)
+    repository_snapshot_ids = check.opt_mapping_param(
+        repository_snapshot_ids, "repository_snapshot_ids", key_type=str, value_type=str
+    )
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
+        snapshot_id = repository_snapshot_ids.get(repository_name)
+        if snapshot_id:
+            cached_data = get_cached_external_repository_data(snapshot_id)
+            if cached_data is not None:
+                repo_datas[repository_name] = cached_data
+                continue
+
         external_repository_chunks = list(
             api_client.streaming_external_repository(
                 external_repository_origin=ExternalRepositoryOrigin(
@@ -31,18 +156,22 @@ def sync_get_streaming_external_repositories_data_grpc(
             )
         )
 
+        serialized = "".join(
+            [chunk["serialized_external_repository_chunk"] for chunk in external_repository_chunks]
+        )
         result = deserialize_value(
-            "".join(
-                [
-                    chunk["serialized_external_repository_chunk"]
-                    for chunk in external_repository_chunks
-                ]
-            ),
+            serialized,
             (ExternalRepositoryData, ExternalRepositoryErrorData),
         )
 
         if isinstance(result, ExternalRepositoryErrorData):
             raise DagsterUserCodeProcessError.from_error_info(result.error)
 
+        # only cache the data under the snapshot id if it is the data that the id was computed
+        # from, e.g. the server may have been reloaded between the two calls
+        if snapshot_id and hash_str(serialized) == snapshot_id:
+            _cache_external_repository_data(snapshot_id, result)
+            _write_serialized_snapshot(snapshot_id, serialized)
+
         repo_datas[repository_name] = result
     return repo_datas
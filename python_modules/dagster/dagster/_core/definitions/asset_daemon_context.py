@@ -1,9 +1,11 @@
 import datetime
 import itertools
+import json
 import logging
 import os
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     TYPE_CHECKING,
     AbstractSet,
@@ -11,6 +13,7 @@
     Dict,
     FrozenSet,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -30,7 +33,13 @@
 from dagster._core.definitions.time_window_partitions import (
     get_time_partitions_def,
 )
+from dagster._core.event_api import EventRecordsFilter
+from dagster._core.events import DagsterEventType
 from dagster._core.instance import DynamicPartitionsStore
+from dagster._core.storage.dagster_run import FINISHED_STATUSES, RunsFilter
+from dagster._core.utils import InheritContextThreadPoolExecutor
+from dagster._serdes.utils import hash_str
+from dagster._utils.schedules import cron_string_iterator
 
 from ... import PartitionKeyRange
 from ..storage.tags import ASSET_PARTITION_RANGE_END_TAG, ASSET_PARTITION_RANGE_START_TAG
@@ -40,7 +49,18 @@
 )
 from .asset_daemon_cursor import AssetDaemonCursor
 from .asset_graph import AssetGraph
-from .auto_materialize_rule import AutoMaterializeRule
+from .auto_materialize_rule import (
+    AutoMaterializeRule,
+    MaterializeOnCronRule,
+    MaterializeOnMissingRule,
+    MaterializeOnParentUpdatedRule,
+    MaterializeOnRequiredForFreshnessRule,
+    SkipOnBackfillInProgressRule,
+    SkipOnNotAllParentsUpdatedRule,
+    SkipOnParentMissingRule,
+    SkipOnParentOutdatedRule,
+    SkipOnRequiredButNonexistentParentsRule,
+)
 from .backfill_policy import BackfillPolicy, BackfillPolicyType
 from .freshness_based_auto_materialize import get_expected_data_time_for_asset_key
 from .partition import PartitionsDefinition, ScheduleType
@@ -80,6 +100,71 @@ def get_implicit_auto_materialize_policy(
     return auto_materialize_policy
 
 
+# Rules whose result for an asset can only change if the asset or one of its ancestors was updated,
+# if the partitions of the asset or its parents changed, or if the evaluation of an upstream asset
+# changed. Assets with other rules are evaluated on every tick when evaluating incrementally.
+INCREMENTAL_EVALUATION_RULE_TYPES = (
+    MaterializeOnParentUpdatedRule,
+    MaterializeOnMissingRule,
+    MaterializeOnRequiredForFreshnessRule,
+    SkipOnParentOutdatedRule,
+    SkipOnParentMissingRule,
+    SkipOnNotAllParentsUpdatedRule,
+    SkipOnRequiredButNonexistentParentsRule,
+    SkipOnBackfillInProgressRule,
+)
+
+# If more than this many events or finished runs of a single type were stored since the previous
+# tick, all assets are evaluated rather than computing which ones are affected
+MAX_INCREMENTAL_EVALUATION_CHANGED_RECORDS = 10000
+
+# Runs that finished up to this long before the previous tick are read again, to allow for clock
+# skew between the daemon and the processes that update the run storage
+INCREMENTAL_EVALUATION_RUN_LOOKBACK_SECONDS = 60
+
+
+def get_asset_graph_fingerprint(
+    asset_graph: AssetGraph, dynamic_partitions_store: DynamicPartitionsStore
+) -> str:
+    """Returns a hash of the keys, dependencies, partitions and partition mappings of the assets in
+    the asset graph. The partition keys of dynamic partitions definitions are included, so adding
+    or removing a dynamic partition changes the fingerprint.
+    """
+    partitions_def_ids: Dict[PartitionsDefinition, str] = {}
+
+    def _partitions_def_id(asset_key: AssetKey) -> Optional[str]:
+        partitions_def = asset_graph.get_partitions_def(asset_key)
+        if partitions_def is None:
+            return None
+        if partitions_def not in partitions_def_ids:
+            partitions_def_ids[partitions_def] = partitions_def.get_serializable_unique_identifier(
+                dynamic_partitions_store
+            )
+        return partitions_def_ids[partitions_def]
+
+    asset_entries = []
+    for asset_key in sorted(asset_graph.all_asset_keys, key=lambda key: key.to_string()):
+        parent_entries = [
+            [
+                parent_key.to_string(),
+                repr(asset_graph.get_partition_mapping(asset_key, parent_key)),
+            ]
+            for parent_key in sorted(
+                asset_graph.get_parents(asset_key), key=lambda key: key.to_string()
+            )
+        ]
+        asset_entries.append(
+            [asset_key.to_string(), _partitions_def_id(asset_key), parent_entries]
+        )
+    return hash_str(json.dumps(asset_entries))
+
+
+def _has_true_subset(evaluation: AssetConditionEvaluation) -> bool:
+    return evaluation.true_subset.size > 0 or any(
+        _has_true_subset(child_evaluation) for child_evaluation in evaluation.child_evaluations
+    )
+
+
 class AssetDaemonContext:
     def __init__(
         self,
@@ -94,6 +179,8 @@ def __init__(
         respect_materialization_data_versions: bool,
         logger: logging.Logger,
         evaluation_time: Optional[datetime.datetime] = None,
+        num_evaluation_workers: Optional[int] = None,
+        incremental_evaluation: bool = False,
     ):
         from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
@@ -109,6 +196,15 @@ def __init__(
         self._auto_observe_asset_keys = auto_observe_asset_keys or set()
         self._respect_materialization_data_versions = respect_materialization_data_versions
         self._logger = logger
+        self._num_evaluation_workers = check.opt_int_param(
+            num_evaluation_workers, "num_evaluation_workers"
+        )
+        self._incremental_evaluation = check.bool_param(
+            incremental_evaluation, "incremental_evaluation"
+        )
+        self._latest_storage_id: Optional[int] = None
+        self._asset_graph_fingerprint: Optional[str] = None
+        self._num_skipped_assets = 0
 
         self._verbose_log_fn = (
             self._logger.info if os.getenv("ASSET_DAEMON_VERBOSE_LOGS") else self._logger.debug
@@ -161,12 +257,26 @@ def respect_materialization_data_versions(self) -> bool:
     def auto_materialize_run_tags(self) -> Mapping[str, str]:
         return self._materialize_run_tags or {}
 
+    @property
+    def num_skipped_assets(self) -> int:
+        """The number of assets whose previous evaluation was reused on this tick."""
+        return self._num_skipped_assets
+
     def prefetch(self) -> None:
         """Pre-populate the cached values here to avoid situations in which the new latest_storage_id
         value is calculated using information that comes in after the set of asset partitions with
         new parent materializations is calculated, as this can result in materializations being
         ignored if they happen between the two calculations.
         """
+        if self._incremental_evaluation:
+            # read before the asset records, so that events stored in between are treated as new
+            # on the next tick
+            self._latest_storage_id = (
+                self.instance_queryer.instance.event_log_storage.get_maximum_record_id() or 0
+            )
+            self._asset_graph_fingerprint = get_asset_graph_fingerprint(
+                self.asset_graph, self.instance_queryer
+            )
         self._logger.info(
             f"Prefetching asset records for {len(self.asset_records_to_prefetch)} records."
         )
@@ -216,76 +326,308 @@ def evaluate_asset(
         )
         return AssetConditionEvaluationState.create(context, result), expected_data_time
 
+    def _get_asset_keys_updated_since_cursor(self) -> Optional[AbstractSet[AssetKey]]:
+        """Returns the keys of the assets that were updated, planned or observed, or whose runs
+        finished, since the previous tick. Returns None if there are too many changes to tell.
+        """
+        instance = self.instance_queryer.instance
+        updated_asset_keys: Set[AssetKey] = set()
+        for event_type in [
+            DagsterEventType.ASSET_MATERIALIZATION,
+            DagsterEventType.ASSET_OBSERVATION,
+            DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+        ]:
+            records = instance.get_event_records(
+                EventRecordsFilter(
+                    event_type=event_type, after_cursor=self.cursor.latest_storage_id
+                ),
+                limit=MAX_INCREMENTAL_EVALUATION_CHANGED_RECORDS + 1,
+            )
+            if len(records) > MAX_INCREMENTAL_EVALUATION_CHANGED_RECORDS:
+                return None
+            updated_asset_keys.update(record.asset_key for record in records if record.asset_key)
+
+        # failed and canceled runs change the status of the partitions that they planned, and are
+        # not reflected in the asset events above. the run storage is queried rather than the
+        # event log, as run events are not indexed by storage id in every event log storage
+        previous_tick_timestamps = [
+            evaluation_state.previous_tick_evaluation_timestamp
+            for evaluation_state in self.cursor.previous_evaluation_state
+            if evaluation_state.previous_tick_evaluation_timestamp is not None
+        ]
+        if not previous_tick_timestamps:
+            return None
+        run_records = instance.get_run_records(
+            RunsFilter(
+                statuses=FINISHED_STATUSES,
+                updated_after=pendulum.from_timestamp(max(previous_tick_timestamps), tz="UTC")
+                - datetime.timedelta(seconds=INCREMENTAL_EVALUATION_RUN_LOOKBACK_SECONDS),
+            ),
+            limit=MAX_INCREMENTAL_EVALUATION_CHANGED_RECORDS + 1,
+        )
+        if len(run_records) > MAX_INCREMENTAL_EVALUATION_CHANGED_RECORDS:
+            return None
+        for run_record in run_records:
+            updated_asset_keys.update(
+                self.instance_queryer.get_planned_materializations_for_run(
+                    run_record.dagster_run.run_id
+                )
+            )
+
+        return updated_asset_keys
+
+    def _requires_evaluation(self, asset_key: AssetKey) -> bool:
+        """Returns True if the evaluation of the asset may differ from its previous evaluation even
+        if none of its ancestors were updated.
+        """
+        evaluation_state = self.cursor.get_previous_evaluation_state(asset_key)
+        auto_materialize_policy = self.asset_graph.auto_materialize_policies_by_key.get(asset_key)
+        if (
+            evaluation_state is None
+            or evaluation_state.previous_tick_evaluation_timestamp is None
+            or auto_materialize_policy is None
+        ):
+            return True
+
+        if (
+            auto_materialize_policy.to_asset_condition().unique_id
+            != evaluation_state.previous_evaluation.condition_snapshot.unique_id
+        ):
+            return True
+
+        # results that were true on the previous tick, e.g. requested partitions, may be
+        # discarded or handled on this tick
+        if _has_true_subset(evaluation_state.previous_evaluation):
+            return True
+
+        # whether an asset is required for freshness depends on the current time
+        if self.asset_graph.get_downstream_freshness_policies(asset_key=asset_key):
+            return True
+
+        previous_timestamp = evaluation_state.previous_tick_evaluation_timestamp
+        evaluation_time = self.instance_queryer.evaluation_time
+        for rule in auto_materialize_policy.rules:
+            if isinstance(rule, MaterializeOnCronRule):
+                next_tick = next(
+                    cron_string_iterator(
+                        start_timestamp=previous_timestamp,
+                        cron_string=rule.cron_schedule,
+                        execution_timezone=rule.timezone,
+                    )
+                )
+                if next_tick <= evaluation_time:
+                    return True
+            elif not isinstance(rule, INCREMENTAL_EVALUATION_RULE_TYPES):
+                return True
+
+        # new time partitions of the asset or its parents
+        previous_time = pendulum.from_timestamp(previous_timestamp, tz="UTC")
+        for key in itertools.chain([asset_key], self.asset_graph.get_parents(asset_key)):
+            time_partitions_def = get_time_partitions_def(self.asset_graph.get_partitions_def(key))
+            if time_partitions_def is not None and time_partitions_def.get_last_partition_window(
+                current_time=previous_time
+            ) != time_partitions_def.get_last_partition_window(current_time=evaluation_time):
+                return True
+
+        return False
+
+    def get_asset_keys_to_evaluate(self) -> Optional[AbstractSet[AssetKey]]:
+        """Returns the auto-materialize asset keys whose evaluation may differ from their evaluation
+        on the previous tick, or None if all assets should be evaluated.
+
+        Assets that were updated since the previous tick, or that must be evaluated on every tick
+        (see _requires_evaluation), are dirty, and so are all of their descendants.
+        """
+        if (
+            not self._incremental_evaluation
+            or self.cursor.latest_storage_id is None
+            or self.cursor.asset_graph_fingerprint != self._asset_graph_fingerprint
+        ):
+            return None
+
+        dirty_asset_keys = self._get_asset_keys_updated_since_cursor()
+        if dirty_asset_keys is None:
+            return None
+        dirty_asset_keys.update(
+            asset_key
+            for asset_key in self.auto_materialize_asset_keys
+            if self._requires_evaluation(asset_key)
+        )
+
+        to_visit = list(dirty_asset_keys)
+        while to_visit:
+            asset_key = to_visit.pop()
+            for neighbor_key in itertools.chain(
+                self.asset_graph.get_children(asset_key),
+                self.asset_graph.get_required_multi_asset_keys(asset_key),
+            ):
+                if neighbor_key not in dirty_asset_keys:
+                    dirty_asset_keys.add(neighbor_key)
+                    to_visit.append(neighbor_key)
+
+        return dirty_asset_keys & self.auto_materialize_asset_keys
+
+    def _evaluate_assets_in_level(
+        self,
+        asset_keys: Sequence[AssetKey],
+        executor: Optional[ThreadPoolExecutor],
+        evaluation_state_by_key: Mapping[AssetKey, AssetConditionEvaluationState],
+        expected_data_time_mapping: Mapping[AssetKey, Optional[datetime.datetime]],
+        num_checked_assets: int,
+    ) -> Iterator[
+        Tuple[AssetKey, AssetConditionEvaluationState, Optional[datetime.datetime], float]
+    ]:
+        """Evaluates a set of assets from the same level of the asset graph, yielding the evaluation
+        state, expected data time and evaluation duration of each asset in the order of asset_keys.
+
+        Assets in the same level do not depend on each other, so they only read the evaluation
+        state of assets from previous levels. If an executor is provided, all of the assets are
+        submitted to it at once, and the mappings must not be modified until every result has been
+        yielded.
+        """
+        num_auto_materialize_asset_keys = len(self.auto_materialize_asset_keys)
+
+        def _evaluate(
+            asset_key: AssetKey,
+        ) -> Tuple[AssetConditionEvaluationState, Optional[datetime.datetime], float]:
+            start_time = time.time()
+            evaluation_state, expected_data_time = self.evaluate_asset(
+                asset_key, evaluation_state_by_key, expected_data_time_mapping
+            )
+            return evaluation_state, expected_data_time, time.time() - start_time
+
+        if executor is None or len(asset_keys) <= 1:
+            for asset_key in asset_keys:
+                num_checked_assets = num_checked_assets + 1
+                self._verbose_log_fn(
+                    "Evaluating asset"
+                    f" {asset_key.to_user_string()} ({num_checked_assets}/{num_auto_materialize_asset_keys})"
+                )
+                yield (asset_key, *_evaluate(asset_key))
+            return
+
+        futures = []
+        for asset_key in asset_keys:
+            num_checked_assets = num_checked_assets + 1
+            self._verbose_log_fn(
+                "Evaluating asset"
+                f" {asset_key.to_user_string()} ({num_checked_assets}/{num_auto_materialize_asset_keys})"
+            )
+            futures.append(executor.submit(_evaluate, asset_key))
+        results = [future.result() for future in futures]
+        for asset_key, result in zip(asset_keys, results):
+            yield (asset_key, *result)
+
     def get_asset_condition_evaluations(
         self,
     ) -> Tuple[Sequence[AssetConditionEvaluationState], AbstractSet[AssetKeyPartitionKey]]:
         """Returns a mapping from asset key to the AutoMaterializeAssetEvaluation for that key, a
         sequence of new per-asset cursors, and the set of all asset partitions that should be
         materialized or discarded this tick.
+
+        If num_evaluation_workers is set, the assets within each level of the asset graph are
+        evaluated in parallel on a thread pool. The results of each level are then merged in the
+        same order as a serial evaluation, so both produce the same output.
+
+        If incremental_evaluation is set, assets that are not returned by get_asset_keys_to_evaluate
+        reuse their evaluation state from the previous tick.
         """
         evaluation_state_by_key: Dict[AssetKey, AssetConditionEvaluationState] = {}
         expected_data_time_mapping: Dict[AssetKey, Optional[datetime.datetime]] = defaultdict()
         to_request: Set[AssetKeyPartitionKey] = set()
 
         num_checked_assets = 0
-        num_auto_materialize_asset_keys = len(self.auto_materialize_asset_keys)
-
-        for asset_key in itertools.chain(*self.asset_graph.toposort_asset_keys()):
-            # an asset may have already been visited if it was part of a non-subsettable multi-asset
-            if asset_key not in self.auto_materialize_asset_keys:
-                continue
 
-            num_checked_assets = num_checked_assets + 1
-            start_time = time.time()
-            self._verbose_log_fn(
-                "Evaluating asset"
-                f" {asset_key.to_user_string()} ({num_checked_assets}/{num_auto_materialize_asset_keys})"
+        asset_keys_to_evaluate = self.get_asset_keys_to_evaluate()
+        if asset_keys_to_evaluate is not None:
+            self._num_skipped_assets = len(self.auto_materialize_asset_keys) - len(
+                asset_keys_to_evaluate
             )
-
-            (evaluation_state, expected_data_time) = self.evaluate_asset(
-                asset_key, evaluation_state_by_key, expected_data_time_mapping
+            self._logger.info(
+                f"Skipping evaluation of {self._num_skipped_assets} of"
+                f" {len(self.auto_materialize_asset_keys)} assets with no changes since the"
+                " previous tick."
             )
 
-            num_requested = evaluation_state.true_subset.size
-            log_fn = self._logger.info if num_requested > 0 else self._logger.debug
-
-            to_request_asset_partitions = evaluation_state.true_subset.asset_partitions
-            to_request_str = ",".join(
-                [(ap.partition_key or "No partition") for ap in to_request_asset_partitions]
+        executor = (
+            InheritContextThreadPoolExecutor(
+                max_workers=self._num_evaluation_workers,
+                thread_name_prefix="asset_daemon_evaluation_worker",
             )
-            to_request |= to_request_asset_partitions
+            if self._num_evaluation_workers
+            else None
+        )
+        try:
+            for level in self.asset_graph.toposort_asset_keys():
+                asset_keys = [key for key in level if key in self.auto_materialize_asset_keys]
+                if asset_keys_to_evaluate is not None:
+                    for asset_key in asset_keys:
+                        if asset_key not in asset_keys_to_evaluate:
+                            evaluation_state_by_key[asset_key] = check.not_none(
+                                self.cursor.get_previous_evaluation_state(asset_key)
+                            )
+                            expected_data_time_mapping[asset_key] = None
+                    asset_keys = [key for key in asset_keys if key in asset_keys_to_evaluate]
+                for (
+                    asset_key,
+                    evaluation_state,
+                    expected_data_time,
+                    duration,
+                ) in self._evaluate_assets_in_level(
+                    asset_keys,
+                    executor,
+                    evaluation_state_by_key,
+                    expected_data_time_mapping,
+                    num_checked_assets,
+                ):
+                    num_checked_assets = num_checked_assets + 1
+                    num_requested = evaluation_state.true_subset.size
+                    log_fn = self._logger.info if num_requested > 0 else self._logger.debug
+
+                    to_request_asset_partitions = evaluation_state.true_subset.asset_partitions
+                    to_request_str = ",".join(
+                        [(ap.partition_key or "No partition") for ap in to_request_asset_partitions]
+                    )
+                    to_request |= to_request_asset_partitions
 
-            log_fn(
-                f"Asset {asset_key.to_user_string()} evaluation result: {num_requested}"
-                f" requested ({to_request_str}) ({format(time.time()-start_time, '.3f')} seconds)"
-            )
+                    log_fn(
+                        f"Asset {asset_key.to_user_string()} evaluation result: {num_requested}"
+                        f" requested ({to_request_str}) ({format(duration, '.3f')} seconds)"
+                    )
 
-            evaluation_state_by_key[asset_key] = evaluation_state
-            expected_data_time_mapping[asset_key] = expected_data_time
-
-            # if we need to materialize any partitions of a non-subsettable multi-asset, we need to
-            # materialize all of them
-            if num_requested > 0:
-                for neighbor_key in self.asset_graph.get_required_multi_asset_keys(asset_key):
-                    expected_data_time_mapping[neighbor_key] = expected_data_time
-
-                    # make sure that the true_subset of the neighbor is accurate -- when it was
-                    # evaluated it may have had a different requested AssetSubset. however, because
-                    # all these neighbors must be executed as a unit, we need to union together
-                    # the subset of all required neighbors
-                    if neighbor_key in evaluation_state_by_key:
-                        neighbor_evaluation_state = evaluation_state_by_key[neighbor_key]
-                        evaluation_state_by_key[neighbor_key] = neighbor_evaluation_state._replace(
-                            previous_evaluation=neighbor_evaluation_state.previous_evaluation._replace(
-                                true_subset=neighbor_evaluation_state.true_subset._replace(
-                                    asset_key=neighbor_key
+                    evaluation_state_by_key[asset_key] = evaluation_state
+                    expected_data_time_mapping[asset_key] = expected_data_time
+
+                    # if we need to materialize any partitions of a non-subsettable multi-asset, we
+                    # need to materialize all of them
+                    if num_requested > 0:
+                        for neighbor_key in self.asset_graph.get_required_multi_asset_keys(
+                            asset_key
+                        ):
+                            expected_data_time_mapping[neighbor_key] = expected_data_time
+
+                            # make sure that the true_subset of the neighbor is accurate -- when it
+                            # was evaluated it may have had a different requested AssetSubset.
+                            # however, because all these neighbors must be executed as a unit, we
+                            # need to union together the subset of all required neighbors
+                            if neighbor_key in evaluation_state_by_key:
+                                neighbor_evaluation_state = evaluation_state_by_key[neighbor_key]
+                                evaluation_state_by_key[
+                                    neighbor_key
+                                ] = neighbor_evaluation_state._replace(
+                                    previous_evaluation=neighbor_evaluation_state.previous_evaluation._replace(
+                                        true_subset=neighbor_evaluation_state.true_subset._replace(
+                                            asset_key=neighbor_key
+                                        )
+                                    )
                                 )
-                            )
-                        )
-                    to_request |= {
-                        ap._replace(asset_key=neighbor_key)
-                        for ap in evaluation_state.true_subset.asset_partitions
-                    }
+                            to_request |= {
+                                ap._replace(asset_key=neighbor_key)
+                                for ap in evaluation_state.true_subset.asset_partitions
+                            }
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
 
         return (list(evaluation_state_by_key.values()), to_request)
 
@@ -327,6 +669,8 @@ def evaluate(
                     for asset_key in cast(Sequence[AssetKey], run_request.asset_selection)
                 ],
                 evaluation_timestamp=self.instance_queryer.evaluation_time.timestamp(),
+                latest_storage_id=self._latest_storage_id,
+                asset_graph_fingerprint=self._asset_graph_fingerprint,
             ),
             # only record evaluation results where something changed
             [
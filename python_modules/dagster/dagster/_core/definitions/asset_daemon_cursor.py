@@ -73,6 +73,10 @@ class AssetDaemonCursor(NamedTuple):
         evaluation_id (int): The ID of the evaluation that produced this cursor.
         previous_evaluation_state (Sequence[AssetConditionEvaluationInfo]): The evaluation info
             recorded for each asset on the previous tick.
+        latest_storage_id (Optional[int]): The latest event log storage ID at the start of the
+            tick, if assets were evaluated incrementally.
+        asset_graph_fingerprint (Optional[str]): A hash of the structure of the asset graph that
+            was evaluated, if assets were evaluated incrementally.
     """
 
     evaluation_id: int
@@ -80,6 +84,9 @@ class AssetDaemonCursor(NamedTuple):
 
     last_observe_request_timestamp_by_asset_key: Mapping[AssetKey, float]
 
+    latest_storage_id: Optional[int] = None
+    asset_graph_fingerprint: Optional[str] = None
+
     @staticmethod
     def empty(evaluation_id: int = 0) -> "AssetDaemonCursor":
         return AssetDaemonCursor(
@@ -118,10 +125,14 @@ def with_updates(
         evaluation_timestamp: float,
         newly_observe_requested_asset_keys: Sequence[AssetKey],
         evaluation_state: Sequence["AssetConditionEvaluationState"],
+        latest_storage_id: Optional[int] = None,
+        asset_graph_fingerprint: Optional[str] = None,
     ) -> "AssetDaemonCursor":
         return self._replace(
             evaluation_id=evaluation_id,
             previous_evaluation_state=evaluation_state,
+            latest_storage_id=latest_storage_id,
+            asset_graph_fingerprint=asset_graph_fingerprint,
             last_observe_request_timestamp_by_asset_key={
                 **self.last_observe_request_timestamp_by_asset_key,
                 **{
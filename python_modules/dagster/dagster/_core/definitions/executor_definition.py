@@ -334,12 +334,20 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
 
+    worker_pool_cfg = check.opt_nullable_dict_elem(config, "worker_pool")
+
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        use_worker_pool=worker_pool_cfg is not None,
+        max_tasks_per_worker=(
+            check.opt_int_elem(worker_pool_cfg, "max_tasks_per_worker")
+            if worker_pool_cfg is not None
+            else None
+        ),
     )
 
 
@@ -393,6 +401,26 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
             ),
         ),
         "retries": get_retries_config(),
+        "worker_pool": Field(
+            {
+                "max_tasks_per_worker": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "The number of steps a worker process executes before it is replaced by"
+                        " a new one. By default, worker processes are reused for the whole run."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of up to `max_concurrent` worker processes that are"
+                " reused across the steps of the run, instead of starting a new process for"
+                " each step. This avoids repeating process startup and the loading of user code"
+                " for every step, which can dominate the execution time of jobs with many small"
+                " ops. Steps executed by the same worker process share its module-level state."
+            ),
+        ),
     },
     description="Execute each step in an individual process.",
 )
@@ -421,6 +449,19 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    For jobs with many small ops, the ``worker_pool`` arg can be set to execute steps in a pool of
+    worker processes that are reused across steps instead of starting a new process for each step.
+    ``max_tasks_per_worker`` optionally limits how many steps each worker process executes before it
+    is replaced:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              worker_pool:
+                max_tasks_per_worker: 50
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
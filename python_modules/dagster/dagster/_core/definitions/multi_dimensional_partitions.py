@@ -1,9 +1,12 @@
 import hashlib
 import itertools
+import json
+from collections import defaultdict
 from datetime import datetime
-from functools import lru_cache, reduce
+from functools import cached_property, lru_cache, reduce
 from typing import (
     Dict,
+    Iterable,
     List,
     Mapping,
     NamedTuple,
@@ -22,6 +25,7 @@
 from dagster._annotations import public
 from dagster._core.errors import (
     DagsterInvalidDefinitionError,
+    DagsterInvalidDeserializationVersionError,
     DagsterInvalidInvocationError,
     DagsterUnknownPartitionError,
 )
@@ -37,7 +41,9 @@
     PartitionsDefinition,
     PartitionsSubset,
     StaticPartitionsDefinition,
+    StaticPartitionsSubset,
 )
+from .partition_key_range import PartitionKeyRange
 from .time_window_partitions import TimeWindow, TimeWindowPartitionsDefinition
 
 INVALID_STATIC_PARTITIONS_KEY_CHARACTERS = set(["|", ",", "[", "]"])
@@ -215,7 +221,7 @@ def __init__(self, partitions_defs: Mapping[str, PartitionsDefinition]):
 
     @property
     def partitions_subset_class(self) -> Type["PartitionsSubset"]:
-        return DefaultPartitionsSubset
+        return MultiPartitionsSubset
 
     def get_serializable_unique_identifier(
         self, dynamic_partitions_store: Optional[DynamicPartitionsStore] = None
@@ -525,3 +531,494 @@ def get_multipartition_key_from_tags(tags: Mapping[str, str]) -> str:
             partitions_by_dimension[dimension] = tags[tag]
 
     return MultiPartitionKey(partitions_by_dimension)
+
+
+class MultiPartitionsSubset(PartitionsSubset):
+    """A PartitionsSubset for a MultiPartitionsDefinition, which internally represents the included
+    partitions as a subset of the primary dimension for each partition key of the secondary
+    dimension, so that operations on the subset do not require building every MultiPartitionKey.
+
+    When serialized with serialize(), only the subsets of the primary dimension are stored. When
+    serialized with serdes, the subset is converted to a DefaultPartitionsSubset.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data.
+    SERIALIZATION_VERSION = 1
+
+    def __init__(
+        self,
+        partitions_def: MultiPartitionsDefinition,
+        subsets_by_secondary_key: Mapping[str, PartitionsSubset],
+    ):
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        # empty subsets are not stored, so that equal subsets have equal mappings
+        self._subsets_by_secondary_key = {
+            secondary_key: subset
+            for secondary_key, subset in check.mapping_param(
+                subsets_by_secondary_key,
+                "subsets_by_secondary_key",
+                key_type=str,
+                value_type=PartitionsSubset,
+            ).items()
+            if len(subset) > 0
+        }
+
+    @property
+    def partitions_def(self) -> MultiPartitionsDefinition:
+        return self._partitions_def
+
+    @property
+    def subsets_by_secondary_key(self) -> Mapping[str, PartitionsSubset]:
+        """The subset of the primary dimension that is included for each partition key of the
+        secondary dimension.
+        """
+        return self._subsets_by_secondary_key
+
+    @cached_property
+    def _primary_dimension_index(self) -> int:
+        return self._partitions_def.partition_dimension_names.index(
+            self._partitions_def.primary_dimension.name
+        )
+
+    def _to_multi_partition_key(self, primary_key: str, secondary_key: str) -> MultiPartitionKey:
+        return MultiPartitionKey(
+            {
+                self._partitions_def.primary_dimension.name: primary_key,
+                self._partitions_def.secondary_dimension.name: secondary_key,
+            }
+        )
+
+    def _split_partition_key(self, partition_key: str) -> Optional[Tuple[str, str]]:
+        """Returns the primary and secondary keys of a multi-partition key string, or None if it
+        does not have a key for each dimension.
+        """
+        keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        if len(keys) != 2:
+            return None
+        return keys[self._primary_dimension_index], keys[1 - self._primary_dimension_index]
+
+    @public
+    def get_partition_keys(self) -> Iterable[MultiPartitionKey]:
+        # a set, like the keys of the DefaultPartitionsSubsets that multi-partitioned subsets
+        # used to be represented as
+        return {
+            self._to_multi_partition_key(primary_key, secondary_key)
+            for secondary_key, subset in self._subsets_by_secondary_key.items()
+            for primary_key in subset.get_partition_keys()
+        }
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[MultiPartitionKey]:
+        multi_partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        primary_partitions_def = multi_partitions_def.primary_dimension.partitions_def
+        secondary_partitions_def = multi_partitions_def.secondary_dimension.partitions_def
+
+        all_primary_keys: Optional[Sequence[str]] = None
+        result: Set[MultiPartitionKey] = set()
+        for secondary_key in secondary_partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        ):
+            subset = self._subsets_by_secondary_key.get(secondary_key)
+            if subset is not None:
+                primary_keys = subset.get_partition_keys_not_in_subset(
+                    primary_partitions_def,
+                    current_time=current_time,
+                    dynamic_partitions_store=dynamic_partitions_store,
+                )
+            else:
+                if all_primary_keys is None:
+                    all_primary_keys = primary_partitions_def.get_partition_keys(
+                        current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+                    )
+                primary_keys = all_primary_keys
+            result.update(
+                self._to_multi_partition_key(primary_key, secondary_key)
+                for primary_key in primary_keys
+            )
+        return result
+
+    def _get_primary_index_ranges(
+        self,
+        subset: PartitionsSubset,
+        primary_partitions_def: PartitionsDefinition,
+        primary_key_indices: Mapping[str, int],
+    ) -> Sequence[Tuple[int, int]]:
+        """Returns the inclusive ranges of indices of the primary partition keys in a subset of the
+        primary dimension.
+        """
+        from .time_window_partitions import TimeWindowPartitionsSubset
+
+        # subsets that store time windows rather than partition keys, e.g. deserialized subsets
+        if isinstance(subset, TimeWindowPartitionsSubset):
+            key_ranges = subset.get_partition_key_ranges(primary_partitions_def)
+            # ranges that extend past the current partitions are handled key by key below
+            if all(
+                key_range.start in primary_key_indices and key_range.end in primary_key_indices
+                for key_range in key_ranges
+            ):
+                return [
+                    (primary_key_indices[key_range.start], primary_key_indices[key_range.end])
+                    for key_range in key_ranges
+                ]
+
+        if isinstance(subset, StaticPartitionsSubset) and subset.partitions_def == (
+            primary_partitions_def
+        ):
+            return subset.get_index_ranges()
+
+        indices = sorted(
+            primary_key_indices[key]
+            for key in subset.get_partition_keys()
+            if key in primary_key_indices
+        )
+        return _group_consecutive_indices(indices)
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        """Returns the ranges of partition keys in the subset, in the order of
+        partitions_def.get_partition_keys(). Ranges are computed from the ranges of each subset of
+        the primary dimension, without enumerating the partition keys of the cross product.
+        """
+        multi_partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        primary_partitions_def = multi_partitions_def.primary_dimension.partitions_def
+        secondary_partitions_def = multi_partitions_def.secondary_dimension.partitions_def
+        primary_keys = primary_partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        secondary_keys = secondary_partitions_def.get_partition_keys(
+            current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+        )
+        primary_key_indices = {key: i for i, key in enumerate(primary_keys)}
+
+        primary_ranges_by_secondary_index = {}
+        for secondary_index, secondary_key in enumerate(secondary_keys):
+            subset = self._subsets_by_secondary_key.get(secondary_key)
+            if subset is not None:
+                primary_ranges_by_secondary_index[secondary_index] = self._get_primary_index_ranges(
+                    subset, primary_partitions_def, primary_key_indices
+                )
+
+        # partition keys are ordered by the first dimension, then by the second dimension. compute
+        # the inclusive ranges of positions of the included keys in that order
+        num_primary_keys = len(primary_keys)
+        num_secondary_keys = len(secondary_keys)
+        position_ranges: List[Tuple[int, int]] = []
+        if self._primary_dimension_index == 1:
+            for secondary_index, primary_ranges in sorted(
+                primary_ranges_by_secondary_index.items()
+            ):
+                offset = secondary_index * num_primary_keys
+                position_ranges.extend(
+                    (offset + start, offset + end) for start, end in primary_ranges
+                )
+        else:
+            # split the primary dimension into intervals within which the same secondary keys are
+            # included for every primary key
+            boundaries: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
+            for secondary_index, primary_ranges in primary_ranges_by_secondary_index.items():
+                for start, end in primary_ranges:
+                    boundaries[start].append((secondary_index, 1))
+                    boundaries[end + 1].append((secondary_index, -1))
+
+            active_counts: Dict[int, int] = defaultdict(int)
+            sorted_boundaries = sorted(boundaries)
+            for interval_start, interval_end in zip(sorted_boundaries, sorted_boundaries[1:]):
+                for secondary_index, delta in boundaries[interval_start]:
+                    active_counts[secondary_index] += delta
+                secondary_ranges = _group_consecutive_indices(
+                    sorted(index for index, count in active_counts.items() if count > 0)
+                )
+                if secondary_ranges == [(0, num_secondary_keys - 1)]:
+                    position_ranges.append(
+                        (
+                            interval_start * num_secondary_keys,
+                            interval_end * num_secondary_keys - 1,
+                        )
+                    )
+                else:
+                    position_ranges.extend(
+                        (
+                            primary_index * num_secondary_keys + start,
+                            primary_index * num_secondary_keys + end,
+                        )
+                        for primary_index in range(interval_start, interval_end)
+                        for start, end in secondary_ranges
+                    )
+
+        first_dimension_keys, second_dimension_keys = (
+            (secondary_keys, primary_keys)
+            if self._primary_dimension_index == 1
+            else (primary_keys, secondary_keys)
+        )
+        num_second_dimension_keys = len(second_dimension_keys)
+        dimension_names = multi_partitions_def.partition_dimension_names
+
+        def _key_at_position(position: int) -> MultiPartitionKey:
+            return MultiPartitionKey(
+                {
+                    dimension_names[0]: first_dimension_keys[position // num_second_dimension_keys],
+                    dimension_names[1]: second_dimension_keys[position % num_second_dimension_keys],
+                }
+            )
+
+        return [
+            PartitionKeyRange(_key_at_position(start), _key_at_position(end))
+            for start, end in _merge_adjacent_ranges(position_ranges)
+        ]
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "MultiPartitionsSubset":
+        primary_keys_by_secondary_key: Dict[str, List[str]] = defaultdict(list)
+        for partition_key in partition_keys:
+            keys = self._split_partition_key(partition_key)
+            if keys is None:
+                check.failed(
+                    f"Invalid partition key {partition_key}. Expected a key for each of the"
+                    f" dimensions {self._partitions_def.partition_dimension_names}."
+                )
+            primary_key, secondary_key = keys
+            primary_keys_by_secondary_key[secondary_key].append(primary_key)
+
+        if not primary_keys_by_secondary_key:
+            return self
+
+        primary_partitions_def = self._partitions_def.primary_dimension.partitions_def
+        subsets_by_secondary_key = dict(self._subsets_by_secondary_key)
+        for secondary_key, primary_keys in primary_keys_by_secondary_key.items():
+            subset = subsets_by_secondary_key.get(secondary_key)
+            if subset is None:
+                subset = primary_partitions_def.empty_subset()
+            subsets_by_secondary_key[secondary_key] = subset.with_partition_keys(primary_keys)
+        return MultiPartitionsSubset(self._partitions_def, subsets_by_secondary_key)
+
+    def _is_factored_like(self, other: PartitionsSubset) -> bool:
+        return (
+            isinstance(other, MultiPartitionsSubset)
+            and other.partitions_def.primary_dimension == self._partitions_def.primary_dimension
+            and other.partitions_def.secondary_dimension == self._partitions_def.secondary_dimension
+        )
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        if not self._is_factored_like(other):
+            return self.with_partition_keys(other.get_partition_keys())
+
+        other_subsets = cast(MultiPartitionsSubset, other).subsets_by_secondary_key
+        subsets_by_secondary_key = dict(self._subsets_by_secondary_key)
+        for secondary_key, other_subset in other_subsets.items():
+            subset = subsets_by_secondary_key.get(secondary_key)
+            subsets_by_secondary_key[secondary_key] = (
+                other_subset if subset is None else subset | other_subset
+            )
+        return MultiPartitionsSubset(self._partitions_def, subsets_by_secondary_key)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self.empty_subset(self._partitions_def)
+        if not self._is_factored_like(other):
+            return self.empty_subset(self._partitions_def).with_partition_keys(
+                set(self.get_partition_keys()).difference(set(other.get_partition_keys()))
+            )
+
+        other_subsets = cast(MultiPartitionsSubset, other).subsets_by_secondary_key
+        return MultiPartitionsSubset(
+            self._partitions_def,
+            {
+                secondary_key: (
+                    subset - other_subsets[secondary_key]
+                    if secondary_key in other_subsets
+                    else subset
+                )
+                for secondary_key, subset in self._subsets_by_secondary_key.items()
+            },
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        if not self._is_factored_like(other):
+            return self.empty_subset(self._partitions_def).with_partition_keys(
+                set(self.get_partition_keys()) & set(other.get_partition_keys())
+            )
+
+        other_subsets = cast(MultiPartitionsSubset, other).subsets_by_secondary_key
+        return MultiPartitionsSubset(
+            self._partitions_def,
+            {
+                secondary_key: subset & other_subsets[secondary_key]
+                for secondary_key, subset in self._subsets_by_secondary_key.items()
+                if secondary_key in other_subsets
+            },
+        )
+
+    def serialize(self) -> str:
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "primary_dimension": self._partitions_def.primary_dimension.name,
+                # sort to ensure that equivalent partition subsets have identical serialized forms
+                "subsets_by_secondary_key": {
+                    secondary_key: self._subsets_by_secondary_key[secondary_key].serialize()
+                    for secondary_key in sorted(self._subsets_by_secondary_key)
+                },
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset":
+        multi_partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        data = json.loads(serialized)
+
+        if isinstance(data, list) or "subset" in data:
+            # backwards compatibility with subsets serialized as DefaultPartitionsSubsets
+            return cls.empty_subset(multi_partitions_def).with_partition_keys(
+                DefaultPartitionsSubset.from_serialized(
+                    multi_partitions_def, serialized
+                ).get_partition_keys()
+            )
+
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {cls.SERIALIZATION_VERSION} is supported."
+            )
+        primary_partitions_def = multi_partitions_def.primary_dimension.partitions_def
+        return cls(
+            multi_partitions_def,
+            {
+                secondary_key: primary_partitions_def.deserialize_subset(serialized_subset)
+                for secondary_key, serialized_subset in data["subsets_by_secondary_key"].items()
+            },
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if (
+            serialized_partitions_def_class_name
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
+
+        data = json.loads(serialized)
+        if isinstance(data, list) or (isinstance(data, dict) and "subset" in data):
+            return DefaultPartitionsSubset.can_deserialize(
+                partitions_def,
+                serialized,
+                serialized_partitions_def_unique_id,
+                serialized_partitions_def_class_name,
+            )
+
+        multi_partitions_def = cast(MultiPartitionsDefinition, partitions_def)
+        if not (
+            isinstance(data, dict)
+            and data.get("version") == cls.SERIALIZATION_VERSION
+            and data.get("primary_dimension") == multi_partitions_def.primary_dimension.name
+            and data.get("subsets_by_secondary_key") is not None
+        ):
+            return False
+
+        # the subsets of the primary dimension can only be read with the primary partitions
+        # definition that they were serialized with
+        if serialized_partitions_def_unique_id:
+            return (
+                multi_partitions_def.get_serializable_unique_identifier()
+                == serialized_partitions_def_unique_id
+            )
+        primary_partitions_def = multi_partitions_def.primary_dimension.partitions_def
+        return all(
+            primary_partitions_def.can_deserialize_subset(
+                serialized_subset,
+                serialized_partitions_def_unique_id=None,
+                serialized_partitions_def_class_name=None,
+            )
+            for serialized_subset in data["subsets_by_secondary_key"].values()
+        )
+
+    def __len__(self) -> int:
+        return sum(len(subset) for subset in self._subsets_by_secondary_key.values())
+
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, str):
+            return False
+        keys = self._split_partition_key(value)
+        if keys is None:
+            return False
+        primary_key, secondary_key = keys
+        subset = self._subsets_by_secondary_key.get(secondary_key)
+        return subset is not None and primary_key in subset
+
+    def __eq__(self, other: object) -> bool:
+        if self._is_factored_like(cast(PartitionsSubset, other)):
+            return (
+                self._subsets_by_secondary_key
+                == cast(MultiPartitionsSubset, other).subsets_by_secondary_key
+            )
+        # e.g. a DefaultPartitionsSubset that was deserialized with serdes
+        return (
+            isinstance(other, PartitionsSubset)
+            and len(self) == len(other)
+            and all(partition_key in self for partition_key in other.get_partition_keys())
+        )
+
+    def __repr__(self) -> str:
+        return f"MultiPartitionsSubset(subsets_by_secondary_key={self._subsets_by_secondary_key})"
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "MultiPartitionsSubset":
+        if not isinstance(partitions_def, MultiPartitionsDefinition):
+            check.failed("Partitions definition must be a MultiPartitionsDefinition")
+        return cls(partitions_def, {})
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        # MultiPartitionsDefinitions are not serializable, so subsets that are serialized with
+        # serdes keep the format of previous versions
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+
+def _group_consecutive_indices(indices: Sequence[int]) -> List[Tuple[int, int]]:
+    """Groups sorted, distinct indices into inclusive ranges of consecutive indices."""
+    ranges: List[Tuple[int, int]] = []
+    for index in indices:
+        if ranges and ranges[-1][1] == index - 1:
+            ranges[-1] = (ranges[-1][0], index)
+        else:
+            ranges.append((index, index))
+    return ranges
+
+
+def _merge_adjacent_ranges(ranges: Sequence[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Merges non-overlapping inclusive ranges that are adjacent to each other."""
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and merged[-1][1] == start - 1:
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
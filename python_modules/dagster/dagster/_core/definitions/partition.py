@@ -1,6 +1,8 @@
+import base64
 import copy
 import hashlib
 import json
+import re
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from datetime import (
@@ -12,12 +14,15 @@
     Any,
     Callable,
     Dict,
+    FrozenSet,
     Generic,
     Iterable,
+    List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
     cast,
@@ -349,6 +354,15 @@ def get_partition_keys(
         """
         return self._partition_keys
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        return StaticPartitionsSubset
+
+    @cached_method
+    def get_partition_key_indices(self) -> Mapping[str, int]:
+        """Returns the index of each partition key in the partition keys of the definition."""
+        return {partition_key: i for i, partition_key in enumerate(self._partition_keys)}
+
     def __hash__(self):
         return hash(self.__repr__())
 
@@ -1173,6 +1187,10 @@ def can_deserialize(
         )
 
     def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DefaultPartitionsSubset) and isinstance(other, PartitionsSubset):
+            # let subsets with other representations of the same keys, e.g.
+            # MultiPartitionsSubsets, decide whether they are equal
+            return NotImplemented
         return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
 
     def __len__(self) -> int:
@@ -1191,6 +1209,291 @@ def empty_subset(
         return cls()
 
 
+class StaticPartitionsSubset(PartitionsSubset):
+    """A PartitionsSubset for a StaticPartitionsDefinition, which represents the included partitions
+    as a bitmap of their indices in the partition keys of the definition, so that set operations,
+    ranges and serialization do not require handling each partition key.
+
+    Partition keys that are not in the definition, e.g. partitions that have been removed from it,
+    are stored separately. When serialized with serdes, the subset is converted to a
+    DefaultPartitionsSubset.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data.
+    SERIALIZATION_VERSION = 1
+
+    def __init__(
+        self,
+        partitions_def: StaticPartitionsDefinition,
+        bitmap: int = 0,
+        keys_not_in_partitions_def: Optional[AbstractSet[str]] = None,
+    ):
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", StaticPartitionsDefinition
+        )
+        # bit i is set if the i-th partition key of the definition is in the subset
+        self._bitmap = check.int_param(bitmap, "bitmap")
+        self._keys_not_in_partitions_def = frozenset(
+            check.opt_set_param(keys_not_in_partitions_def, "keys_not_in_partitions_def", str)
+        )
+
+    @property
+    def partitions_def(self) -> StaticPartitionsDefinition:
+        return self._partitions_def
+
+    @property
+    def bitmap(self) -> int:
+        return self._bitmap
+
+    @property
+    def keys_not_in_partitions_def(self) -> FrozenSet[str]:
+        return self._keys_not_in_partitions_def
+
+    def get_index_ranges(self) -> Sequence[Tuple[int, int]]:
+        """Returns the inclusive ranges of indices of the partition keys of the definition that are
+        in the subset.
+        """
+        return _get_bitmap_index_ranges(self._bitmap)
+
+    def _get_keys_for_bitmap(self, bitmap: int) -> List[str]:
+        partition_keys = self._partitions_def.get_partition_keys()
+        return [
+            partition_key
+            for start, end in _get_bitmap_index_ranges(bitmap)
+            for partition_key in partition_keys[start : end + 1]
+        ]
+
+    def _has_same_partitions_def(self, other: "StaticPartitionsSubset") -> bool:
+        return other.partitions_def is self._partitions_def or (
+            other.partitions_def == self._partitions_def
+        )
+
+    @public
+    def get_partition_keys(self) -> Iterable[str]:
+        # a set, like the keys of the DefaultPartitionsSubsets that static subsets used to be
+        # represented as
+        return {*self._get_keys_for_bitmap(self._bitmap), *self._keys_not_in_partitions_def}
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        if not (
+            isinstance(partitions_def, StaticPartitionsDefinition)
+            and self._partitions_def == partitions_def
+        ):
+            return set(
+                partitions_def.get_partition_keys(current_time, dynamic_partitions_store)
+            ) - set(self.get_partition_keys())
+
+        all_bitmap = (1 << len(self._partitions_def.get_partition_keys())) - 1
+        return set(self._get_keys_for_bitmap(all_bitmap & ~self._bitmap))
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        if not (
+            isinstance(partitions_def, StaticPartitionsDefinition)
+            and self._partitions_def == partitions_def
+        ):
+            return DefaultPartitionsSubset(set(self.get_partition_keys())).get_partition_key_ranges(
+                partitions_def, current_time, dynamic_partitions_store
+            )
+
+        partition_keys = self._partitions_def.get_partition_keys()
+        return [
+            PartitionKeyRange(partition_keys[start], partition_keys[end])
+            for start, end in self.get_index_ranges()
+        ]
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "StaticPartitionsSubset":
+        partition_key_indices = self._partitions_def.get_partition_key_indices()
+        indices = []
+        keys_not_in_partitions_def = set(self._keys_not_in_partitions_def)
+        for partition_key in partition_keys:
+            index = partition_key_indices.get(partition_key)
+            if index is None:
+                keys_not_in_partitions_def.add(partition_key)
+            else:
+                indices.append(index)
+
+        return StaticPartitionsSubset(
+            self._partitions_def,
+            self._bitmap | _get_bitmap_for_indices(indices),
+            keys_not_in_partitions_def,
+        )
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        if not (isinstance(other, StaticPartitionsSubset) and self._has_same_partitions_def(other)):
+            return self.with_partition_keys(other.get_partition_keys())
+        return StaticPartitionsSubset(
+            self._partitions_def,
+            self._bitmap | other.bitmap,
+            self._keys_not_in_partitions_def | other.keys_not_in_partitions_def,
+        )
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self.empty_subset(self._partitions_def)
+        if not (isinstance(other, StaticPartitionsSubset) and self._has_same_partitions_def(other)):
+            return self.empty_subset(self._partitions_def).with_partition_keys(
+                set(self.get_partition_keys()).difference(set(other.get_partition_keys()))
+            )
+        return StaticPartitionsSubset(
+            self._partitions_def,
+            self._bitmap & ~other.bitmap,
+            self._keys_not_in_partitions_def - other.keys_not_in_partitions_def,
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other:
+            return self
+        if not (isinstance(other, StaticPartitionsSubset) and self._has_same_partitions_def(other)):
+            return self.empty_subset(self._partitions_def).with_partition_keys(
+                set(self.get_partition_keys()) & set(other.get_partition_keys())
+            )
+        return StaticPartitionsSubset(
+            self._partitions_def,
+            self._bitmap & other.bitmap,
+            self._keys_not_in_partitions_def & other.keys_not_in_partitions_def,
+        )
+
+    def serialize(self) -> str:
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                # the bitmap can only be read with the partition keys that it was serialized with
+                "partitions_def_id": self._partitions_def.get_serializable_unique_identifier(),
+                "bitmap": base64.b64encode(
+                    self._bitmap.to_bytes((self._bitmap.bit_length() + 7) // 8, "little")
+                ).decode("ascii"),
+                "keys_not_in_partitions_def": sorted(self._keys_not_in_partitions_def),
+            }
+        )
+
+    @staticmethod
+    def _is_bitmap_format(data: Any) -> bool:
+        return isinstance(data, dict) and "bitmap" in data
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "PartitionsSubset":
+        static_partitions_def = check.inst_param(
+            partitions_def, "partitions_def", StaticPartitionsDefinition
+        )
+        data = json.loads(serialized)
+
+        if not cls._is_bitmap_format(data):
+            # backwards compatibility with subsets serialized as DefaultPartitionsSubsets
+            return cls.empty_subset(static_partitions_def).with_partition_keys(
+                DefaultPartitionsSubset.from_serialized(
+                    static_partitions_def, serialized
+                ).get_partition_keys()
+            )
+
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {cls.SERIALIZATION_VERSION} is supported."
+            )
+        check.invariant(
+            data.get("partitions_def_id")
+            == static_partitions_def.get_serializable_unique_identifier(),
+            "Cannot deserialize a subset that was serialized with different partition keys.",
+        )
+        return cls(
+            static_partitions_def,
+            int.from_bytes(base64.b64decode(data["bitmap"]), "little"),
+            set(data["keys_not_in_partitions_def"]),
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        data = json.loads(serialized)
+        if not cls._is_bitmap_format(data):
+            return DefaultPartitionsSubset.can_deserialize(
+                partitions_def,
+                serialized,
+                serialized_partitions_def_unique_id,
+                serialized_partitions_def_class_name,
+            )
+
+        return (
+            data.get("version") == cls.SERIALIZATION_VERSION
+            and data.get("partitions_def_id") == partitions_def.get_serializable_unique_identifier()
+        )
+
+    def __len__(self) -> int:
+        return bin(self._bitmap).count("1") + len(self._keys_not_in_partitions_def)
+
+    def __contains__(self, value) -> bool:
+        index = self._partitions_def.get_partition_key_indices().get(value)
+        if index is None:
+            return value in self._keys_not_in_partitions_def
+        return bool(self._bitmap >> index & 1)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StaticPartitionsSubset) and self._has_same_partitions_def(other):
+            return (
+                self._bitmap == other.bitmap
+                and self._keys_not_in_partitions_def == other.keys_not_in_partitions_def
+            )
+        # e.g. a DefaultPartitionsSubset that was deserialized with serdes
+        return (
+            isinstance(other, PartitionsSubset)
+            and len(self) == len(other)
+            and all(partition_key in self for partition_key in other.get_partition_keys())
+        )
+
+    def __repr__(self) -> str:
+        return f"StaticPartitionsSubset(subset={self.get_partition_keys()})"
+
+    @classmethod
+    def empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "StaticPartitionsSubset":
+        if not isinstance(partitions_def, StaticPartitionsDefinition):
+            check.failed("Partitions definition must be a StaticPartitionsDefinition")
+        return cls(partitions_def)
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        # StaticPartitionsDefinitions are not serializable, so subsets that are serialized with
+        # serdes keep the format of previous versions
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+
+def _get_bitmap_for_indices(indices: Iterable[int]) -> int:
+    bitmap = bytearray()
+    for index in indices:
+        byte_index = index >> 3
+        if byte_index >= len(bitmap):
+            bitmap.extend(bytes(byte_index + 1 - len(bitmap)))
+        bitmap[byte_index] |= 1 << (index & 7)
+    return int.from_bytes(bitmap, "little")
+
+
+def _get_bitmap_index_ranges(bitmap: int) -> List[Tuple[int, int]]:
+    """Returns the inclusive ranges of indices of the set bits of a bitmap."""
+    # the binary representation of the bitmap, with the bit of index 0 first
+    bits = bin(bitmap)[:1:-1]
+    return [(match.start(), match.end() - 1) for match in re.finditer("1+", bits)]
+
+
 class AllPartitionsSubset(
     NamedTuple(
         "_AllPartitionsSubset",
@@ -1,3 +1,4 @@
+import calendar
 import functools
 import hashlib
 import json
@@ -16,6 +17,7 @@
     Mapping,
     NamedTuple,
     Optional,
+    Pattern,
     Sequence,
     Tuple,
     Type,
@@ -49,6 +51,7 @@
 )
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 from dagster._utils.schedules import (
+    MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL,
     cron_string_iterator,
     cron_string_repeats_every_hour,
     is_valid_cron_schedule,
@@ -234,6 +237,209 @@ class TimeWindow(NamedTuple):
     end: PublicAttr[datetime]
 
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+class _FixedIntervalSchedule(NamedTuple):
+    """The times of a cron schedule that can be computed in closed form, i.e. an hourly, daily,
+    weekly, or monthly schedule in a timezone with a fixed UTC offset.
+
+    Schedule times are addressed by integer indices. Interval schedules tick every `interval`
+    seconds, with index 0 at the `anchor` timestamp. Monthly schedules (with an `interval` of 0)
+    tick at `hour`:`minute` on day `day` of each month, with index 0 in January 1970.
+    """
+
+    tzinfo: Any
+    utc_offset: int
+    interval: int
+    anchor: int
+    day: int
+    hour: int
+    minute: int
+
+    def get_time(self, index: int) -> float:
+        """Returns the timestamp of the schedule time with the given index."""
+        if self.interval:
+            return self.anchor + index * self.interval
+
+        year, month = divmod(index, 12)
+        return (
+            calendar.timegm((1970 + year, month + 1, self.day, self.hour, self.minute, 0))
+            - self.utc_offset
+        )
+
+    def get_index(self, timestamp: float) -> int:
+        """Returns the index of the first schedule time that is equal to or after the timestamp."""
+        if self.interval:
+            return -int((self.anchor - timestamp) // self.interval)
+
+        local_dt = self.to_local_datetime(timestamp)
+        index = (local_dt.year - 1970) * 12 + local_dt.month - 1
+        return index if self.get_time(index) >= timestamp else index + 1
+
+    def get_time_window(self, index: int) -> TimeWindow:
+        return TimeWindow(
+            self.to_pendulum_datetime(self.get_time(index)),
+            self.to_pendulum_datetime(self.get_time(index + 1)),
+        )
+
+    def get_time_windows(self, sorted_indices: Iterable[int]) -> Sequence[TimeWindow]:
+        """Returns the time windows that start at the schedule times with the given indices.
+        Adjacent time windows share the datetime at which one ends and the next starts.
+        """
+        time_windows: List[TimeWindow] = []
+        prev_index = None
+        for index in sorted_indices:
+            if prev_index is not None and index - prev_index <= 1:
+                start = time_windows[-1].start if index == prev_index else time_windows[-1].end
+            else:
+                start = self.to_pendulum_datetime(self.get_time(index))
+            end = self.to_pendulum_datetime(self.get_time(index + 1))
+            time_windows.append(TimeWindow(start, end))
+            prev_index = index
+        return time_windows
+
+    def to_local_datetime(self, timestamp: float) -> datetime:
+        """Returns the naive datetime of the timestamp in the timezone of the schedule."""
+        return _EPOCH + timedelta(seconds=timestamp + self.utc_offset)
+
+    def to_pendulum_datetime(self, timestamp: float) -> PendulumDateTime:
+        # equivalent to pendulum.from_timestamp, which is much slower
+        local_dt = self.to_local_datetime(timestamp)
+        return PendulumDateTime(
+            local_dt.year,
+            local_dt.month,
+            local_dt.day,
+            local_dt.hour,
+            local_dt.minute,
+            local_dt.second,
+            local_dt.microsecond,
+            tzinfo=self.tzinfo,
+        )
+
+    def format(self, timestamp: float, fmt: str) -> str:
+        if "%z" in fmt or "%Z" in fmt:
+            return self.to_pendulum_datetime(timestamp).strftime(fmt)
+        # times in a timezone with a fixed UTC offset are never ambiguous, so there is no need to
+        # use dst_safe_strftime
+        return self.to_local_datetime(timestamp).strftime(fmt)
+
+    def parse(self, date_string: str, fmt: str) -> float:
+        """Returns the timestamp of a datetime string, equivalent to dst_safe_strptime."""
+        fmt_regex = _get_datetime_format_regex(fmt)
+        match = fmt_regex.match(date_string) if fmt_regex else None
+        if match and match.end() == len(date_string):
+            fields = match.groupdict()
+            dt = datetime(
+                int(fields.get("Y", 1900)),
+                int(fields.get("m", 1)),
+                int(fields.get("d", 1)),
+                int(fields.get("H", 0)),
+                int(fields.get("M", 0)),
+            )
+            return (dt - _EPOCH).total_seconds() - self.utc_offset
+
+        try:
+            dt = datetime.strptime(date_string, fmt)
+        except ValueError:
+            dt = datetime.strptime(date_string, dst_safe_fmt(fmt))
+
+        if dt.tzinfo:
+            return dt.timestamp()
+        return (dt - _EPOCH).total_seconds() - self.utc_offset
+
+
+# the patterns that datetime.strptime uses for these directives
+_DATETIME_FORMAT_DIRECTIVE_PATTERNS = {
+    "Y": r"(?P<Y>\d\d\d\d)",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "d": r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    "H": r"(?P<H>2[0-3]|[0-1]\d|\d)",
+    "M": r"(?P<M>[0-5]\d|\d)",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_datetime_format_regex(fmt: str) -> Optional[Pattern[str]]:
+    """Returns a regex that parses datetime strings like datetime.strptime, which is much slower, if
+    the format only contains year, month, day, hour, and minute directives.
+    """
+    pattern = ""
+    for i, part in enumerate(re.split(r"(%.)", fmt)):
+        if i % 2 == 0:
+            # strptime matches any amount of whitespace for whitespace in the format
+            if "%" in part or re.search(r"\s", part):
+                return None
+            pattern += re.escape(part)
+        elif part[1] in _DATETIME_FORMAT_DIRECTIVE_PATTERNS and f"<{part[1]}>" not in pattern:
+            pattern += _DATETIME_FORMAT_DIRECTIVE_PATTERNS[part[1]]
+        else:
+            return None
+
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fixed_interval_schedule(
+    cron_schedule: str, timezone: str
+) -> Optional[_FixedIntervalSchedule]:
+    """Returns a _FixedIntervalSchedule for the given cron schedule and timezone, or None if the
+    times of the schedule can't be computed in closed form, in which case they must be computed by
+    iterating over the cron schedule.
+    """
+    try:
+        tz = pytz.timezone(timezone)
+    except pytz.UnknownTimeZoneError:
+        return None
+
+    # timezones that observe (or have ever observed) DST don't have a fixed UTC offset
+    if isinstance(tz, pytz.tzinfo.DstTzInfo):
+        return None
+
+    match = re.fullmatch(r"(\d+) (\d+|\*) (\d+|\*) \* (\d+|\*)", cron_schedule)
+    if match is None:
+        return None
+
+    minute_str, hour_str, day_str, day_of_week_str = match.groups()
+    minute = int(minute_str)
+    hour = int(hour_str) if hour_str != "*" else 0
+    day = 0
+    if minute >= 60 or hour >= 24:
+        return None
+
+    if hour_str == "*":
+        if day_str != "*" or day_of_week_str != "*":
+            return None
+        # hourly
+        interval, anchor = 3600, minute * 60
+    elif day_str == "*" and day_of_week_str == "*":
+        # daily
+        interval, anchor = 86400, hour * 3600 + minute * 60
+    elif day_str == "*" and int(day_of_week_str) <= 6:
+        # weekly. The unix epoch is a Thursday, which is day 4 of the week in a cron schedule.
+        days_after_epoch = (int(day_of_week_str) - 4) % 7
+        interval, anchor = 7 * 86400, days_after_epoch * 86400 + hour * 3600 + minute * 60
+    elif (
+        day_of_week_str == "*"
+        and 1 <= int(day_str) <= MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL
+    ):
+        # monthly
+        interval, anchor, day = 0, 0, int(day_str)
+    else:
+        return None
+
+    utc_offset = int(check.not_none(tz.utcoffset(_EPOCH)).total_seconds())
+    return _FixedIntervalSchedule(
+        tzinfo=pendulum.timezone(timezone),
+        utc_offset=utc_offset,
+        interval=interval,
+        anchor=anchor - utc_offset,
+        day=day,
+        hour=hour,
+        minute=minute,
+    )
+
+
 @whitelist_for_serdes(
     field_serializers={"start": DatetimeFieldSerializer, "end": DatetimeFieldSerializer},
     is_pickleable=False,
@@ -366,6 +572,13 @@ def get_num_partitions(
         # string format datetimes.
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        schedule = self._fixed_interval_schedule
+        if schedule:
+            num_partitions = len(
+                self._get_fixed_interval_partition_indices(schedule, current_timestamp)
+            )
+            return num_partitions + min(self.end_offset, 0)
+
         partitions_past_current_time = 0
 
         num_partitions = 0
@@ -435,6 +648,13 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
+        schedule = self._fixed_interval_schedule
+        if schedule:
+            indices = self._get_fixed_interval_partition_indices(schedule, current_timestamp)
+            if self.end_offset < 0:
+                indices = indices[: self.end_offset]
+            return [schedule.format(schedule.get_time(index), self.fmt) for index in indices]
+
         partitions_past_current_time = 0
         partition_keys: List[str] = []
         for time_window in self._iterate_time_windows(self.start):
@@ -460,6 +680,34 @@ def get_partition_keys(
 
         return partition_keys
 
+    @property
+    def _fixed_interval_schedule(self) -> Optional[_FixedIntervalSchedule]:
+        """If the times of the cron schedule can be computed in closed form, a schedule to use
+        instead of iterating over the cron schedule.
+        """
+        return _get_fixed_interval_schedule(self.cron_schedule, self.timezone)
+
+    def _get_fixed_interval_partition_indices(
+        self, schedule: _FixedIntervalSchedule, current_timestamp: float
+    ) -> range:
+        """Returns the schedule indices of the start times of the partitions, before the partitions
+        removed by a negative end_offset.
+        """
+        first_index = schedule.get_index(self.start.timestamp())
+
+        def _num_windows_ending_before(timestamp: float) -> int:
+            # the index of the last schedule time that is equal to or before the timestamp
+            index = schedule.get_index(timestamp)
+            if schedule.get_time(index) > timestamp:
+                index -= 1
+            return max(index - first_index, 0)
+
+        num_partitions = _num_windows_ending_before(current_timestamp) + max(self.end_offset, 0)
+        if self.end:
+            num_partitions = min(num_partitions, _num_windows_ending_before(self.end.timestamp()))
+
+        return range(first_index, first_index + num_partitions)
+
     def __str__(self) -> str:
         schedule_str = (
             self.schedule_type.value.capitalize() if self.schedule_type else self.cron_schedule
@@ -493,6 +741,12 @@ def __getstate__(self):
 
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
+        schedule = self._fixed_interval_schedule
+        if schedule:
+            return schedule.get_time_window(
+                schedule.get_index(schedule.parse(partition_key, self.fmt))
+            )
+
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
         return next(iter(self._iterate_time_windows(partition_key_dt)))
 
@@ -505,6 +759,12 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
+        schedule = self._fixed_interval_schedule
+        if schedule:
+            return self._fixed_interval_time_windows_for_partition_keys(
+                schedule, partition_keys, validate
+            )
+
         sorted_pks = sorted(
             partition_keys,
             key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
@@ -545,7 +805,44 @@ def time_windows_for_partition_keys(
             ]
         return partition_key_time_windows
 
+    def _fixed_interval_time_windows_for_partition_keys(
+        self,
+        schedule: _FixedIntervalSchedule,
+        partition_keys: FrozenSet[str],
+        validate: bool,
+    ) -> Sequence[TimeWindow]:
+        indices = sorted(
+            schedule.get_index(schedule.parse(partition_key, self.fmt))
+            for partition_key in partition_keys
+        )
+
+        if validate:
+            start_time_window = self.get_first_partition_window()
+            end_time_window = self.get_last_partition_window()
+
+            if start_time_window is None or end_time_window is None:
+                check.failed("No partitions in the PartitionsDefinition")
+
+            start_timestamp = start_time_window.start.timestamp()
+            end_timestamp = end_time_window.end.timestamp()
+
+            indices = [
+                index
+                for index in indices
+                if schedule.get_time(index) >= start_timestamp
+                and schedule.get_time(index + 1) <= end_timestamp
+            ]
+
+        return schedule.get_time_windows(indices)
+
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
+        schedule = self._fixed_interval_schedule
+        if schedule:
+            timestamp = schedule.parse(partition_key, self.fmt)
+            if not (self.is_basic_hourly or self.is_basic_daily):
+                timestamp = schedule.get_time(schedule.get_index(timestamp))
+            return schedule.to_pendulum_datetime(timestamp)
+
         partition_key_dt = pendulum.instance(
             dst_safe_strptime(partition_key, self.timezone, self.fmt)
         )
@@ -667,6 +964,13 @@ def _get_last_partition_window(self, *, current_time: datetime) -> Optional[Time
 
         if self.end_offset == 0:
             return next(iter(self._reverse_iterate_time_windows(current_time)))
+
+        schedule = self._fixed_interval_schedule
+        if schedule:
+            indices = self._get_fixed_interval_partition_indices(schedule, current_time.timestamp())
+            if self.end_offset < 0:
+                indices = indices[: self.end_offset]
+            return schedule.get_time_window(indices[-1]) if indices else None
         else:
             # TODO: make this efficient
             last_partition_key = super().get_last_partition_key(current_time)
@@ -716,6 +1020,15 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
 
     @functools.lru_cache(maxsize=5)
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        schedule = self._fixed_interval_schedule
+        if schedule:
+            start_index = schedule.get_index(time_window.start.timestamp())
+            end_index = schedule.get_index(time_window.end.timestamp())
+            return [
+                schedule.format(schedule.get_time(index), self.fmt)
+                for index in range(start_index, end_index)
+            ]
+
         result: List[str] = []
         for partition_time_window in self._iterate_time_windows(time_window.start):
             if partition_time_window.start.timestamp() < time_window.end.timestamp():
@@ -901,6 +1214,14 @@ def get_cron_schedule(
     def _iterate_time_windows(self, start: datetime) -> Iterable[TimeWindow]:
         """Returns an infinite generator of time windows that start after the given start time."""
         start_timestamp = pendulum.instance(start, tz=self.timezone).timestamp()
+
+        schedule = self._fixed_interval_schedule
+        if schedule:
+            index = schedule.get_index(start_timestamp)
+            while True:
+                yield schedule.get_time_window(index)
+                index += 1
+
         iterator = cron_string_iterator(
             start_timestamp=start_timestamp,
             cron_string=self.cron_schedule,
@@ -918,6 +1239,16 @@ def _iterate_time_windows(self, start: datetime) -> Iterable[TimeWindow]:
     def _reverse_iterate_time_windows(self, end: datetime) -> Iterable[TimeWindow]:
         """Returns an infinite generator of time windows that end before the given end time."""
         end_timestamp = pendulum.instance(end, tz=self.timezone).timestamp()
+
+        schedule = self._fixed_interval_schedule
+        if schedule:
+            index = schedule.get_index(end_timestamp)
+            if schedule.get_time(index) > end_timestamp:
+                index -= 1
+            while True:
+                index -= 1
+                yield schedule.get_time_window(index)
+
         iterator = reverse_cron_string_iterator(
             end_timestamp=end_timestamp,
             cron_string=self.cron_schedule,
@@ -938,6 +1269,13 @@ def get_partition_key_for_timestamp(self, timestamp: float, end_closed: bool = F
         timestamp (float): Timestamp from the unix epoch, UTC.
         end_closed (bool): Whether the interval is closed at the end or at the beginning.
         """
+        schedule = self._fixed_interval_schedule
+        if schedule:
+            index = schedule.get_index(timestamp)
+            if end_closed or schedule.get_time(index) > timestamp:
+                index -= 1
+            return schedule.format(schedule.get_time(index), self.fmt)
+
         iterator = cron_string_iterator(
             timestamp, self.cron_schedule, self.timezone, start_offset=-1
         )
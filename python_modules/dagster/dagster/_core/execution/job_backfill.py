@@ -143,8 +143,9 @@ def _get_partitions_chunk(
         partition_names = partition_names[index + 1 :]
 
     # for idempotence, fetch all runs with the current backfill id
-    backfill_runs = instance.get_runs(
-        RunsFilter(tags=DagsterRun.tags_for_backfill_id(backfill_job.backfill_id))
+    backfill_runs = instance.get_run_projections(
+        RunsFilter(tags=DagsterRun.tags_for_backfill_id(backfill_job.backfill_id)),
+        tag_keys=[PARTITION_NAME_TAG],
     )
     completed_partitions = set([run.tags.get(PARTITION_NAME_TAG) for run in backfill_runs])
     initial_checkpoint = (
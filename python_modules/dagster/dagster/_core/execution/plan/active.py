@@ -1,4 +1,6 @@
+import itertools
 import time
+from collections import defaultdict
 from types import TracebackType
 from typing import (
     Any,
@@ -87,7 +89,22 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, Set[str]] = {}
+
+        # steps move out of _pending once all of their upstream deps have resolved. Rather than
+        # rescanning _pending on every _update, we track the number of unresolved deps for each
+        # pending step and index pending steps by their deps, so that resolving a step only
+        # touches its direct downstreams
+        self._resolved: Set[str] = set()
+        self._unresolved_dep_counts: Dict[str, int] = {}
+        self._pending_downstreams: Dict[str, Set[str]] = defaultdict(set)
+        self._ready: Set[str] = set()
+        # insertion order of _pending, used to process ready steps in a stable order
+        self._pending_order: Dict[str, int] = {}
+        self._pending_counter = itertools.count()
+
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -198,14 +215,49 @@ def _pending_state_str(self) -> str:
             ),
         )
 
-    def _should_skip_step(self, step_key: str, successful_or_skipped_steps: Set[str]) -> bool:
+    def _add_pending(self, step_key: str, deps: Set[str]) -> None:
+        self._pending[step_key] = deps
+        self._pending_order[step_key] = next(self._pending_counter)
+
+        unresolved_deps = deps - self._resolved
+        self._unresolved_dep_counts[step_key] = len(unresolved_deps)
+        for dep in unresolved_deps:
+            self._pending_downstreams[dep].add(step_key)
+
+        if not unresolved_deps:
+            self._ready.add(step_key)
+
+    def _remove_pending(self, step_key: str) -> None:
+        del self._pending[step_key]
+        del self._pending_order[step_key]
+        del self._unresolved_dep_counts[step_key]
+
+    def _mark_resolved(self, step_key: str) -> None:
+        """Record that a step has reached a terminal state, and decrement the unresolved dep
+        counts of the pending steps that depend on it.
+        """
+        if step_key in self._resolved:
+            return
+
+        self._resolved.add(step_key)
+        for downstream_key in self._pending_downstreams.pop(step_key, set()):
+            if downstream_key not in self._unresolved_dep_counts:
+                continue
+            self._unresolved_dep_counts[downstream_key] -= 1
+            if self._unresolved_dep_counts[downstream_key] == 0:
+                self._ready.add(downstream_key)
+
+    def _should_skip_step(self, step_key: str) -> bool:
         step = self.get_step_by_key(step_key)
         for step_input in step.step_inputs:
             missing_source_handles = []
 
             for source_handle in step_input.get_step_output_handle_dependencies():
                 if (
-                    source_handle.step_key in successful_or_skipped_steps
+                    (
+                        source_handle.step_key in self._success
+                        or source_handle.step_key in self._skipped
+                    )
                     and source_handle not in self._step_outputs
                 ):
                     missing_source_handles.append(source_handle)
@@ -224,41 +276,27 @@ def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed.
         """
-        new_steps_to_execute: List[str] = []
-        new_steps_to_skip: List[str] = []
-        new_steps_to_abandon: List[str] = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-        resolved_steps = self._success | self._skipped | self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, depends_on_steps in self._pending.items():
-            if depends_on_steps.issubset(resolved_steps):
-                if self._should_skip_step(step_key, successful_or_skipped_steps):
-                    new_steps_to_skip.append(step_key)
-                elif depends_on_steps.intersection(failed_or_abandoned_steps):
-                    new_steps_to_abandon.append(step_key)
-                else:
-                    new_steps_to_execute.append(step_key)
-
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
-
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
+        # only the pending steps whose deps have all resolved need to be considered
+        ready_steps = sorted(self._ready, key=self._pending_order.__getitem__)
+        self._ready.clear()
 
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
+        for step_key in ready_steps:
+            if self._should_skip_step(step_key):
+                self._pending_skip.append(step_key)
+            elif any(
+                dep in self._failed or dep in self._abandoned for dep in self._pending[step_key]
+            ):
+                self._pending_abandon.append(step_key)
+            else:
+                self._executable.append(step_key)
+            self._remove_pending(step_key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -446,20 +484,24 @@ def plan_events_iterator(
 
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
+        self._mark_resolved(step_key)
         self._mark_complete(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
+        self._mark_resolved(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
+        self._mark_resolved(step_key)
         self._mark_complete(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
+        self._mark_resolved(step_key)
         self._mark_complete(step_key)
 
     def mark_interrupted(self) -> None:
@@ -480,11 +522,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._plan.get_executable_step_deps()[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._mark_resolved(step_key)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -2,17 +2,17 @@
 
 
 import os
-import queue
 import sys
 from abc import ABC, abstractmethod
-from multiprocessing import Queue
+from multiprocessing.connection import Connection
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, Iterator, List, NamedTuple, Optional, Union
 
 from typing_extensions import Literal
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
@@ -65,31 +65,57 @@ def __init__(self, exit_code=None):
         super().__init__()
 
 
-def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessCommand):
+def _send_command_events(event_conn: Connection, command: ChildProcessCommand, pid: int) -> None:
+    event_conn.send(ChildProcessStartEvent(pid=pid))
+    try:
+        for step_event in command.execute():
+            event_conn.send(step_event)
+        event_conn.send(ChildProcessDoneEvent(pid=pid))
+
+    except (
+        Exception,
+        KeyboardInterrupt,
+        DagsterExecutionInterruptedError,
+    ):
+        event_conn.send(
+            ChildProcessSystemErrorEvent(
+                pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+            )
+        )
+
+
+def _execute_command_in_child_process(event_conn: Connection, command: ChildProcessCommand):
     """Wraps the execution of a ChildProcessCommand.
 
-    Handles errors and communicates across a queue with the parent process.
+    Handles errors and communicates across a pipe with the parent process.
     """
     check.inst_param(command, "command", ChildProcessCommand)
 
+    with capture_interrupts():
+        try:
+            _send_command_events(event_conn, command, os.getpid())
+        finally:
+            event_conn.close()
+
+
+def _execute_commands_in_worker_process(conn: Connection, term_event: Any):
+    """Executes the ChildProcessCommands received over a duplex pipe one at a time, sending their
+    events back across the same pipe, until the parent process closes its end of the pipe.
+    """
+    start_termination_thread(term_event)
+
     with capture_interrupts():
         pid = os.getpid()
-        event_queue.put(ChildProcessStartEvent(pid=pid))
         try:
-            for step_event in command.execute():
-                event_queue.put(step_event)
-            event_queue.put(ChildProcessDoneEvent(pid=pid))
-
-        except (
-            Exception,
-            KeyboardInterrupt,
-            DagsterExecutionInterruptedError,
-        ):
-            event_queue.put(
-                ChildProcessSystemErrorEvent(
-                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
-                )
-            )
+            while True:
+                try:
+                    command = conn.recv()
+                except EOFError:
+                    break
+                check.inst(command, ChildProcessCommand)
+                _send_command_events(conn, command, pid)
+        finally:
+            conn.close()
 
 
 TICK = 20.0 * 1.0 / 1000.0
@@ -100,32 +126,35 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
 
 
 def _poll_for_event(
-    process, event_queue
+    process, event_conn: Connection, timeout: float
 ) -> Optional[Union["DagsterEvent", Literal["PROCESS_DEAD_AND_QUEUE_EMPTY"]]]:
     try:
-        return event_queue.get(block=True, timeout=TICK)
-    except queue.Empty:
+        if event_conn.poll(timeout):
+            return event_conn.recv()
         if not process.is_alive():
-            # There is a possibility that after the last queue.get the
-            # process created another event and then died. In that case
-            # we want to continue draining the queue.
-            try:
-                return event_queue.get(block=False)
-            except queue.Empty:
-                # If the queue empty we know that there are no more events
-                # and that the process has died.
-                return PROCESS_DEAD_AND_QUEUE_EMPTY
+            # There is a possibility that after the last poll the process sent another event and
+            # then died. In that case we want to continue draining the pipe.
+            if event_conn.poll():
+                return event_conn.recv()
+            # If the pipe is empty we know that there are no more events and that the process
+            # has died.
+            return PROCESS_DEAD_AND_QUEUE_EMPTY
+    except (EOFError, OSError):
+        # the write end of the pipe was closed by the process exiting
+        return PROCESS_DEAD_AND_QUEUE_EMPTY
     return None
 
 
 def execute_child_process_command(
-    multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessCommand
+    multiprocessing_ctx: MultiprocessingBaseContext,
+    command: ChildProcessCommand,
+    wait_handles: Optional[List[Any]] = None,
 ) -> Iterator[Optional["DagsterEvent"]]:
     """Execute a ChildProcessCommand in a new process.
 
     This function starts a new process whose execution target is a ChildProcessCommand wrapped by
-    _execute_command_in_child_process; polls the queue for events yielded by the child process
-    until the process dies and the queue is empty.
+    _execute_command_in_child_process; reads the events sent by the child process over a pipe
+    until the process dies and the pipe is empty.
 
     This function yields a complex set of objects to enable having multiple child process
     executions in flight:
@@ -143,23 +172,36 @@ def execute_child_process_command(
     Args:
         multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
         command (ChildProcessCommand): The command to execute in the child process.
+        wait_handles (Optional[List[Any]]): If set, None is yielded without blocking whenever
+            the child process has no event ready, and this list holds the objects to wait on for
+            the next one (the read end of the pipe and the process sentinel) while the process
+            runs. Callers multiplexing many child processes can then block on all of them at once
+            with `multiprocessing.connection.wait`. Otherwise, the pipe is polled for up to TICK
+            before yielding None.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
     """
     check.inst_param(command, "command", ChildProcessCommand)
 
-    event_queue = multiprocessing_ctx.Queue()
+    event_conn, child_event_conn = multiprocessing_ctx.Pipe(duplex=False)  # type: ignore
     try:
         process = multiprocessing_ctx.Process(  # type: ignore
-            target=_execute_command_in_child_process, args=(event_queue, command)
+            target=_execute_command_in_child_process, args=(child_event_conn, command)
         )
         process.start()
+        # close the parent's copy of the write end, so that the pipe reports EOF once the child
+        # process exits
+        child_event_conn.close()
+
+        if wait_handles is not None:
+            wait_handles.extend([event_conn, process.sentinel])
+        poll_timeout = 0 if wait_handles is not None else TICK
 
         completed_properly = False
 
         while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+            event = _poll_for_event(process, event_conn, poll_timeout)
 
             if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
                 break
@@ -170,9 +212,96 @@ def execute_child_process_command(
                 completed_properly = True
 
         if not completed_properly:
+            # the pipe may report EOF before the process has been reaped
+            process.join()
             # TODO Figure out what to do about stderr/stdout
             raise ChildProcessCrashException(exit_code=process.exitcode)
 
         process.join()
     finally:
-        event_queue.close()
+        if wait_handles is not None:
+            wait_handles.clear()
+        child_event_conn.close()
+        event_conn.close()
+
+
+class ChildProcessWorker:
+    """A child process that is reused to execute a sequence of ChildProcessCommands, one at a time.
+
+    Starting a process, importing user code and loading definitions in it is expensive compared to
+    executing a small command, so callers executing many commands can keep a pool of workers and
+    send each command to an idle one. Commands are sent to the worker over a pipe, so they must be
+    picklable without relying on process inheritance (e.g. they may not hold multiprocessing
+    Events). The worker's `term_event` interrupts the command it is executing when set.
+
+    A worker is only idle between commands that completed properly. After a command fails, crashes
+    or is abandoned the worker should be closed rather than reused.
+    """
+
+    def __init__(self, multiprocessing_ctx: MultiprocessingBaseContext):
+        self.term_event = multiprocessing_ctx.Event()  # type: ignore
+        self._conn, child_conn = multiprocessing_ctx.Pipe()  # type: ignore
+        self._process = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process, args=(child_conn, self.term_event)
+        )
+        self._process.start()
+        child_conn.close()
+        self._is_idle = True
+        self._commands_executed = 0
+
+    @property
+    def is_idle(self) -> bool:
+        return self._is_idle and not self.term_event.is_set() and self._process.is_alive()
+
+    @property
+    def commands_executed(self) -> int:
+        return self._commands_executed
+
+    def execute(
+        self, command: ChildProcessCommand, wait_handles: Optional[List[Any]] = None
+    ) -> Iterator[Optional["DagsterEvent"]]:
+        """Execute a ChildProcessCommand in the worker process, yielding the same objects as
+        `execute_child_process_command` until the command completes.
+        """
+        check.inst_param(command, "command", ChildProcessCommand)
+        check.invariant(self._is_idle, "Worker process is already executing a command")
+
+        self._is_idle = False
+        self._commands_executed += 1
+        try:
+            self._conn.send(command)
+        except OSError:
+            self._process.join()
+            raise ChildProcessCrashException(exit_code=self._process.exitcode)
+
+        if wait_handles is not None:
+            wait_handles.extend([self._conn, self._process.sentinel])
+        poll_timeout = 0 if wait_handles is not None else TICK
+
+        try:
+            while True:
+                event = _poll_for_event(self._process, self._conn, poll_timeout)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    self._process.join()
+                    raise ChildProcessCrashException(exit_code=self._process.exitcode)
+
+                yield event
+
+                if isinstance(event, ChildProcessDoneEvent):
+                    self._is_idle = True
+                    break
+                if isinstance(event, ChildProcessSystemErrorEvent):
+                    break
+        finally:
+            if wait_handles is not None:
+                wait_handles.clear()
+
+    def close(self) -> None:
+        """Close the pipe to the worker process, which exits once it finishes its current command.
+        Idle workers are waited on.
+        """
+        is_idle = self.is_idle
+        self._conn.close()
+        if is_idle:
+            self._process.join()
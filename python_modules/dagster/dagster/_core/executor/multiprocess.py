@@ -1,4 +1,5 @@
 import multiprocessing
+import multiprocessing.connection
 import os
 import sys
 from contextlib import ExitStack
@@ -38,6 +39,7 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
     execute_child_process_command,
 )
 
@@ -47,6 +49,10 @@
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
+CHILD_PROCESS_WAIT_TIMEOUT = 0.25
+"""The maximum time to block waiting on child processes before checking for interrupts and for
+steps that become executable -- default 250ms."""
+
 
 class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
@@ -55,7 +61,7 @@ def __init__(
         dagster_run: "DagsterRun",
         step_key: str,
         instance_ref: "InstanceRef",
-        term_event: Any,
+        term_event: Optional[Any],
         recon_pipeline: ReconstructableJob,
         retry_mode: RetryMode,
         known_state: Optional[KnownExecutionState],
@@ -74,7 +80,9 @@ def __init__(
     def execute(self) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
-            start_termination_thread(self.term_event)
+            # commands executed by a ChildProcessWorker are interrupted by the worker's term_event
+            if self.term_event is not None:
+                start_termination_thread(self.term_event)
 
             log_manager = create_context_free_log_manager(instance, self.dagster_run)
 
@@ -112,6 +120,8 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_tasks_per_worker: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -137,6 +147,10 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_tasks_per_worker = check.opt_int_param(
+            max_tasks_per_worker, "max_tasks_per_worker"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -201,6 +215,13 @@ def execute(
             active_iters: Dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: Dict[int, SerializableErrorInfo] = {}
             term_events: Dict[str, Any] = {}
+            # pipes and process sentinels of the active child processes, by step key
+            wait_handles: Dict[str, List[Any]] = {}
+            # when the worker pool is enabled, the worker processes executing steps and those
+            # waiting for the next step
+            busy_workers: Dict[str, ChildProcessWorker] = {}
+            idle_workers: List[ChildProcessWorker] = []
+            stack.callback(_close_workers, busy_workers, idle_workers)
             stopping: bool = False
 
             while (not stopping and not active_execution.is_complete) or active_iters:
@@ -228,7 +249,18 @@ def execute(
 
                     for step in steps:
                         step_context = plan_context.for_step(step)
-                        term_events[step.key] = multiproc_ctx.Event()
+                        worker = None
+                        if self._use_worker_pool:
+                            worker = (
+                                idle_workers.pop()
+                                if idle_workers
+                                else ChildProcessWorker(multiproc_ctx)
+                            )
+                            busy_workers[step.key] = worker
+                            term_events[step.key] = worker.term_event
+                        else:
+                            term_events[step.key] = multiproc_ctx.Event()
+                        wait_handles[step.key] = []
                         active_iters[step.key] = execute_step_out_of_process(
                             multiproc_ctx,
                             job,
@@ -239,18 +271,41 @@ def execute(
                             self.retries,
                             active_execution.get_known_state(),
                             execution_plan.repository_load_data,
+                            wait_handles[step.key],
+                            worker,
                         )
 
-                # process active iterators
+                # block until any child process sends an event or exits, instead of spinning over
+                # the active iterators. Iterators without handles have not started their child
+                # process yet and are always advanced. Time out to keep checking for interrupts
+                # and for steps that become executable.
+                keys_to_advance = [key for key in active_iters if not wait_handles[key]]
+                handles_by_key = {
+                    key: wait_handles[key] for key in active_iters if wait_handles[key]
+                }
+                if handles_by_key:
+                    ready = set(
+                        multiprocessing.connection.wait(
+                            [handle for handles in handles_by_key.values() for handle in handles],
+                            timeout=0 if keys_to_advance else CHILD_PROCESS_WAIT_TIMEOUT,
+                        )
+                    )
+                    keys_to_advance.extend(
+                        key
+                        for key, handles in handles_by_key.items()
+                        if any(handle in ready for handle in handles)
+                    )
+
+                # process active iterators, draining the events of each ready child process
                 empty_iters = []
-                for key, step_iter in active_iters.items():
+                for key in keys_to_advance:
+                    step_iter = active_iters[key]
                     try:
                         event_or_none = next(step_iter)
-                        if event_or_none is None:
-                            continue
-                        else:
+                        while event_or_none is not None:
                             yield event_or_none
                             active_execution.handle_event(event_or_none)
+                            event_or_none = next(step_iter)
 
                     except ChildProcessCrashException as crash:
                         serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
@@ -281,6 +336,16 @@ def execute(
                 for key in empty_iters:
                     del active_iters[key]
                     del term_events[key]
+                    del wait_handles[key]
+                    worker = busy_workers.pop(key, None)
+                    if worker:
+                        if worker.is_idle and not stopping and not (
+                            self._max_tasks_per_worker
+                            and worker.commands_executed >= self._max_tasks_per_worker
+                        ):
+                            idle_workers.append(worker)
+                        else:
+                            worker.close()
                     active_execution.verify_complete(plan_context, key)
 
                 # process skipped and abandoned steps
@@ -337,13 +402,16 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    wait_handles: Optional[List[Any]] = None,
+    worker: Optional[ChildProcessWorker] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
         dagster_run=step_context.dagster_run,
         step_key=step.key,
         instance_ref=step_context.instance.get_ref(),
-        term_event=term_events[step.key],
+        # multiprocessing Events can not be sent to a running worker process
+        term_event=term_events[step.key] if worker is None else None,
         recon_pipeline=recon_job,
         retry_mode=retries,
         known_state=known_state,
@@ -356,7 +424,12 @@ def execute_step_out_of_process(
         metadata={},
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    if worker is None:
+        child_process_events = execute_child_process_command(multiproc_ctx, command, wait_handles)
+    else:
+        child_process_events = worker.execute(command, wait_handles)
+
+    for ret in child_process_events:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
@@ -364,3 +437,10 @@ def execute_step_out_of_process(
                 errors[ret.pid] = ret.error_info
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
+
+
+def _close_workers(
+    busy_workers: Dict[str, ChildProcessWorker], idle_workers: List[ChildProcessWorker]
+) -> None:
+    for worker in [*busy_workers.values(), *idle_workers]:
+        worker.close()
@@ -666,6 +666,7 @@ def __init__(
             self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
                 self.client,
                 self,
+                list_repositories_response.repository_snapshot_ids,
             )
 
             self.external_repositories = {
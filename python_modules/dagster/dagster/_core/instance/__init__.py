@@ -57,6 +57,7 @@
     DagsterRunStatus,
     JobBucket,
     RunPartitionData,
+    RunProjection,
     RunRecord,
     RunsFilter,
     TagBucket,
@@ -85,6 +86,11 @@
     get_default_tick_retention_settings,
     get_tick_retention_settings,
 )
+from .event_log_buffer import (
+    DEFAULT_EVENT_LOG_BUFFER_MAX_BATCH_INTERVAL_SECONDS,
+    DEFAULT_EVENT_LOG_BUFFER_MAX_BATCH_SIZE,
+    EventLogBuffer,
+)
 from .ref import InstanceRef
 
 # 'airflow_execution_date' and 'is_airflow_ingest_pipeline' are hardcoded tags used in the
@@ -462,6 +468,20 @@ def __init__(
 
         self._subscribers: Dict[str, List[Callable]] = defaultdict(list)
 
+        self._event_log_buffer: Optional[EventLogBuffer] = None
+        if self.event_log_buffer_settings.get("enabled", False):
+            self._event_log_buffer = EventLogBuffer(
+                self._event_storage,
+                on_stored=self._handle_stored_events,
+                max_batch_size=self.event_log_buffer_settings.get(
+                    "max_batch_size", DEFAULT_EVENT_LOG_BUFFER_MAX_BATCH_SIZE
+                ),
+                max_batch_interval_seconds=self.event_log_buffer_settings.get(
+                    "max_batch_interval_seconds",
+                    DEFAULT_EVENT_LOG_BUFFER_MAX_BATCH_INTERVAL_SECONDS,
+                ),
+            )
+
         run_monitoring_enabled = self.run_monitoring_settings.get("enabled", False)
         self._run_monitoring_enabled = run_monitoring_enabled
         if self.run_monitoring_enabled and self.run_monitoring_max_resume_run_attempts:
@@ -900,6 +920,14 @@ def cancellation_thread_poll_interval_seconds(self) -> int:
             "cancellation_thread_poll_interval_seconds", 10
         )
 
+    @property
+    def event_log_buffer_settings(self) -> Any:
+        return self.get_settings("event_log_buffer")
+
+    @property
+    def compact_serialization_columns(self) -> AbstractSet[str]:
+        return set(self.get_settings("storage_serialization").get("compact_columns", []))
+
     @property
     def run_retries_enabled(self) -> bool:
         return self.get_settings("run_retries").get("enabled", False)
@@ -934,6 +962,14 @@ def auto_materialize_max_tick_retries(self) -> int:
     def auto_materialize_use_automation_policy_sensors(self) -> int:
         return self.get_settings("auto_materialize").get("use_automation_policy_sensors", False)
 
+    @property
+    def auto_materialize_num_evaluation_workers(self) -> Optional[int]:
+        return self.get_settings("auto_materialize").get("num_evaluation_workers")
+
+    @property
+    def auto_materialize_incremental_evaluation(self) -> bool:
+        return self.get_settings("auto_materialize").get("incremental_evaluation", False)
+
     @property
     def global_op_concurrency_default_limit(self) -> Optional[int]:
         return self.get_settings("concurrency").get("default_op_concurrency_limit")
@@ -991,6 +1027,8 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        if self._event_log_buffer:
+            self._event_log_buffer.close()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1788,6 +1826,25 @@ def get_run_ids(
     ) -> Sequence[str]:
         return self._run_storage.get_run_ids(filters, cursor=cursor, limit=limit)
 
+    @traced
+    def get_run_projections(
+        self,
+        filters: Optional[RunsFilter] = None,
+        tag_keys: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunProjection]:
+        return self._run_storage.get_run_projections(
+            filters=filters,
+            tag_keys=tag_keys,
+            limit=limit,
+            order_by=order_by,
+            ascending=ascending,
+            cursor=cursor,
+        )
+
     @traced
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         return self._run_storage.get_runs_count(filters)
@@ -2310,15 +2367,29 @@ def store_event(self, event: "EventLogEntry") -> None:
         self._event_storage.store_event(event)
 
     def handle_new_event(self, event: "EventLogEntry") -> None:
-        run_id = event.run_id
+        if self._event_log_buffer:
+            self._event_log_buffer.add(event)
+            return
 
         self._event_storage.store_event(event)
+        self._handle_stored_events([event])
 
-        if event.is_dagster_event and event.get_dagster_event().is_job_event:
-            self._run_storage.handle_run_event(run_id, event.get_dagster_event())
+    def _handle_stored_events(self, events: Sequence["EventLogEntry"]) -> None:
+        for event in events:
+            run_id = event.run_id
 
-        for sub in self._subscribers[run_id]:
-            sub(event)
+            if event.is_dagster_event and event.get_dagster_event().is_job_event:
+                self._run_storage.handle_run_event(run_id, event.get_dagster_event())
+
+            for sub in self._subscribers[run_id]:
+                sub(event)
+
+    def flush_event_log_buffer(self) -> None:
+        """Writes any events held by the event log buffer to event log storage. No-op unless
+        `event_log_buffer` is enabled in the instance settings.
+        """
+        if self._event_log_buffer:
+            self._event_log_buffer.flush()
 
     def add_event_listener(self, run_id: str, cb) -> None:
         self._subscribers[run_id].append(cb)
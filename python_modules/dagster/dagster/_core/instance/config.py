@@ -401,6 +401,49 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                         "How many threads to use to process ticks from multiple automation policy sensors in parallel"
                     ),
                 ),
+                "num_evaluation_workers": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many threads to use to evaluate the assets within each level of the asset graph in parallel during a tick. If not set, assets are evaluated one at a time."
+                    ),
+                ),
+                "incremental_evaluation": Field(
+                    Bool,
+                    is_required=False,
+                    description=(
+                        "Only evaluate the assets that may have changed since the previous tick, reusing the previous evaluation of the other assets."
+                    ),
+                ),
+            }
+        ),
+        "event_log_buffer": Field(
+            {
+                "enabled": Field(Bool, is_required=False, default_value=False),
+                "max_batch_size": Field(
+                    int,
+                    is_required=False,
+                    description="The maximum number of events to buffer before writing them to the event log",
+                ),
+                "max_batch_interval_seconds": Field(
+                    float,
+                    is_required=False,
+                    description="The maximum number of seconds an event is buffered before it is written to the event log",
+                ),
+            }
+        ),
+        "storage_serialization": Field(
+            {
+                "compact_columns": Field(
+                    Array(str),
+                    is_required=False,
+                    description=(
+                        "Storage columns to write using the compact serdes encoding, as"
+                        " `table.column` names. Supported columns are `event_logs.event`,"
+                        " `runs.run_body` and `asset_keys.cached_status_data`. Rows written in the"
+                        " JSON encoding remain readable."
+                    ),
+                ),
             }
         ),
         "concurrency": Field(
@@ -0,0 +1,130 @@
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence
+
+import dagster._check as check
+
+if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
+    from dagster._core.storage.event_log.base import EventLogStorage
+
+DEFAULT_EVENT_LOG_BUFFER_MAX_BATCH_SIZE = 100
+DEFAULT_EVENT_LOG_BUFFER_MAX_BATCH_INTERVAL_SECONDS = 1.0
+
+
+def is_event_log_flush_boundary(event: "EventLogEntry") -> bool:
+    """Whether the event ends a step or changes the status of a run. Everything buffered ahead of
+    (and including) one of these events is written before `handle_new_event` returns, so that
+    readers observing a step or run boundary also observe every event that led up to it.
+    """
+    from dagster._core.events import DagsterEventType
+
+    if not event.is_dagster_event:
+        return False
+
+    dagster_event = event.get_dagster_event()
+    return dagster_event.is_job_event or dagster_event.event_type in {
+        DagsterEventType.STEP_SUCCESS,
+        DagsterEventType.STEP_FAILURE,
+        DagsterEventType.STEP_SKIPPED,
+        DagsterEventType.STEP_UP_FOR_RETRY,
+        DagsterEventType.STEP_RESTARTED,
+    }
+
+
+class EventLogBuffer:
+    """Accumulates events handled by a DagsterInstance and writes them to event log storage in
+    batches via `EventLogStorage.store_events`.
+
+    A batch is flushed when it reaches `max_batch_size` events, when its oldest event has been
+    buffered for `max_batch_interval_seconds`, when a step or run boundary event is added, or
+    when the buffer is closed. Events are written, and then passed to `on_stored`, in the order
+    that they were added.
+    """
+
+    def __init__(
+        self,
+        event_log_storage: "EventLogStorage",
+        on_stored: Callable[[Sequence["EventLogEntry"]], None],
+        max_batch_size: int = DEFAULT_EVENT_LOG_BUFFER_MAX_BATCH_SIZE,
+        max_batch_interval_seconds: float = DEFAULT_EVENT_LOG_BUFFER_MAX_BATCH_INTERVAL_SECONDS,
+    ):
+        self._event_log_storage = event_log_storage
+        self._on_stored = check.callable_param(on_stored, "on_stored")
+        self._max_batch_size = check.int_param(max_batch_size, "max_batch_size")
+        self._max_batch_interval_seconds = check.numeric_param(
+            max_batch_interval_seconds, "max_batch_interval_seconds"
+        )
+        check.invariant(self._max_batch_size > 0, "max_batch_size must be positive")
+
+        # reentrant so that `on_stored` callbacks may themselves handle new events
+        self._lock = threading.RLock()
+        self._events: List["EventLogEntry"] = []
+        self._oldest_event_time: Optional[float] = None
+
+        self._shutdown_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+    def add(self, event: "EventLogEntry") -> None:
+        with self._lock:
+            if self._shutdown_event.is_set():
+                # the buffer has been closed, fall back to writing the event directly
+                self._write([event])
+                return
+
+            self._events.append(event)
+            if self._oldest_event_time is None:
+                self._oldest_event_time = time.monotonic()
+
+            if (
+                len(self._events) >= self._max_batch_size
+                or is_event_log_flush_boundary(event)
+                or self._batch_age() >= self._max_batch_interval_seconds
+            ):
+                self.flush()
+            else:
+                self._ensure_flush_thread()
+
+    def flush(self) -> None:
+        with self._lock:
+            events = self._events
+            self._events = []
+            self._oldest_event_time = None
+            if events:
+                self._write(events)
+
+    def close(self) -> None:
+        self._shutdown_event.set()
+        if self._flush_thread:
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
+
+    def _write(self, events: Sequence["EventLogEntry"]) -> None:
+        self._event_log_storage.store_events(events)
+        self._on_stored(events)
+
+    def _batch_age(self) -> float:
+        if self._oldest_event_time is None:
+            return 0.0
+        return time.monotonic() - self._oldest_event_time
+
+    def _ensure_flush_thread(self) -> None:
+        if self._flush_thread:
+            return
+
+        self._flush_thread = threading.Thread(
+            target=self._flush_on_interval, name="event-log-buffer-flush", daemon=True
+        )
+        self._flush_thread.start()
+
+    def _flush_on_interval(self) -> None:
+        # flushes batches that have outlived the max interval without another event arriving
+        while not self._shutdown_event.wait(self._max_batch_interval_seconds / 2):
+            with self._lock:
+                if self._batch_age() >= self._max_batch_interval_seconds:
+                    try:
+                        self.flush()
+                    except Exception:
+                        logging.exception("Exception while writing buffered events to event log.")
@@ -457,6 +457,8 @@ def from_dir(
             "nux",
             "auto_materialize",
             "concurrency",
+            "event_log_buffer",
+            "storage_serialization",
         }
         settings = {key: config_value.get(key) for key in settings_keys if config_value.get(key)}
 
@@ -0,0 +1,25 @@
+"""add run tags run id index
+
+Revision ID: 229fb6ca891f
+Revises: 46b412388816
+Create Date: 2023-12-12 10:14:31.518907
+
+"""
+from dagster._core.storage.migration.utils import (
+    add_run_tags_run_id_index,
+    drop_run_tags_run_id_index,
+)
+
+# revision identifiers, used by Alembic.
+revision = "229fb6ca891f"
+down_revision = "46b412388816"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    add_run_tags_run_id_index()
+
+
+def downgrade():
+    drop_run_tags_run_id_index()
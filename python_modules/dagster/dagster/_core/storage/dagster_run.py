@@ -569,6 +569,76 @@ def __new__(
         )
 
 
+class RunProjection(
+    NamedTuple(
+        "_RunProjection",
+        [
+            ("storage_id", int),
+            ("run_id", str),
+            ("job_name", str),
+            ("status", DagsterRunStatus),
+            ("tags", Mapping[str, str]),
+            ("create_timestamp", datetime),
+            ("update_timestamp", datetime),
+            ("start_time", Optional[float]),
+            ("end_time", Optional[float]),
+        ],
+    )
+):
+    """Internal representation of the indexed fields of a run record, which a
+    :py:class:`~dagster._core.storage.runs.RunStorage` can read without deserializing the run.
+    ``tags`` only holds the tags that were requested.
+
+    Users should not invoke this class directly.
+    """
+
+    def __new__(
+        cls,
+        storage_id: int,
+        run_id: str,
+        job_name: str,
+        status: DagsterRunStatus,
+        tags: Mapping[str, str],
+        create_timestamp: datetime,
+        update_timestamp: datetime,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ):
+        return super(RunProjection, cls).__new__(
+            cls,
+            storage_id=check.int_param(storage_id, "storage_id"),
+            run_id=check.str_param(run_id, "run_id"),
+            job_name=check.str_param(job_name, "job_name"),
+            status=check.inst_param(status, "status", DagsterRunStatus),
+            tags=check.mapping_param(tags, "tags", key_type=str, value_type=str),
+            create_timestamp=check.inst_param(create_timestamp, "create_timestamp", datetime),
+            update_timestamp=check.inst_param(update_timestamp, "update_timestamp", datetime),
+            start_time=check.opt_float_param(start_time, "start_time"),
+            end_time=check.opt_float_param(end_time, "end_time"),
+        )
+
+    @staticmethod
+    def from_run_record(
+        run_record: RunRecord, tag_keys: Optional[Sequence[str]] = None
+    ) -> "RunProjection":
+        run = run_record.dagster_run
+        return RunProjection(
+            storage_id=run_record.storage_id,
+            run_id=run.run_id,
+            job_name=run.job_name,
+            status=run.status,
+            tags=(
+                run.tags
+                if tag_keys is None
+                else {key: value for key, value in run.tags.items() if key in tag_keys}
+            ),
+            create_timestamp=run_record.create_timestamp,
+            update_timestamp=run_record.update_timestamp,
+            start_time=run_record.start_time,
+            end_time=run_record.end_time,
+        )
+
+
 @whitelist_for_serdes
 class RunPartitionData(
     NamedTuple(
@@ -160,6 +160,22 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    def get_records_for_runs(
+        self, cursors_by_run_id: Mapping[str, Optional[str]]
+    ) -> Mapping[str, EventLogConnection]:
+        """Get the event log records after a given cursor for each of a set of runs, e.g. to poll
+        for new events across all watched runs at once.
+
+        Args:
+            cursors_by_run_id (Mapping[str, Optional[str]]): The ids of the runs for which to fetch
+                logs, mapped to the storage id cursor after which to fetch them (None to fetch all
+                of the logs of the run).
+        """
+        return {
+            run_id: self.get_records_for_run(run_id, cursor=cursor)
+            for run_id, cursor in cursors_by_run_id.items()
+        }
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
@@ -186,6 +202,17 @@ def store_event(self, event: "EventLogEntry") -> None:
             event (EventLogEntry): The event to store.
         """
 
+    def store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        """Store a batch of events, in order.
+
+        Storages that can write several events in fewer round trips should override this method.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        for event in events:
+            self.store_event(event)
+
     @abstractmethod
     def delete_events(self, run_id: str) -> None:
         """Remove events for a given run id."""
@@ -62,6 +62,9 @@ def index_connection(self):
         return self._connect()
 
     def has_table(self, table_name: str) -> bool:
+        return self._schema_cache.has_table(table_name, lambda: self._has_table(table_name))
+
+    def _has_table(self, table_name: str) -> bool:
         with self._engine.connect() as conn:
             return bool(self._engine.dialect.has_table(conn, table_name))
 
@@ -82,6 +85,14 @@ def upgrade(self):
 
     def store_event(self, event):
         super(InMemoryEventLogStorage, self).store_event(event)
+        self._notify_handlers(event)
+
+    def store_events(self, events):
+        super(InMemoryEventLogStorage, self).store_events(events)
+        for event in events:
+            self._notify_handlers(event)
+
+    def _notify_handlers(self, event):
         self._storage_id += 1
 
         handlers = list(self._handlers[event.run_id])
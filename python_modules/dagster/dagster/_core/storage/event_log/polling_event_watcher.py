@@ -1,7 +1,10 @@
+import logging
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
 
 import dagster._check as check
+from dagster._core.event_api import EventLogRecord
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
 
@@ -22,30 +25,38 @@ class CallbackAfterCursor(NamedTuple):
 
 
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that uses a polling approach to retrieving new events for run_ids.
+
+    A single thread (SqlPollingEventWatcherThread) polls the event log for all watched run_ids at
+    once, with one `get_records_for_runs` query per polling interval, so the rate of queries does not
+    grow with the number of watched runs. Callbacks are fired on the polling thread, or on a pool of
+    `callback_dispatch_workers` threads if set.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: the watcher thread's _callbacks_lock protects its callbacks by run_id
     """
 
-    def __init__(self, event_log_storage: EventLogStorage):
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        callback_dispatch_workers: Optional[int] = None,
+    ):
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
+        self._callback_dispatch_workers = check.opt_int_param(
+            callback_dispatch_workers, "callback_dispatch_workers"
+        )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _thread_lock protects _watcher_thread
+        self._thread_lock: threading.Lock = threading.Lock()
+        self._watcher_thread: Optional[SqlPollingEventWatcherThread] = None
         self._disposed = False
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
-        return _has_run_id
+        with self._thread_lock:
+            return self._watcher_thread is not None and self._watcher_thread.has_run_id(run_id)
 
     def watch_run(
         self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
@@ -53,23 +64,23 @@ def watch_run(
         run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
+        with self._thread_lock:
+            if self._disposed:
+                return
+            if self._watcher_thread is None:
+                self._watcher_thread = SqlPollingEventWatcherThread(
+                    self._event_log_storage, self._callback_dispatch_workers
                 )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+                self._watcher_thread.daemon = True
+                self._watcher_thread.start()
+            self._watcher_thread.add_callback(run_id, cursor, callback)
 
     def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._thread_lock:
+            if self._watcher_thread is not None:
+                self._watcher_thread.remove_callback(run_id, handler)
 
     def __del__(self):
         self.close()
@@ -77,97 +88,196 @@ def __del__(self):
     def close(self):
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
+            with self._thread_lock:
+                watcher_thread = self._watcher_thread
+                self._watcher_thread = None
+            if watcher_thread is not None:
+                watcher_thread.should_thread_exit.set()
+                watcher_thread.wake()
+                if watcher_thread is not threading.current_thread():
+                    watcher_thread.join()
 
 
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
+class SqlPollingEventWatcherThread(threading.Thread):
+    """subclass of Thread that watches all watched run_ids for new Events by polling, starting every
+    INIT_POLL_PERIOD and backing off to MAX_POLL_PERIOD while no new events are found.
 
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
+    Holds a list of callbacks per run_id (_callbacks_by_run_id) each passed in by an `Observer`.
+    Note that the callbacks have a cursor associated; this means that the callbacks should be
+    only executed on EventLogEntrys with an associated id >= callback.cursor
     Exits when `self.should_thread_exit` is set.
 
     LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
-
+        INVARIANTS: _callbacks_lock protects _callbacks_by_run_id and _cursors_by_run_id. Callbacks
+            are fired without holding _callbacks_lock, so that they may add or remove callbacks.
     """
 
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super(SqlPollingRunIdEventWatcherThread, self).__init__()
+    def __init__(
+        self, event_log_storage: EventLogStorage, callback_dispatch_workers: Optional[int] = None
+    ):
+        super(SqlPollingEventWatcherThread, self).__init__()
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", EventLogStorage
         )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: List[CallbackAfterCursor] = []
+        self._callback_dispatch_workers = check.opt_int_param(
+            callback_dispatch_workers, "callback_dispatch_workers"
+        )
+        self._callbacks_lock: threading.Lock = threading.Lock()
+        self._callbacks_by_run_id: Dict[str, List[CallbackAfterCursor]] = {}
+        self._cursors_by_run_id: Dict[str, Optional[str]] = {}
         self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
+        self._wake_event = threading.Event()
+        self.name = "sql-event-watch"
 
     @property
     def should_thread_exit(self) -> threading.Event:
         return self._should_thread_exit
 
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
+    def wake(self):
+        """Poll immediately instead of waiting out the current polling interval."""
+        self._wake_event.set()
+
+    def has_run_id(self, run_id: str) -> bool:
+        with self._callbacks_lock:
+            return run_id in self._callbacks_by_run_id
+
+    def add_callback(
+        self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ):
         """Observer has started watching this run.
             Add a callback to execute on new EventLogEntrys after the given cursor.
 
         Args:
+            run_id (str): run to execute the callback for
             cursor (Optional[str]): event log cursor for the callback to execute
             callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
         """
+        run_id = check.str_param(run_id, "run_id")
         cursor = check.opt_str_param(cursor, "cursor")
         callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
+        with self._callbacks_lock:
+            if run_id not in self._callbacks_by_run_id:
+                self._callbacks_by_run_id[run_id] = []
+                self._cursors_by_run_id[run_id] = None
+            self._callbacks_by_run_id[run_id].append(CallbackAfterCursor(cursor, callback))
+        self.wake()
 
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
+    def remove_callback(self, run_id: str, callback: Callable[[EventLogEntry, str], None]):
         """Observer has stopped watching this run;
             Remove a callback from the list of callbacks to execute on new EventLogEntrys.
 
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+            Also stop polling the run if no callbacks remain (i.e. no Observers are watching it)
 
         Args:
+            run_id (str): run to remove the callback for
             callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
         """
+        run_id = check.str_param(run_id, "run_id")
         callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
+        with self._callbacks_lock:
+            if run_id not in self._callbacks_by_run_id:
+                return
+            self._callbacks_by_run_id[run_id] = [
                 callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
+                for callback_with_cursor in self._callbacks_by_run_id[run_id]
                 if callback_with_cursor.callback != callback
             ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
+            if not self._callbacks_by_run_id[run_id]:
+                del self._callbacks_by_run_id[run_id]
+                del self._cursors_by_run_id[run_id]
 
     def run(self):
         """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
+        Wakes every polling interval (or when a callback is added) &
+            1. executes a single SELECT query to get new EventLogEntrys for all watched runs
             2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
+        Uses the last storage id retrieved for each run as a cursor in the DB to make sure that only
+        new records are retrieved.
         """
-        cursor = None
-        wait_time = INIT_POLL_PERIOD
-        while not self._should_thread_exit.wait(wait_time):
-            conn = self._event_log_storage.get_records_for_run(self._run_id, cursor=cursor)
-            cursor = conn.cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+        executor = (
+            ThreadPoolExecutor(
+                max_workers=self._callback_dispatch_workers,
+                thread_name_prefix="sql-event-watch-dispatch",
+            )
+            if self._callback_dispatch_workers
+            else None
+        )
+        try:
+            wait_time = INIT_POLL_PERIOD
+            while not self._should_thread_exit.is_set():
+                if self._wake_event.wait(wait_time):
+                    self._wake_event.clear()
+                    wait_time = INIT_POLL_PERIOD
+                if self._should_thread_exit.is_set():
+                    break
+
+                has_records = self._poll(executor)
+                wait_time = INIT_POLL_PERIOD if has_records else min(wait_time * 2, MAX_POLL_PERIOD)
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+
+    def _poll(self, executor: Optional[ThreadPoolExecutor]) -> bool:
+        with self._callbacks_lock:
+            cursors_by_run_id = dict(self._cursors_by_run_id)
+        if not cursors_by_run_id:
+            return False
+
+        try:
+            connections = self._event_log_storage.get_records_for_runs(cursors_by_run_id)
+        except Exception:
+            logging.exception("Exception while polling for events of watched runs.")
+            return False
+
+        callbacks_by_run_id: Dict[str, Sequence[CallbackAfterCursor]] = {}
+        with self._callbacks_lock:
+            for run_id, conn in connections.items():
+                # skip runs that were unwatched during the query
+                if run_id not in self._callbacks_by_run_id:
+                    continue
+                self._cursors_by_run_id[run_id] = conn.cursor
+                if conn.records:
+                    callbacks_by_run_id[run_id] = list(self._callbacks_by_run_id[run_id])
+
+        if executor:
+            # each run's events are dispatched in order by a single task, and all tasks complete
+            # before the next poll
+            wait(
+                [
+                    executor.submit(
+                        _dispatch_records, run_id, connections[run_id].records, callbacks
+                    )
+                    for run_id, callbacks in callbacks_by_run_id.items()
+                ]
+            )
+        else:
+            for run_id, callbacks in callbacks_by_run_id.items():
+                _dispatch_records(run_id, connections[run_id].records, callbacks)
+
+        return bool(callbacks_by_run_id)
+
+
+def _dispatch_records(
+    run_id: str,
+    event_records: Sequence[EventLogRecord],
+    callbacks: Sequence[CallbackAfterCursor],
+) -> None:
+    callbacks_after_storage_ids = [
+        (
+            callback_with_cursor.callback,
+            EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+            if callback_with_cursor.cursor is not None
+            else None,
+        )
+        for callback_with_cursor in callbacks
+    ]
+    for event_record in event_records:
+        for callback, after_storage_id in callbacks_after_storage_ids:
+            if after_storage_id is None or after_storage_id < event_record.storage_id:
+                try:
+                    callback(
+                        event_record.event_log_entry,
+                        str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                    )
+                except Exception:
+                    logging.exception("Exception in callback for event watch on run %s.", run_id)
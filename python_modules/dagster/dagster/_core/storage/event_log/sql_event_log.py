@@ -1,11 +1,14 @@
+import itertools
 import logging
 import os
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
 from datetime import datetime
+from functools import cached_property
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     ContextManager,
     Dict,
@@ -60,7 +63,13 @@
     AssetCheckExecutionRecord,
     AssetCheckExecutionRecordStatus,
 )
-from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow
+from dagster._core.storage.sql import (
+    SqlAlchemyQuery,
+    SqlAlchemyRow,
+    SqlSchemaCache,
+    get_column_names,
+    serialize_column_value,
+)
 from dagster._core.storage.sqlalchemy_compat import (
     db_case,
     db_fetch_mappings,
@@ -180,7 +189,16 @@ def upgrade(self) -> None:
 
     @abstractmethod
     def has_table(self, table_name: str) -> bool:
-        """This method checks if a table exists in the database."""
+        """This method checks if a table exists in the database.
+
+        Implementations should answer from `_schema_cache`, so that table checks on the write path
+        do not issue catalog queries.
+        """
+
+    @cached_property
+    def _schema_cache(self) -> SqlSchemaCache:
+        """Cache of schema introspection results, cleared whenever the storage is upgraded."""
+        return SqlSchemaCache()
 
     def prepare_insert_event(self, event):
         """Helper method for preparing the event log SQL insertion statement.  Abstracted away to
@@ -189,23 +207,30 @@ def prepare_insert_event(self, event):
         the `dagster-postgres` implementation which overrides the generic SQL implementation of
         `store_event`.
         """
+        # https://stackoverflow.com/a/54386260/324449
+        return SqlEventLogStorageTable.insert().values(**self._get_event_insert_values(event))
+
+    def _get_event_insert_values(self, event: EventLogEntry) -> Dict[str, Any]:
+        """Column values for the event log row of the given event, shared between single event
+        inserts and the multi-row inserts issued by `store_events`.
+        """
         dagster_event_type = None
         asset_key_str = None
         partition = None
         step_key = event.step_key
         if event.is_dagster_event:
-            dagster_event_type = event.dagster_event.event_type_value
-            step_key = event.dagster_event.step_key
-            if event.dagster_event.asset_key:
-                check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
-                asset_key_str = event.dagster_event.asset_key.to_string()
-            if event.dagster_event.partition:
-                partition = event.dagster_event.partition
-
-        # https://stackoverflow.com/a/54386260/324449
-        return SqlEventLogStorageTable.insert().values(
+            dagster_event = event.get_dagster_event()
+            dagster_event_type = dagster_event.event_type_value
+            step_key = dagster_event.step_key
+            if dagster_event.asset_key:
+                check.inst_param(dagster_event.asset_key, "asset_key", AssetKey)
+                asset_key_str = dagster_event.asset_key.to_string()
+            if dagster_event.partition:
+                partition = dagster_event.partition
+
+        return dict(
             run_id=event.run_id,
-            event=serialize_value(event),
+            event=serialize_column_value(self, "event_logs.event", event),
             dagster_event_type=dagster_event_type,
             # Postgres requires a datetime that is in UTC but has no timezone info set
             # in order to be stored correctly
@@ -216,9 +241,13 @@ def prepare_insert_event(self, event):
         )
 
     def has_asset_key_col(self, column_name: str) -> bool:
+        return column_name in self._schema_cache.get_column_names(
+            AssetKeyTable.name, self._get_asset_key_column_names
+        )
+
+    def _get_asset_key_column_names(self) -> AbstractSet[str]:
         with self.index_connection() as conn:
-            column_names = [x.get("name") for x in db.inspect(conn).get_columns(AssetKeyTable.name)]
-            return column_name in column_names
+            return get_column_names(conn, AssetKeyTable.name)
 
     def has_asset_key_index_cols(self) -> bool:
         return self.has_asset_key_col("last_materialization_timestamp")
@@ -242,14 +271,15 @@ def store_asset_event(self, event: EventLogEntry, event_id: int):
         # https://github.com/dagster-io/dagster/issues/3945
 
         values = self._get_asset_entry_values(event, event_id, self.has_asset_key_index_cols())
-        insert_statement = AssetKeyTable.insert().values(
-            asset_key=event.dagster_event.asset_key.to_string(), **values
-        )
+        self._upsert_asset_entry(event.dagster_event.asset_key, values)
+
+    def _upsert_asset_entry(self, asset_key: AssetKey, values: Mapping[str, Any]) -> None:
+        insert_statement = AssetKeyTable.insert().values(asset_key=asset_key.to_string(), **values)
         update_statement = (
             AssetKeyTable.update()
             .values(**values)
             .where(
-                AssetKeyTable.c.asset_key == event.dagster_event.asset_key.to_string(),
+                AssetKeyTable.c.asset_key == asset_key.to_string(),
             )
         )
 
@@ -394,39 +424,46 @@ def store_asset_event_tags(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         check.int_param(event_id, "event_id")
 
-        if event.dagster_event and event.dagster_event.asset_key:
-            if event.dagster_event.is_step_materialization:
-                tags = event.dagster_event.step_materialization_data.materialization.tags
-            elif event.dagster_event.is_asset_observation:
-                tags = event.dagster_event.asset_observation_data.asset_observation.tags
-            else:
-                tags = None
+        tag_rows = self._get_asset_event_tag_rows(event, event_id)
+        if not tag_rows or not self.has_table(AssetEventTagsTable.name):
+            # If tags table does not exist, silently exit. This is to support OSS
+            # users who have not yet run the migration to create the table.
+            # On read, we will throw an error if the table does not exist.
+            return
 
-            if not tags or not self.has_table(AssetEventTagsTable.name):
-                # If tags table does not exist, silently exit. This is to support OSS
-                # users who have not yet run the migration to create the table.
-                # On read, we will throw an error if the table does not exist.
-                return
+        with self.index_connection() as conn:
+            conn.execute(AssetEventTagsTable.insert(), tag_rows)
 
-            check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
-            asset_key_str = event.dagster_event.asset_key.to_string()
+    def _get_asset_event_tag_rows(
+        self, event: EventLogEntry, event_id: int
+    ) -> Sequence[Mapping[str, Any]]:
+        if not (event.dagster_event and event.dagster_event.asset_key):
+            return []
 
-            with self.index_connection() as conn:
-                conn.execute(
-                    AssetEventTagsTable.insert(),
-                    [
-                        dict(
-                            event_id=event_id,
-                            asset_key=asset_key_str,
-                            key=key,
-                            value=value,
-                            # Postgres requires a datetime that is in UTC but has no timezone info
-                            # set in order to be stored correctly
-                            event_timestamp=datetime.utcfromtimestamp(event.timestamp),
-                        )
-                        for key, value in tags.items()
-                    ],
-                )
+        if event.dagster_event.is_step_materialization:
+            tags = event.dagster_event.step_materialization_data.materialization.tags
+        elif event.dagster_event.is_asset_observation:
+            tags = event.dagster_event.asset_observation_data.asset_observation.tags
+        else:
+            tags = None
+
+        if not tags:
+            return []
+
+        check.inst_param(event.dagster_event.asset_key, "asset_key", AssetKey)
+        asset_key_str = event.dagster_event.asset_key.to_string()
+        return [
+            dict(
+                event_id=event_id,
+                asset_key=asset_key_str,
+                key=key,
+                value=value,
+                # Postgres requires a datetime that is in UTC but has no timezone info
+                # set in order to be stored correctly
+                event_timestamp=datetime.utcfromtimestamp(event.timestamp),
+            )
+            for key, value in tags.items()
+        ]
 
     def store_event(self, event: EventLogEntry) -> None:
         """Store an event corresponding to a pipeline run.
@@ -461,6 +498,95 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events, in order.
+
+        Consecutive events for the same run are written to the event log table with multi-row
+        inserts over a single connection. Asset key entries touched by the batch are upserted once
+        per asset key, and asset event tags for the whole batch are written in a single insert.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events_iter in itertools.groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_events_iter)
+            with self.run_connection(run_id) as conn:
+                event_ids = self._insert_event_rows(conn, run_events)
+            self._store_index_data_for_events(run_events, event_ids)
+
+    def _insert_event_rows(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Inserts the event log rows for a batch of events, returning the storage id for every
+        event whose id is needed to write index data (asset and asset check events), and None for
+        the rest.
+
+        Storage ids are not portably returned from multi-row inserts, so events that need their
+        id are inserted individually, while the runs of events in between are flushed with a
+        single multi-row insert. This keeps storage ids in the same order as the events.
+        """
+        event_ids: List[Optional[int]] = []
+        pending_values: List[Dict[str, Any]] = []
+        for event in events:
+            values = self._get_event_insert_values(event)
+            if _requires_storage_id(event):
+                if pending_values:
+                    conn.execute(SqlEventLogStorageTable.insert(), pending_values)
+                    pending_values = []
+                result = conn.execute(SqlEventLogStorageTable.insert().values(**values))
+                event_ids.append(result.inserted_primary_key[0])
+            else:
+                pending_values.append(values)
+                event_ids.append(None)
+
+        if pending_values:
+            conn.execute(SqlEventLogStorageTable.insert(), pending_values)
+
+        return event_ids
+
+    def _store_index_data_for_events(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
+    ) -> None:
+        asset_entry_values: Dict[AssetKey, Dict[str, Any]] = {}
+        tag_rows: List[Mapping[str, Any]] = []
+        asset_check_events: List[Tuple[EventLogEntry, Optional[int]]] = []
+        has_asset_key_index_cols: Optional[bool] = None
+
+        for event, event_id in zip(events, event_ids):
+            if not event.is_dagster_event:
+                continue
+
+            dagster_event = event.get_dagster_event()
+            if event.dagster_event_type in ASSET_EVENTS and dagster_event.asset_key:
+                if event_id is None:
+                    raise DagsterInvariantViolationError(
+                        "Cannot store asset event tags for null event id."
+                    )
+                if has_asset_key_index_cols is None:
+                    has_asset_key_index_cols = self.has_asset_key_index_cols()
+
+                # later events in the batch overwrite the columns set by earlier events for the
+                # same asset, which matches the end state of upserting each event in turn
+                asset_entry_values.setdefault(dagster_event.asset_key, {}).update(
+                    self._get_asset_entry_values(event, event_id, has_asset_key_index_cols)
+                )
+                tag_rows.extend(self._get_asset_event_tag_rows(event, event_id))
+
+            if event.dagster_event_type in ASSET_CHECK_EVENTS:
+                asset_check_events.append((event, event_id))
+
+        for asset_key, values in asset_entry_values.items():
+            self._upsert_asset_entry(asset_key, values)
+
+        if tag_rows and self.has_table(AssetEventTagsTable.name):
+            with self.index_connection() as conn:
+                conn.execute(AssetEventTagsTable.insert(), tag_rows)
+
+        for event, event_id in asset_check_events:
+            self.store_asset_check_event(event, event_id)
+
     def get_records_for_run(
         self,
         run_id,
@@ -554,6 +680,75 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_records_for_runs(
+        self, cursors_by_run_id: Mapping[str, Optional[str]]
+    ) -> Mapping[str, EventLogConnection]:
+        """Overridden to fetch the records of all of the runs with a single query, unless the
+        storage is sharded by run.
+        """
+        cursor_objs = {
+            run_id: EventLogCursor.parse(cursor) if cursor else None
+            for run_id, cursor in cursors_by_run_id.items()
+        }
+        has_offset_cursor = any(
+            cursor_obj and cursor_obj.is_offset_cursor() for cursor_obj in cursor_objs.values()
+        )
+        if self.is_run_sharded or not cursor_objs or has_offset_cursor:
+            return super().get_records_for_runs(cursors_by_run_id)
+
+        conditions = []
+        for run_id, cursor_obj in cursor_objs.items():
+            if cursor_obj:
+                conditions.append(
+                    db.and_(
+                        SqlEventLogStorageTable.c.run_id == run_id,
+                        SqlEventLogStorageTable.c.id > cursor_obj.storage_id(),
+                    )
+                )
+            else:
+                conditions.append(SqlEventLogStorageTable.c.run_id == run_id)
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(db.or_(*conditions))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        records_by_run_id: Dict[str, List[EventLogRecord]] = {
+            run_id: [] for run_id in cursors_by_run_id
+        }
+        for record_id, run_id, json_str in results:
+            try:
+                event_log_entry = deserialize_value(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+            records_by_run_id[run_id].append(
+                EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry)
+            )
+
+        connections = {}
+        for run_id, records in records_by_run_id.items():
+            if records:
+                next_cursor = EventLogCursor.from_storage_id(records[-1].storage_id).to_string()
+            else:
+                # same cursor semantics as get_records_for_run
+                next_cursor = cursors_by_run_id[run_id] or (
+                    EventLogCursor.from_storage_id(-1).to_string()
+                )
+            connections[run_id] = EventLogConnection(
+                records=records, cursor=next_cursor, has_more=False
+            )
+        return connections
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
@@ -793,7 +988,7 @@ def update_event_log_record(self, record_id: int, event: EventLogEntry) -> None:
                 SqlEventLogStorageTable.update()
                 .where(SqlEventLogStorageTable.c.id == record_id)
                 .values(
-                    event=serialize_value(event),
+                    event=serialize_column_value(self, "event_logs.event", event),
                     dagster_event_type=dagster_event_type,
                     timestamp=datetime.utcfromtimestamp(event.timestamp),
                     step_key=event.step_key,
@@ -819,6 +1014,11 @@ def has_secondary_index(self, name: str) -> bool:
         """This method uses a checkpoint migration table to see if summary data has been constructed
         in a secondary index table.  Can be used to checkpoint event_log data migrations.
         """
+        return self._schema_cache.has_secondary_index(
+            name, lambda: self._has_secondary_index(name)
+        )
+
+    def _has_secondary_index(self, name: str) -> bool:
         query = (
             db_select([1])
             .where(SecondaryIndexMigrationTable.c.name == name)
@@ -847,6 +1047,7 @@ def enable_secondary_index(self, name: str) -> None:
                     .where(SecondaryIndexMigrationTable.c.name == name)
                     .values(migration_completed=datetime.now())
                 )
+        self._schema_cache.invalidate_secondary_index(name)
 
     def _apply_filter_to_query(
         self,
@@ -1533,7 +1734,11 @@ def update_asset_cached_status_data(
                     .where(
                         AssetKeyTable.c.asset_key == asset_key.to_string(),
                     )
-                    .values(cached_status_data=serialize_value(cache_values))
+                    .values(
+                        cached_status_data=serialize_column_value(
+                            self, "asset_keys.cached_status_data", cache_values
+                        )
+                    )
                 )
 
     def _fetch_backcompat_materialization_times(
@@ -2958,6 +3163,16 @@ def supports_asset_checks(self):
         return self.has_table(AssetCheckExecutionsTable.name)
 
 
+def _requires_storage_id(event: EventLogEntry) -> bool:
+    if not event.is_dagster_event:
+        return False
+
+    if event.dagster_event_type in ASSET_EVENTS and event.get_dagster_event().asset_key:
+        return True
+
+    return event.dagster_event_type in ASSET_CHECK_EVENTS
+
+
 def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     """Utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
     supported in sqlalchemy 1.3.
@@ -55,7 +55,6 @@ class ConsolidatedSqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     def __init__(self, base_dir, inst_data: Optional[ConfigurableClassData] = None):
         self._base_dir = check.str_param(base_dir, "base_dir")
         self._conn_string = create_db_conn_string(base_dir, SQLITE_EVENT_LOG_FILENAME)
-        self._secondary_index_cache = {}
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self._watchers = defaultdict(dict)
         self._obs = None
@@ -112,6 +111,9 @@ def index_connection(self):
         return self._connect()
 
     def has_table(self, table_name: str) -> bool:
+        return self._schema_cache.has_table(table_name, lambda: self._has_table(table_name))
+
+    def _has_table(self, table_name: str) -> bool:
         engine = create_engine(self._conn_string, poolclass=NullPool)
         return bool(engine.dialect.has_table(engine.connect(), table_name))
 
@@ -122,18 +124,7 @@ def upgrade(self):
         alembic_config = get_alembic_config(__file__)
         with self._connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
-
-    def has_secondary_index(self, name):
-        if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                ConsolidatedSqliteEventLogStorage, self
-            ).has_secondary_index(name)
-        return self._secondary_index_cache[name]
-
-    def enable_secondary_index(self, name):
-        super(ConsolidatedSqliteEventLogStorage, self).enable_secondary_index(name)
-        if name in self._secondary_index_cache:
-            del self._secondary_index_cache[name]
+        self._schema_cache.clear()
 
     def watch(self, run_id, cursor, callback):
         if not self._obs:
@@ -1,5 +1,6 @@
 import contextlib
 import glob
+import itertools
 import logging
 import os
 import re
@@ -126,6 +127,8 @@ def upgrade(self) -> None:
         with self.index_connection() as conn:
             run_alembic_upgrade(alembic_config, conn, "index")
 
+        self._schema_cache.clear()
+
         self._initialized_dbs = set()
 
     @property
@@ -151,6 +154,9 @@ def get_all_run_ids(self) -> Sequence[str]:
         ]
 
     def has_table(self, table_name: str) -> bool:
+        return self._schema_cache.has_table(table_name, lambda: self._has_table(table_name))
+
+    def _has_table(self, table_name: str) -> bool:
         conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
         engine = create_engine(conn_string, poolclass=NullPool)
         with engine.connect() as conn:
@@ -242,6 +248,29 @@ def store_event(self, event: EventLogEntry) -> None:
         with self.run_connection(run_id) as conn:
             conn.execute(insert_event_statement)
 
+        self._store_event_in_index_shard(event, insert_event_statement)
+
+    def store_events(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write each run's events to its run shard with a single multi-row
+        insert, before replicating asset, asset check, and run status events in the index shard.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        for run_id, run_events_iter in itertools.groupby(events, key=lambda event: event.run_id):
+            run_events = list(run_events_iter)
+            with self.run_connection(run_id) as conn:
+                conn.execute(
+                    SqlEventLogStorageTable.insert(),
+                    [self._get_event_insert_values(event) for event in run_events],
+                )
+
+            for event in run_events:
+                self._store_event_in_index_shard(event, self.prepare_insert_event(event))
+
+    def _store_event_in_index_shard(self, event: EventLogEntry, insert_event_statement) -> None:
         if event.is_dagster_event and event.dagster_event.asset_key:  # type: ignore
             check.invariant(
                 event.dagster_event_type in ASSET_EVENTS,
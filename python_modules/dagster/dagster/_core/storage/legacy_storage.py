@@ -60,6 +60,7 @@
         DagsterRunStatsSnapshot,
         JobBucket,
         RunPartitionData,
+        RunProjection,
         RunRecord,
         RunsFilter,
         TagBucket,
@@ -235,6 +236,19 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    def get_run_projections(
+        self,
+        filters: Optional["RunsFilter"] = None,
+        tag_keys: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence["RunProjection"]:
+        return self._storage.run_storage.get_run_projections(
+            filters, tag_keys, limit, order_by, ascending, cursor
+        )
+
     def get_run_tags(
         self,
         tag_keys: Optional[Sequence[str]] = None,
@@ -493,3 +493,29 @@ def drop_run_job_index() -> None:
             "runs",
             postgresql_concurrently=True,
         )
+
+
+def add_run_tags_run_id_index() -> None:
+    if not has_table("run_tags"):
+        return
+
+    if not has_index("run_tags", "idx_run_tags_run_id"):
+        op.create_index(
+            "idx_run_tags_run_id",
+            "run_tags",
+            ["run_id", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def drop_run_tags_run_id_index() -> None:
+    if not has_table("run_tags"):
+        return
+
+    if has_index("run_tags", "idx_run_tags_run_id"):
+        op.drop_index(
+            "idx_run_tags_run_id",
+            "run_tags",
+            postgresql_concurrently=True,
+        )
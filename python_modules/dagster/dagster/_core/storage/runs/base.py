@@ -11,6 +11,7 @@
     DagsterRun,
     JobBucket,
     RunPartitionData,
+    RunProjection,
     RunRecord,
     RunsFilter,
     TagBucket,
@@ -158,6 +159,39 @@ def get_run_records(
             List[RunRecord]: List of run records stored in the run storage.
         """
 
+    def get_run_projections(
+        self,
+        filters: Optional[RunsFilter] = None,
+        tag_keys: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunProjection]:
+        """Return the ids, statuses, timestamps and tags of runs stored in the run storage, sorted
+        by the given column in given order. Unlike get_run_records, this does not need to read and
+        deserialize the full runs, so callers that only need these fields should prefer it.
+
+        Args:
+            filters (Optional[RunsFilter]): the filter by which to filter runs.
+            tag_keys (Optional[Sequence[str]]): The keys of the tags to include in each projection.
+                Defaults to all tags.
+            limit (Optional[int]): Number of results to get. Defaults to infinite.
+            order_by (Optional[str]): Name of the column to sort by. Defaults to id.
+            ascending (Optional[bool]): Sort the result in ascending order if True, descending
+                otherwise. Defaults to descending.
+            cursor (Optional[str]): Starting cursor (run_id) of range of runs
+
+        Returns:
+            List[RunProjection]: List of run projections stored in the run storage.
+        """
+        return [
+            RunProjection.from_run_record(run_record, tag_keys)
+            for run_record in self.get_run_records(
+                filters=filters, limit=limit, order_by=order_by, ascending=ascending, cursor=cursor
+            )
+        ]
+
     @abstractmethod
     def get_run_tags(
         self,
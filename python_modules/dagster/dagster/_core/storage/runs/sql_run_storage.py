@@ -5,7 +5,9 @@
 from collections import defaultdict
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     ContextManager,
@@ -42,7 +44,12 @@
     create_execution_plan_snapshot_id,
     create_job_snapshot_id,
 )
-from dagster._core.storage.sql import SqlAlchemyQuery
+from dagster._core.storage.sql import (
+    SqlAlchemyQuery,
+    SqlSchemaCache,
+    get_column_names,
+    serialize_column_value,
+)
 from dagster._core.storage.sqlalchemy_compat import (
     db_fetch_mappings,
     db_scalar_subquery,
@@ -64,11 +71,16 @@
 from dagster._utils import PrintFn, utc_datetime_from_timestamp
 from dagster._utils.merger import merge_dicts
 
+RUN_PROJECTION_TAGS_CHUNK_SIZE = 500
+"""The number of runs whose tags are fetched per query when loading run projections, which keeps
+the number of bound parameters per query under the limits of the supported databases."""
+
 from ..dagster_run import (
     DagsterRun,
     DagsterRunStatus,
     JobBucket,
     RunPartitionData,
+    RunProjection,
     RunRecord,
     RunsFilter,
     TagBucket,
@@ -137,7 +149,7 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
             run_id=dagster_run.run_id,
             pipeline_name=dagster_run.job_name,
             status=dagster_run.status.value,
-            run_body=serialize_value(dagster_run),
+            run_body=serialize_column_value(self, "runs.run_body", dagster_run),
             snapshot_id=dagster_run.job_snapshot_id,
             partition=partition,
             partition_set=partition_set,
@@ -197,7 +209,9 @@ def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
                 RunsTable.update()
                 .where(RunsTable.c.run_id == run_id)
                 .values(
-                    run_body=serialize_value(run.with_status(new_job_status)),
+                    run_body=serialize_column_value(
+                        self, "runs.run_body", run.with_status(new_job_status)
+                    ),
                     status=new_job_status.value,
                     update_timestamp=now,
                     **kwargs,
@@ -420,6 +434,74 @@ def get_run_records(
             for row in rows
         ]
 
+    def get_run_projections(
+        self,
+        filters: Optional[RunsFilter] = None,
+        tag_keys: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+    ) -> Sequence[RunProjection]:
+        filters = check.opt_inst_param(filters, "filters", RunsFilter, default=RunsFilter())
+        tag_keys = check.opt_nullable_sequence_param(tag_keys, "tag_keys", of_type=str)
+        check.opt_int_param(limit, "limit")
+
+        # only fetch indexed columns, so that run bodies are neither read nor deserialized
+        columns = [
+            "id",
+            "run_id",
+            "pipeline_name",
+            "status",
+            "create_timestamp",
+            "update_timestamp",
+        ]
+
+        if self.has_run_stats_index_cols():
+            columns += ["start_time", "end_time"]
+        query = self._runs_query(
+            filters=filters,
+            limit=limit,
+            columns=columns,
+            order_by=order_by,
+            ascending=ascending,
+            cursor=cursor,
+        )
+        rows = self.fetchall(query)
+
+        tags_by_run_id: Dict[str, Dict[str, str]] = defaultdict(dict)
+        if tag_keys is None or len(tag_keys) > 0:
+            key_set = set(tag_keys) if tag_keys is not None else None
+            run_ids = [row["run_id"] for row in rows]
+            for i in range(0, len(run_ids), RUN_PROJECTION_TAGS_CHUNK_SIZE):
+                # filter the tag keys here rather than in the query, so that the tags are looked up
+                # by run id instead of scanning the tags with the given keys across all runs
+                tags_query = db_select(
+                    [RunTagsTable.c.run_id, RunTagsTable.c.key, RunTagsTable.c.value]
+                ).where(
+                    RunTagsTable.c.run_id.in_(run_ids[i : i + RUN_PROJECTION_TAGS_CHUNK_SIZE])
+                )
+                for tag_row in self.fetchall(tags_query):
+                    if key_set is None or tag_row["key"] in key_set:
+                        tags_by_run_id[tag_row["run_id"]][tag_row["key"]] = tag_row["value"]
+
+        return [
+            RunProjection(
+                storage_id=check.int_param(row["id"], "id"),
+                run_id=row["run_id"],
+                job_name=row["pipeline_name"],
+                status=DagsterRunStatus(row["status"]),
+                tags=tags_by_run_id.get(row["run_id"], {}),
+                create_timestamp=check.inst(row["create_timestamp"], datetime),
+                update_timestamp=check.inst(row["update_timestamp"], datetime),
+                start_time=(
+                    check.opt_inst(row["start_time"], float) if "start_time" in row else None
+                ),
+                end_time=check.opt_inst(row["end_time"], float) if "end_time" in row else None,
+            )
+            for row in rows
+        ]
+
     def get_run_tags(
         self,
         tag_keys: Optional[Sequence[str]] = None,
@@ -468,7 +550,9 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
                 RunsTable.update()
                 .where(RunsTable.c.run_id == run_id)
                 .values(
-                    run_body=serialize_value(run.with_tags(merge_dicts(current_tags, new_tags))),
+                    run_body=serialize_column_value(
+                        self, "runs.run_body", run.with_tags(merge_dicts(current_tags, new_tags))
+                    ),
                     partition=partition,
                     partition_set=partition_set,
                     update_timestamp=pendulum.now("UTC"),
@@ -736,7 +820,17 @@ def migrate(self, print_fn: Optional[PrintFn] = None, force_rebuild_all: bool =
     def optimize(self, print_fn: Optional[PrintFn] = None, force_rebuild_all: bool = False) -> None:
         self._execute_data_migrations(OPTIONAL_DATA_MIGRATIONS, print_fn, force_rebuild_all)
 
+    @cached_property
+    def _schema_cache(self) -> SqlSchemaCache:
+        """Cache of schema introspection results, cleared whenever the storage is upgraded."""
+        return SqlSchemaCache()
+
     def has_built_index(self, migration_name: str) -> bool:
+        return self._schema_cache.has_secondary_index(
+            migration_name, lambda: self._has_built_index(migration_name)
+        )
+
+    def _has_built_index(self, migration_name: str) -> bool:
         query = (
             db_select([1])
             .where(SecondaryIndexMigrationTable.c.name == migration_name)
@@ -761,20 +855,23 @@ def mark_index_built(self, migration_name: str) -> None:
                     .where(SecondaryIndexMigrationTable.c.name == migration_name)
                     .values(migration_completed=datetime.now())
                 )
+        self._schema_cache.invalidate_secondary_index(migration_name)
 
     # Checking for migrations
 
+    def _get_column_names(self, table_name: str) -> AbstractSet[str]:
+        def _fetch() -> AbstractSet[str]:
+            with self.connect() as conn:
+                return get_column_names(conn, table_name)
+
+        return self._schema_cache.get_column_names(table_name, _fetch)
+
     def has_run_stats_index_cols(self) -> bool:
-        with self.connect() as conn:
-            column_names = [x.get("name") for x in db.inspect(conn).get_columns(RunsTable.name)]
-            return "start_time" in column_names and "end_time" in column_names
+        column_names = self._get_column_names(RunsTable.name)
+        return "start_time" in column_names and "end_time" in column_names
 
     def has_bulk_actions_selector_cols(self) -> bool:
-        with self.connect() as conn:
-            column_names = [
-                x.get("name") for x in db.inspect(conn).get_columns(BulkActionsTable.name)
-            ]
-            return "selector_id" in column_names
+        return "selector_id" in self._get_column_names(BulkActionsTable.name)
 
     # Daemon heartbeats
 
@@ -915,7 +1012,9 @@ def replace_job_origin(self, run: DagsterRun, job_origin: ExternalJobOrigin) ->
                 RunsTable.update()
                 .where(RunsTable.c.run_id == run.run_id)
                 .values(
-                    run_body=serialize_value(run.with_job_origin(job_origin)),
+                    run_body=serialize_column_value(
+                        self, "runs.run_body", run.with_job_origin(job_origin)
+                    ),
                 )
             )
             conn.execute(
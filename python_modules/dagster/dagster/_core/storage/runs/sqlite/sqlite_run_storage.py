@@ -117,11 +117,13 @@ def _alembic_upgrade(self, rev: str = "head") -> None:
         alembic_config = get_alembic_config(__file__)
         with self.connect() as conn:
             run_alembic_upgrade(alembic_config, conn, rev=rev)
+        self._schema_cache.clear()
 
     def _alembic_downgrade(self, rev: str = "head") -> None:
         alembic_config = get_alembic_config(__file__)
         with self.connect() as conn:
             run_alembic_downgrade(alembic_config, conn, rev=rev)
+        self._schema_cache.clear()
 
     def upgrade(self) -> None:
         self._check_for_version_066_migration_and_perform()
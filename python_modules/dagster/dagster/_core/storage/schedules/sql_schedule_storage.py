@@ -1,6 +1,7 @@
 from abc import abstractmethod
 from collections import defaultdict
 from datetime import datetime
+from functools import cached_property
 from typing import (
     Any,
     Callable,
@@ -32,7 +33,7 @@
     TickData,
     TickStatus,
 )
-from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow
+from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow, SqlSchemaCache
 from dagster._core.storage.sqlalchemy_compat import db_fetch_mappings, db_select, db_subquery
 from dagster._serdes import serialize_value
 from dagster._serdes.serdes import deserialize_value
@@ -281,12 +282,20 @@ def has_instigators_table(self) -> bool:
             return self._has_instigators_table(conn)
 
     def _has_instigators_table(self, conn: Connection) -> bool:
-        table_names = db.inspect(conn).get_table_names()
-        return "instigators" in table_names
+        return self._has_table(conn, "instigators")
 
     def _has_asset_daemon_asset_evaluations_table(self, conn: Connection) -> bool:
-        table_names = db.inspect(conn).get_table_names()
-        return "asset_daemon_asset_evaluations" in table_names
+        return self._has_table(conn, "asset_daemon_asset_evaluations")
+
+    @cached_property
+    def _schema_cache(self) -> SqlSchemaCache:
+        """Cache of schema introspection results, cleared whenever the storage is upgraded."""
+        return SqlSchemaCache()
+
+    def _has_table(self, conn: Connection, table_name: str) -> bool:
+        return self._schema_cache.has_table(
+            table_name, lambda: table_name in db.inspect(conn).get_table_names()
+        )
 
     def get_batch_ticks(
         self,
@@ -585,12 +594,17 @@ def wipe(self) -> None:
 
     def has_secondary_index_table(self) -> bool:
         with self.connect() as conn:
-            return "secondary_indexes" in db.inspect(conn).get_table_names()
+            return self._has_table(conn, "secondary_indexes")
 
     def has_built_index(self, migration_name: str) -> bool:
         if not self.has_secondary_index_table():
             return False
 
+        return self._schema_cache.has_secondary_index(
+            migration_name, lambda: self._has_built_index(migration_name)
+        )
+
+    def _has_built_index(self, migration_name: str) -> bool:
         query = (
             db_select([1])
             .where(SecondaryIndexMigrationTable.c.name == migration_name)
@@ -616,6 +630,7 @@ def mark_index_built(self, migration_name: str) -> None:
                     .where(SecondaryIndexMigrationTable.c.name == migration_name)
                     .values(migration_completed=datetime.now())
                 )
+        self._schema_cache.invalidate_secondary_index(migration_name)
 
     def _execute_data_migrations(
         self,
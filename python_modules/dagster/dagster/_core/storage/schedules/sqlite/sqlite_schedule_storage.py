@@ -99,6 +99,7 @@ def upgrade(self) -> None:
         alembic_config = get_alembic_config(__file__)
         with self.connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+        self._schema_cache.clear()
 
     def alembic_version(self) -> AlembicVersion:
         alembic_config = get_alembic_config(__file__)
@@ -1,6 +1,6 @@
 import threading
 from functools import lru_cache
-from typing import Any, Optional, Tuple, Union
+from typing import AbstractSet, Any, Callable, Dict, Optional, Tuple, TypeVar, Union
 
 import sqlalchemy as db
 from alembic.command import downgrade, stamp, upgrade
@@ -12,6 +12,8 @@
 from sqlalchemy.ext.compiler import compiles
 from typing_extensions import TypeAlias
 
+from dagster._serdes import serialize_value, serialize_value_compact
+from dagster._serdes.serdes import PackableValue
 from dagster._utils import file_relative_path
 
 create_engine = db.create_engine  # exported
@@ -27,6 +29,8 @@
 
 AlembicVersion: TypeAlias = Tuple[Optional[str], Optional[Union[str, Tuple[str, ...]]]]
 
+T = TypeVar("T")
+
 
 @lru_cache(maxsize=3)  # run, event, and schedule storages
 def get_alembic_config(
@@ -78,6 +82,73 @@ def check_alembic_revision(alembic_config: Config, conn: Connection) -> AlembicV
     return (db_revision, head_revision)
 
 
+class SqlSchemaCache:
+    """Memoizes the results of schema introspection checks made by a SQL storage (whether a table
+    or column exists, whether a secondary index / data migration has been built).
+
+    The schema of a storage only changes through migrations, so these checks can be answered from
+    memory on the hot read/write paths instead of issuing catalog queries on every call. Storages
+    must call `clear` after running schema migrations (`upgrade`), and `invalidate` for any single
+    check whose answer they change (e.g. marking a data migration as complete).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], Any] = {}
+
+    def get(self, key: Tuple[str, ...], fetch: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+
+        # fetch outside of the lock, concurrent misses for the same key resolve to the same value
+        value = fetch()
+        with self._lock:
+            self._values[key] = value
+        return value
+
+    def has_table(self, table_name: str, fetch: Callable[[], bool]) -> bool:
+        return self.get(("table", table_name), fetch)
+
+    def get_column_names(
+        self, table_name: str, fetch: Callable[[], AbstractSet[str]]
+    ) -> AbstractSet[str]:
+        return self.get(("columns", table_name), fetch)
+
+    def has_secondary_index(self, name: str, fetch: Callable[[], bool]) -> bool:
+        return self.get(("secondary_index", name), fetch)
+
+    def invalidate_secondary_index(self, name: str) -> None:
+        self.invalidate(("secondary_index", name))
+
+    def invalidate(self, key: Tuple[str, ...]) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+def serialize_column_value(storage: Any, column: str, value: PackableValue) -> str:
+    """Serialize a value to be written to a `table.column` of a SQL storage.
+
+    Values are JSON serialized, unless the column is listed in the `storage_serialization`
+    `compact_columns` setting of the instance the storage belongs to, in which case the compact
+    serdes encoding is used. Both encodings are read by `deserialize_value`, so a column can be
+    switched between them without migrating existing rows.
+    """
+    if storage.has_instance and (
+        column in storage._instance.compact_serialization_columns  # noqa: SLF001
+    ):
+        return serialize_value_compact(value)
+    return serialize_value(value)
+
+
+def get_column_names(conn: Connection, table_name: str) -> AbstractSet[str]:
+    return {column["name"] for column in db.inspect(conn).get_columns(table_name)}
+
+
 def run_migrations_offline(
     context: EnvironmentContext, config: Config, target_metadata: db.MetaData
 ) -> None:
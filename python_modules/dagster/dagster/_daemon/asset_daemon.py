@@ -766,6 +766,8 @@ def _process_auto_materialize_tick_generator(
                     auto_observe_asset_keys=auto_observe_asset_keys,
                     respect_materialization_data_versions=instance.auto_materialize_respect_materialization_data_versions,
                     logger=self._logger,
+                    num_evaluation_workers=instance.auto_materialize_num_evaluation_workers,
+                    incremental_evaluation=instance.auto_materialize_incremental_evaluation,
                 ).evaluate()
 
                 check.invariant(new_cursor.evaluation_id == evaluation_id)
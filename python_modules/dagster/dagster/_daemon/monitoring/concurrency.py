@@ -35,22 +35,23 @@ def execute_concurrency_slots_iteration(
         return
 
     now = pendulum.now("UTC")
-    run_records = instance.get_run_records(
+    run_projections = instance.get_run_projections(
         filters=RunsFilter(
             run_ids=list(run_ids),
             statuses=FINISHED_STATUSES,
             updated_before=now.subtract(seconds=timeout_seconds),
         ),
+        tag_keys=[],
         limit=RUN_BATCH_SIZE,
     )
-    for run_record in run_records:
-        if run_record.end_time + timeout_seconds < now.timestamp():
+    for run_projection in run_projections:
+        if run_projection.end_time + timeout_seconds < now.timestamp():
             freed_slots = instance.event_log_storage.free_concurrency_slots_for_run(
-                run_record.dagster_run.run_id
+                run_projection.run_id
             )
             if freed_slots:
                 logger.info(
-                    f"Freed {freed_slots} slots for run {run_record.dagster_run.run_id} with status"
-                    f" {run_record.dagster_run.status}"
+                    f"Freed {freed_slots} slots for run {run_projection.run_id} with status"
+                    f" {run_projection.status}"
                 )
         yield
@@ -1,9 +1,13 @@
+import heapq
 import sys
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from contextlib import ExitStack, closing
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import pendulum
 
 from dagster import (
     DagsterEvent,
@@ -25,6 +29,8 @@
     IN_PROGRESS_RUN_STATUSES,
     DagsterRun,
     DagsterRunStatus,
+    RunProjection,
+    RunRecord,
     RunsFilter,
 )
 from dagster._core.storage.tags import PRIORITY_TAG
@@ -37,6 +43,146 @@
 
 PAGE_SIZE = 100
 
+# Runs updated up to this long before the previous refresh of the run queue are read again on the
+# next refresh, so that writes that committed after the refresh are not missed.
+RUN_QUEUE_REFRESH_OVERLAP_SECONDS = 2
+
+# Interval at which the run queue is rebuilt from all queued runs. This evicts runs that were
+# deleted while queued, and picks up any update that was missed because it was timestamped by a
+# lagging clock.
+RUN_QUEUE_RESYNC_INTERVAL_SECONDS = 300
+
+NON_QUEUED_RUN_STATUSES = [
+    status for status in DagsterRunStatus if status != DagsterRunStatus.QUEUED
+]
+
+
+def _get_priority(tags: Mapping[str, str]) -> int:
+    priority_tag_value = tags.get(PRIORITY_TAG, "0")
+    try:
+        return int(priority_tag_value)
+    except ValueError:
+        return 0
+
+
+class QueuedRunEntry(NamedTuple):
+    """The fields of a queued run that determine when it is dequeued."""
+
+    run_id: str
+    # (-priority, storage id): runs are dequeued by priority, then in the order they were created
+    sort_key: Tuple[int, int]
+    tags: Mapping[str, str]
+    location_name: Optional[str]
+
+    @staticmethod
+    def from_run_record(record: RunRecord) -> "QueuedRunEntry":
+        run = record.dagster_run
+        return QueuedRunEntry(
+            run_id=run.run_id,
+            sort_key=(-_get_priority(run.tags), record.storage_id),
+            tags=run.tags,
+            # Very old (pre 0.10.0) runs and programatically submitted runs may not have an
+            # attached code location name
+            location_name=(
+                run.external_job_origin.location_name if run.external_job_origin else None
+            ),
+        )
+
+
+class RunQueue:
+    """In-memory index of the QUEUED runs, kept in a heap in the order in which they should be
+    dequeued.
+
+    The index is built from all queued runs once, and then refreshed incrementally from the runs
+    whose update timestamp changed since the previous refresh, so that each refresh reads only the
+    runs that were enqueued, dequeued or re-tagged in the meantime. It is rebuilt from scratch every
+    RUN_QUEUE_RESYNC_INTERVAL_SECONDS.
+    """
+
+    def __init__(self, page_size: int = PAGE_SIZE):
+        self._page_size = page_size
+        self._entries: Dict[str, QueuedRunEntry] = {}
+        # may contain outdated items for runs that were removed or whose sort key changed, which
+        # are skipped when iterating
+        self._heap: List[Tuple[Tuple[int, int], str]] = []
+        self._last_refresh_timestamp: Optional[datetime] = None
+        self._last_resync_time = float("-inf")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def refresh(self, instance: DagsterInstance) -> None:
+        refresh_timestamp = pendulum.now("UTC")
+
+        if (
+            self._last_refresh_timestamp is None
+            or time.time() - self._last_resync_time >= RUN_QUEUE_RESYNC_INTERVAL_SECONDS
+        ):
+            self._entries = {}
+            self._heap = []
+            self._last_resync_time = time.time()
+            updated_after = None
+        else:
+            updated_after = self._last_refresh_timestamp - timedelta(
+                seconds=RUN_QUEUE_REFRESH_OVERLAP_SECONDS
+            )
+            self.remove(
+                instance.get_run_ids(
+                    RunsFilter(statuses=NON_QUEUED_RUN_STATUSES, updated_after=updated_after)
+                )
+            )
+
+        cursor = None
+        while True:
+            records = instance.get_run_records(
+                RunsFilter(statuses=[DagsterRunStatus.QUEUED], updated_after=updated_after),
+                cursor=cursor,
+                limit=self._page_size,
+                ascending=True,
+            )
+            for record in records:
+                self._add(QueuedRunEntry.from_run_record(record))
+            if len(records) < self._page_size:
+                break
+            cursor = records[-1].dagster_run.run_id
+
+        self._last_refresh_timestamp = refresh_timestamp
+
+        if len(self._heap) > 2 * len(self._entries) + self._page_size:
+            self._heap = [(entry.sort_key, run_id) for run_id, entry in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def _add(self, entry: QueuedRunEntry) -> None:
+        existing_entry = self._entries.get(entry.run_id)
+        self._entries[entry.run_id] = entry
+        if existing_entry is None or existing_entry.sort_key != entry.sort_key:
+            heapq.heappush(self._heap, (entry.sort_key, entry.run_id))
+
+    def remove(self, run_ids: Iterable[str]) -> None:
+        for run_id in run_ids:
+            self._entries.pop(run_id, None)
+
+    def iter_entries(self) -> Iterator[QueuedRunEntry]:
+        """Yields the queued runs in the order in which they should be dequeued, taking only as
+        many runs off the heap as are consumed. The queue must not be refreshed before the iterator
+        is closed, which puts the runs back.
+        """
+        popped = []
+        try:
+            while self._heap:
+                sort_key, run_id = heapq.heappop(self._heap)
+                entry = self._entries.get(run_id)
+                if entry is None or entry.sort_key != sort_key:
+                    continue
+                # a run that is removed and added again with the same sort key has two items
+                if popped and popped[-1] == (sort_key, run_id):
+                    continue
+                popped.append((sort_key, run_id))
+                yield entry
+        finally:
+            for item in popped:
+                heapq.heappush(self._heap, item)
+
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
     """Used with the QueuedRunCoordinator on the instance. This process finds queued runs from the run
@@ -49,6 +195,7 @@ def __init__(self, interval_seconds, page_size=PAGE_SIZE) -> None:
         self._location_timeouts_lock = threading.Lock()
         self._location_timeouts: Dict[str, float] = {}
         self._page_size = page_size
+        self._run_queue = RunQueue(page_size)
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -196,7 +343,10 @@ def _get_runs_to_dequeue(
         max_concurrent_runs = run_queue_config.max_concurrent_runs
         tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
-        in_progress_runs = self._get_in_progress_runs(instance)
+        in_progress_runs = self._get_in_progress_runs(
+            instance,
+            tag_keys=sorted({limit["key"] for limit in tag_concurrency_limits or []}),
+        )
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
         max_runs_to_launch = max_concurrent_runs - len(in_progress_runs)
@@ -210,10 +360,6 @@ def _get_runs_to_dequeue(
                 )
                 return []
 
-        cursor = None
-        has_more = True
-        batch: List[DagsterRun] = []
-
         now = fixed_iteration_time or time.time()
 
         with self._location_timeouts_lock:
@@ -233,65 +379,50 @@ def _get_runs_to_dequeue(
             "Priority sorting and checking tag concurrency limits for queued runs."
             + locations_clause
         )
-        # Paginate through our runs list so we don't need to hold every run
-        # in memory at once. The maximum number of runs we'll hold in memory is
-        # max_runs_to_launch + page_size.
-        while has_more:
-            queued_runs = instance.get_runs(
-                RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
-                cursor=cursor,
-                limit=self._page_size,
-                ascending=True,
-            )
-            has_more = len(queued_runs) >= self._page_size
-
-            if not queued_runs:
-                has_more = False
-                return batch
 
-            cursor = queued_runs[-1].run_id
+        self._run_queue.refresh(instance)
 
-            tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
-                tag_concurrency_limits, in_progress_runs
-            )
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
+            tag_concurrency_limits, in_progress_runs
+        )
 
-            batch += queued_runs
-            batch = self._priority_sort(batch)
+        # Walk the queue in priority order, only as far as needed to find the runs to launch
+        to_launch: List[QueuedRunEntry] = []
+        with closing(self._run_queue.iter_entries()) as entries:
+            for entry in entries:
+                if tag_concurrency_limits_counter.is_blocked(entry):
+                    continue
 
-            to_remove = []
-            for run in batch:
-                if tag_concurrency_limits_counter.is_blocked(run):
-                    to_remove.append(run)
-                else:
-                    tag_concurrency_limits_counter.update_counters_with_launched_item(run)
-
-                location_name = (
-                    run.external_job_origin.location_name if run.external_job_origin else None
-                )
-                if location_name and location_name in paused_location_names:
-                    to_remove.append(run)
+                tag_concurrency_limits_counter.update_counters_with_launched_item(entry)
 
-            for run in to_remove:
-                batch.remove(run)
+                if entry.location_name and entry.location_name in paused_location_names:
+                    continue
 
-            if max_runs_to_launch >= 1:
-                batch = batch[:max_runs_to_launch]
+                to_launch.append(entry)
+                if max_concurrent_runs_enabled and len(to_launch) >= max_runs_to_launch:
+                    break
 
-        return batch
-
-    def _get_in_progress_runs(self, instance: DagsterInstance) -> Sequence[DagsterRun]:
-        return instance.get_runs(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
+        # Read the runs to launch, dropping any that left the queue since the last refresh
+        runs_by_id: Dict[str, DagsterRun] = {}
+        for i in range(0, len(to_launch), self._page_size):
+            run_ids = [entry.run_id for entry in to_launch[i : i + self._page_size]]
+            for run in instance.get_runs(
+                RunsFilter(run_ids=run_ids, statuses=[DagsterRunStatus.QUEUED])
+            ):
+                runs_by_id[run.run_id] = run
+        self._run_queue.remove(
+            entry.run_id for entry in to_launch if entry.run_id not in runs_by_id
+        )
 
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> List[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
+        return [runs_by_id[entry.run_id] for entry in to_launch if entry.run_id in runs_by_id]
 
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
+    def _get_in_progress_runs(
+        self, instance: DagsterInstance, tag_keys: Sequence[str]
+    ) -> Sequence[RunProjection]:
+        # only the tags that concurrency limits apply to are needed, so skip reading the run bodies
+        return instance.get_run_projections(
+            filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES), tag_keys=tag_keys
+        )
 
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
@@ -1,5 +1,7 @@
+import atexit
 import os
 import sys
+import threading
 from contextlib import contextmanager
 from threading import Event
 from typing import Any, Dict, Iterator, NoReturn, Optional, Sequence, Tuple, Type, cast
@@ -38,6 +40,7 @@
     default_repository_grpc_timeout,
     default_schedule_grpc_timeout,
     default_sensor_grpc_timeout,
+    grpc_keepalive_time_ms,
     max_rx_bytes,
     max_send_bytes,
 )
@@ -50,6 +53,76 @@
 DEFAULT_REPOSITORY_GRPC_TIMEOUT = default_repository_grpc_timeout()
 
 
+GRPC_KEEPALIVE_TIMEOUT_MS = 20 * 1000
+GRPC_MAX_RECONNECT_BACKOFF_MS = 5 * 1000
+
+_channels: Dict[Tuple[str, bool], grpc.Channel] = {}
+_channels_lock = threading.Lock()
+_channels_pid = os.getpid()
+
+
+def _get_channel(server_address: str, use_ssl: bool) -> grpc.Channel:
+    """Returns the long-lived channel to the given server shared by all clients in this process,
+    creating it if needed. Channels are thread-safe and reconnect to the server as needed, so
+    reusing them avoids setting up a connection for every call.
+    """
+    global _channels_pid  # noqa: PLW0603
+
+    with _channels_lock:
+        if _channels_pid != os.getpid():
+            # channels cannot be used across a fork, so a child process opens its own
+            _channels.clear()
+            _channels_pid = os.getpid()
+
+        channel = _channels.get((server_address, use_ssl))
+        if channel is None:
+            options = [
+                ("grpc.max_receive_message_length", max_rx_bytes()),
+                ("grpc.max_send_message_length", max_send_bytes()),
+                ("grpc.keepalive_time_ms", grpc_keepalive_time_ms()),
+                ("grpc.keepalive_timeout_ms", GRPC_KEEPALIVE_TIMEOUT_MS),
+                ("grpc.max_reconnect_backoff_ms", GRPC_MAX_RECONNECT_BACKOFF_MS),
+            ]
+            channel = (
+                grpc.secure_channel(
+                    server_address,
+                    grpc.ssl_channel_credentials(),
+                    options=options,
+                    compression=grpc.Compression.Gzip,
+                )
+                if use_ssl
+                else grpc.insecure_channel(
+                    server_address,
+                    options=options,
+                    compression=grpc.Compression.Gzip,
+                )
+            )
+            _channels[(server_address, use_ssl)] = channel
+        return channel
+
+
+def _discard_channel(server_address: str, use_ssl: bool, channel: grpc.Channel) -> None:
+    """Closes a shared channel and removes it from the cache, unless it was already replaced, so
+    that the next call to the server opens a new connection.
+    """
+    with _channels_lock:
+        if _channels_pid == os.getpid() and _channels.get((server_address, use_ssl)) is channel:
+            del _channels[(server_address, use_ssl)]
+            channel.close()
+
+
+def close_grpc_channels() -> None:
+    """Closes all of the channels shared by gRPC clients in this process."""
+    with _channels_lock:
+        if _channels_pid == os.getpid():
+            for channel in _channels.values():
+                channel.close()
+        _channels.clear()
+
+
+atexit.register(close_grpc_channels)
+
+
 def client_heartbeat_thread(client: "DagsterGrpcClient", shutdown_event: Event) -> None:
     while True:
         shutdown_event.wait(CLIENT_HEARTBEAT_INTERVAL)
@@ -77,8 +150,6 @@ def __init__(
         self.host = check.opt_str_param(host, "host")
         self._use_ssl = check.bool_param(use_ssl, "use_ssl")
 
-        self._ssl_creds = grpc.ssl_channel_credentials() if use_ssl else None
-
         self._metadata = check.opt_sequence_param(metadata, "metadata")
 
         check.invariant(
@@ -110,35 +181,40 @@ def use_ssl(self) -> bool:
 
     @contextmanager
     def _channel(self) -> Iterator[grpc.Channel]:
-        options = [
-            ("grpc.max_receive_message_length", max_rx_bytes()),
-            ("grpc.max_send_message_length", max_send_bytes()),
-        ]
-        with (
-            grpc.secure_channel(
-                self._server_address,
-                self._ssl_creds,
-                options=options,
-                compression=grpc.Compression.Gzip,
-            )
-            if self._use_ssl
-            else grpc.insecure_channel(
-                self._server_address,
-                options=options,
-                compression=grpc.Compression.Gzip,
-            )
-        ) as channel:
+        channel = _get_channel(self._server_address, self._use_ssl)
+        try:
             yield channel
+        except grpc.RpcError as e:
+            # start over with a new connection after the server becomes unavailable, rather than
+            # waiting for the shared channel to reconnect
+            if e.code() == grpc.StatusCode.UNAVAILABLE:  # type: ignore  # (bad stubs)
+                _discard_channel(self._server_address, self._use_ssl, channel)
+            raise
+
+    def close_channel(self) -> None:
+        """Closes the channel to the server shared by the clients in this process, e.g. after the
+        server has been shut down. The next call to the server opens a new channel.
+        """
+        with _channels_lock:
+            channel = _channels.get((self._server_address, self._use_ssl))
+        if channel is not None:
+            _discard_channel(self._server_address, self._use_ssl, channel)
 
     def _get_response(
         self,
         method: str,
         request: google.protobuf.message.Message,
         timeout: int = DEFAULT_GRPC_TIMEOUT,
+        compress: bool = True,
     ):
         with self._channel() as channel:
             stub = DagsterApiStub(channel)
-            return getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            return getattr(stub, method)(
+                request,
+                metadata=self._metadata,
+                timeout=timeout,
+                compression=None if compress else grpc.Compression.NoCompression,
+            )
 
     def _raise_grpc_exception(
         self,
@@ -165,10 +241,13 @@ def _query(
         request_type: Type[google.protobuf.message.Message],
         timeout: int = DEFAULT_GRPC_TIMEOUT,
         custom_timeout_message: Optional[str] = None,
+        compress: bool = True,
         **kwargs,
     ):
         try:
-            return self._get_response(method, request=request_type(**kwargs), timeout=timeout)
+            return self._get_response(
+                method, request=request_type(**kwargs), timeout=timeout, compress=compress
+            )
         except Exception as e:
             self._raise_grpc_exception(
                 e, timeout=timeout, custom_timeout_message=custom_timeout_message
@@ -203,7 +282,7 @@ def _streaming_query(
 
     def ping(self, echo: str) -> Dict[str, Any]:
         check.str_param(echo, "echo")
-        res = self._query("Ping", api_pb2.PingRequest, echo=echo)
+        res = self._query("Ping", api_pb2.PingRequest, compress=False, echo=echo)
         return {
             "echo": res.echo,
             "serialized_server_utilization_metrics": res.serialized_server_utilization_metrics,
@@ -211,7 +290,7 @@ def ping(self, echo: str) -> Dict[str, Any]:
 
     def heartbeat(self, echo: str = "") -> str:
         check.str_param(echo, "echo")
-        res = self._query("Heartbeat", api_pb2.PingRequest, echo=echo)
+        res = self._query("Heartbeat", api_pb2.PingRequest, compress=False, echo=echo)
         return res.echo
 
     def streaming_ping(self, sequence_length: int, echo: str) -> Iterator[dict]:
@@ -230,7 +309,7 @@ def streaming_ping(self, sequence_length: int, echo: str) -> Iterator[dict]:
             }
 
     def get_server_id(self, timeout: int = DEFAULT_GRPC_TIMEOUT) -> str:
-        res = self._query("GetServerId", api_pb2.Empty, timeout=timeout)
+        res = self._query("GetServerId", api_pb2.Empty, timeout=timeout, compress=False)
         return res.server_id
 
     def execution_plan_snapshot(
@@ -499,7 +578,10 @@ def external_notebook_data(self, notebook_path: str) -> bytes:
         return res.content
 
     def shutdown_server(self, timeout: int = 15) -> str:
-        res = self._query("ShutdownServer", api_pb2.Empty, timeout=timeout)
+        try:
+            res = self._query("ShutdownServer", api_pb2.Empty, timeout=timeout, compress=False)
+        finally:
+            self.close_channel()
         return res.serialized_shutdown_server_result
 
     def cancel_execution(self, cancel_execution_request: CancelExecutionRequest) -> str:
@@ -561,11 +643,11 @@ def start_run(self, execute_run_args: ExecuteExternalJobArgs) -> str:
                 raise
 
     def get_current_image(self) -> str:
-        res = self._query("GetCurrentImage", api_pb2.Empty)
+        res = self._query("GetCurrentImage", api_pb2.Empty, compress=False)
         return res.serialized_current_image
 
     def get_current_runs(self) -> str:
-        res = self._query("GetCurrentRuns", api_pb2.Empty)
+        res = self._query("GetCurrentRuns", api_pb2.Empty, compress=False)
         return res.serialized_current_runs
 
     def health_check_query(self):
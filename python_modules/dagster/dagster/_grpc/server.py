@@ -60,6 +60,7 @@
 from dagster._core.workspace.autodiscovery import LoadableTarget
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._serdes.ipc import IPCErrorMessage, open_ipc_subprocess
+from dagster._serdes.utils import hash_str
 from dagster._utils import (
     find_free_port,
     get_run_crash_explanation,
@@ -228,6 +229,10 @@ def __init__(
         self._repo_defs_by_name: Dict[str, RepositoryDefinition] = {}
         self._loadable_repository_symbols: List[LoadableRepositorySymbol] = []
 
+        self._serialized_external_repository_data: Dict[Tuple[str, bool], str] = {}
+        self._serialized_external_repository_data_lock = threading.Lock()
+        self._external_repository_snapshot_ids: Dict[str, str] = {}
+
         if not loadable_target_origin:
             # empty workspace
             return
@@ -291,6 +296,35 @@ def definitions_by_name(self) -> Mapping[str, RepositoryDefinition]:
     def reconstructables_by_name(self) -> Mapping[str, ReconstructableRepository]:
         return self._recon_repos_by_name
 
+    def get_serialized_external_repository_data(
+        self, repository_name: str, defer_snapshots: bool
+    ) -> str:
+        """Returns the serialized ExternalRepositoryData for a loaded repository. Building and
+        serializing the snapshot of a large repository is expensive, and the loaded definitions
+        never change, so it is only done once for each value of `defer_snapshots` and then cached.
+        """
+        key = (repository_name, defer_snapshots)
+        # only one request computes the snapshot, concurrent requests wait for it
+        with self._serialized_external_repository_data_lock:
+            if key not in self._serialized_external_repository_data:
+                self._serialized_external_repository_data[key] = serialize_value(
+                    external_repository_data_from_def(
+                        self._repo_defs_by_name[repository_name],
+                        defer_snapshots=defer_snapshots,
+                    )
+                )
+            return self._serialized_external_repository_data[key]
+
+    def get_external_repository_snapshot_id(self, repository_name: str) -> str:
+        """Returns a hash of the serialized ExternalRepositoryData (with snapshots) for a loaded
+        repository, which clients use to tell whether a copy they already have is up to date.
+        """
+        if repository_name not in self._external_repository_snapshot_ids:
+            self._external_repository_snapshot_ids[repository_name] = hash_str(
+                self.get_serialized_external_repository_data(repository_name, defer_snapshots=False)
+            )
+        return self._external_repository_snapshot_ids[repository_name]
+
 
 def _get_code_pointer(
     loadable_target_origin: LoadableTargetOrigin,
@@ -500,6 +534,22 @@ def _clear_run(self, run_id: str) -> None:
         if run_id in self._termination_times:
             del self._termination_times[run_id]
 
+    def _get_external_repository_snapshot_ids(
+        self, loaded_repositories: LoadedRepositories
+    ) -> Mapping[str, str]:
+        snapshot_ids = {}
+        for repository_name in loaded_repositories.definitions_by_name:
+            try:
+                snapshot_ids[repository_name] = (
+                    loaded_repositories.get_external_repository_snapshot_id(repository_name)
+                )
+            except Exception:
+                # clients fetch the repository without a snapshot id, and get the error then
+                self._logger.exception(
+                    f"Error while computing the snapshot of repository {repository_name}"
+                )
+        return snapshot_ids
+
     def _get_repo_for_origin(
         self,
         external_repo_origin: ExternalRepositoryOrigin,
@@ -594,6 +644,9 @@ def ListRepositories(
                     container_image=self._container_image,
                     container_context=self._container_context,
                     dagster_library_versions=DagsterLibraryRegistry.get(),
+                    repository_snapshot_ids=self._get_external_repository_snapshot_ids(
+                        loaded_repositories
+                    ),
                 )
             )
         except Exception:
@@ -762,11 +815,12 @@ def _get_serialized_external_repository_data(
                 ExternalRepositoryOrigin,
             )
 
-            return serialize_value(
-                external_repository_data_from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
-                )
+            # raises if the repository is not loaded
+            self._get_repo_for_origin(repository_origin)
+            loaded_repos = check.not_none(self._loaded_repositories)
+            return loaded_repos.get_serialized_external_repository_data(
+                repository_origin.repository_name,
+                defer_snapshots=request.defer_snapshots,
             )
         except Exception:
             return serialize_value(
@@ -324,9 +324,15 @@ class ListRepositoriesResponse(
             ("container_image", Optional[str]),
             ("container_context", Optional[Mapping[str, Any]]),
             ("dagster_library_versions", Optional[Mapping[str, str]]),
+            ("repository_snapshot_ids", Optional[Mapping[str, str]]),
         ],
     )
 ):
+    """`repository_snapshot_ids` holds a content hash of the serialized ExternalRepositoryData
+    of each repository, so that clients can reuse a copy of the data they already have instead of
+    fetching it again. It is not set by older servers.
+    """
+
     def __new__(
         cls,
         repository_symbols: Sequence[LoadableRepositorySymbol],
@@ -336,6 +342,7 @@ def __new__(
         container_image: Optional[str] = None,
         container_context: Optional[Mapping] = None,
         dagster_library_versions: Optional[Mapping[str, str]] = None,
+        repository_snapshot_ids: Optional[Mapping[str, str]] = None,
     ):
         return super(ListRepositoriesResponse, cls).__new__(
             cls,
@@ -363,6 +370,9 @@ def __new__(
             dagster_library_versions=check.opt_nullable_mapping_param(
                 dagster_library_versions, "dagster_library_versions"
             ),
+            repository_snapshot_ids=check.opt_nullable_mapping_param(
+                repository_snapshot_ids, "repository_snapshot_ids", key_type=str, value_type=str
+            ),
         )
 
 
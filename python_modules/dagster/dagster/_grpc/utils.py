@@ -81,6 +81,15 @@ def max_send_bytes() -> int:
     return 50 * (10**6)
 
 
+def grpc_keepalive_time_ms() -> int:
+    env_set = os.getenv("DAGSTER_GRPC_KEEPALIVE_TIME_MS")
+    if env_set:
+        return int(env_set)
+
+    # default 5 minutes, the most frequent keepalive pings that gRPC servers accept by default
+    return 5 * 60 * 1000
+
+
 def default_grpc_timeout() -> int:
     env_set = os.getenv("DAGSTER_GRPC_TIMEOUT_SECONDS")
     if env_set:
@@ -11,6 +11,7 @@
     deserialize_value as deserialize_value,
     pack_value as pack_value,
     serialize_value as serialize_value,
+    serialize_value_compact as serialize_value_compact,
     unpack_value as unpack_value,
     whitelist_for_serdes as whitelist_for_serdes,
 )
@@ -1,3 +1,6 @@
+from typing import List
+
+
 class SerdesUsageError(Exception):
     pass
 
@@ -8,3 +11,26 @@ class DeserializationError(Exception):
 
 class SerializationError(Exception):
     pass
+
+
+class DescentPathSerializationError(SerializationError):
+    """Raised when a value nested inside the value being packed cannot be serialized. The descent
+    path to the offending value is assembled as the error propagates out of `pack_value`.
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+        self.root = ""
+        # innermost segment first
+        self._path_segments: List[str] = []
+
+    def add_path_segment(self, segment: str) -> None:
+        self._path_segments.append(segment)
+
+    @property
+    def descent_path(self) -> str:
+        return self.root + "".join(reversed(self._path_segments))
+
+    def __str__(self) -> str:
+        return f"{self.message}\nDescent path: {self.descent_path}"
@@ -12,12 +12,14 @@
 * This isn't meant to replace pickle in the conditions that pickle is reasonable to use
   (in memory, not human readable, etc) just handle the json case effectively.
 """
+import base64
 import collections.abc
 import dataclasses
+import zlib
 from abc import ABC, abstractmethod
 from dataclasses import is_dataclass
 from enum import Enum
-from functools import partial
+from functools import cached_property, partial
 from inspect import Parameter, signature
 from typing import (
     AbstractSet,
@@ -50,7 +52,12 @@
 from dagster._utils.cached_method import cached_method
 from dagster._utils.warnings import disable_dagster_warnings
 
-from .errors import DeserializationError, SerdesUsageError, SerializationError
+from .errors import (
+    DescentPathSerializationError,
+    DeserializationError,
+    SerdesUsageError,
+    SerializationError,
+)
 
 ###################################################################################################
 # Types
@@ -542,6 +549,27 @@ def unpack(
         whitelist_map: WhitelistMap,
         context: UnpackContext,
     ) -> T:
+        unpack_fields = self._compiled_unpack_fields
+        if unpack_fields is not None:
+            unpacked: Dict[str, PackableValue] = {}
+            for key, value in unpacked_dict.items():
+                field = unpack_fields.get(key)
+                if field is None:
+                    context.clear_ignored_unknown_values(value)
+                    continue
+                loaded_name, custom = field
+                if custom:
+                    unpacked[loaded_name] = custom.unpack(
+                        value,
+                        whitelist_map=whitelist_map,
+                        context=context,
+                    )
+                elif context.observed_unknown_serdes_values:
+                    unpacked[loaded_name] = context.assert_no_unknown_values(value)
+                else:
+                    unpacked[loaded_name] = cast(PackableValue, value)
+            return self.klass(**unpacked)
+
         try:
             unpacked_dict = self.before_unpack(context, unpacked_dict)
             unpacked: Dict[str, PackableValue] = {}
@@ -575,6 +603,35 @@ def unpack(
                 context.clear_ignored_unknown_values(unpacked_dict)
             return value
 
+    @cached_property
+    def _compiled_unpack_fields(
+        self,
+    ) -> Optional[Mapping[str, Tuple[str, Optional["FieldSerializer"]]]]:
+        """Maps each storage field name that is loaded by the constructor to the loaded field name
+        and its custom field serializer, if any. Computed once per serializer so that `unpack` does
+        not need to resolve field names for every object. None if the serializer overrides any of
+        the unpack hooks, in which case the generic unpack path is used.
+        """
+        serializer_class = type(self)
+        if (
+            serializer_class.before_unpack is not ObjectSerializer.before_unpack
+            or serializer_class.handle_unpack_error is not ObjectSerializer.handle_unpack_error
+        ):
+            return None
+
+        param_names = set(self.constructor_param_names)
+        loaded_names = {name: name for name in param_names}
+        for storage_name, loaded_name in self.loaded_field_names.items():
+            if loaded_name in param_names:
+                loaded_names[storage_name] = loaded_name
+            else:
+                loaded_names.pop(storage_name, None)
+
+        return {
+            storage_name: (loaded_name, self.field_serializers.get(loaded_name))
+            for storage_name, loaded_name in loaded_names.items()
+        }
+
     # Hook: Modify the contents of the unpacked dict before domain object construction during
     # deserialization.
     def before_unpack(
@@ -602,23 +659,28 @@ def pack(
     ) -> Dict[str, JsonSerializableValue]:
         packed: Dict[str, JsonSerializableValue] = {}
         packed["__class__"] = self.get_storage_name()
-        for key, inner_value in self.object_as_mapping(self.before_pack(value)).items():
-            if key in self.skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
-                continue
-            storage_key = self.storage_field_names.get(key, key)
-            custom = self.field_serializers.get(key)
-            if custom:
-                packed[storage_key] = custom.pack(
-                    inner_value,
-                    whitelist_map=whitelist_map,
-                    descent_path=f"{descent_path}.{key}",
-                )
-            else:
-                packed[storage_key] = _pack_value(
-                    inner_value,
-                    whitelist_map=whitelist_map,
-                    descent_path=f"{descent_path}.{key}",
-                )
+        key = None
+        try:
+            for key, inner_value in self.object_as_mapping(self.before_pack(value)).items():
+                if key in self.skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
+                    continue
+                storage_key = self.storage_field_names.get(key, key)
+                custom = self.field_serializers.get(key)
+                if custom:
+                    packed[storage_key] = custom.pack(
+                        inner_value,
+                        whitelist_map=whitelist_map,
+                        descent_path=descent_path,
+                    )
+                else:
+                    packed[storage_key] = _pack_value(
+                        inner_value,
+                        whitelist_map=whitelist_map,
+                        descent_path=descent_path,
+                    )
+        except DescentPathSerializationError as e:
+            e.add_path_segment(f".{key}")
+            raise
         for key, default in self.old_fields.items():
             packed[key] = default
         packed = self.after_pack(**packed)
@@ -649,6 +711,67 @@ class NamedTupleSerializer(ObjectSerializer[T_NamedTuple]):
     def object_as_mapping(self, value: T_NamedTuple) -> Mapping[str, Any]:
         return value._asdict()
 
+    def pack(
+        self,
+        value: T_NamedTuple,
+        whitelist_map: WhitelistMap,
+        descent_path: str,
+    ) -> Dict[str, JsonSerializableValue]:
+        pack_fields = self._compiled_pack_fields
+        # instances of subclasses may have additional fields
+        if pack_fields is None or type(value) is not self.klass:
+            return super().pack(value, whitelist_map, descent_path)
+
+        packed: Dict[str, JsonSerializableValue] = {"__class__": self.get_storage_name()}
+        name = None
+        try:
+            for (name, storage_key, skip_when_empty, custom), inner_value in zip(
+                pack_fields, value
+            ):
+                if skip_when_empty and inner_value in EMPTY_VALUES_TO_SKIP:
+                    continue
+                if custom:
+                    packed[storage_key] = custom.pack(
+                        inner_value,
+                        whitelist_map=whitelist_map,
+                        descent_path=descent_path,
+                    )
+                else:
+                    packed[storage_key] = _pack_value(inner_value, whitelist_map, descent_path)
+        except DescentPathSerializationError as e:
+            e.add_path_segment(f".{name}")
+            raise
+        for key, default in self.old_fields.items():
+            packed[key] = default
+        return packed
+
+    @cached_property
+    def _compiled_pack_fields(
+        self,
+    ) -> Optional[Sequence[Tuple[str, str, bool, Optional["FieldSerializer"]]]]:
+        """The name, storage name, whether to skip when empty, and custom field serializer (if any)
+        of each field of the namedtuple, in field order. Computed once per serializer so that `pack`
+        can iterate over the tuple directly instead of building a dict of its fields. None if the
+        serializer overrides any of the pack hooks, in which case the generic pack path is used.
+        """
+        serializer_class = type(self)
+        if (
+            serializer_class.before_pack is not ObjectSerializer.before_pack
+            or serializer_class.after_pack is not ObjectSerializer.after_pack
+            or serializer_class.object_as_mapping is not NamedTupleSerializer.object_as_mapping
+        ):
+            return None
+
+        return [
+            (
+                field,
+                self.storage_field_names.get(field, field),
+                field in self.skip_when_empty_fields,
+                self.field_serializers.get(field),
+            )
+            for field in self.klass._fields
+        ]
+
     @property
     @cached_method
     def constructor_param_names(self) -> Sequence[str]:
@@ -744,6 +867,46 @@ def serialize_value(
     return seven.json.dumps(packed_value, **json_kwargs)
 
 
+# Values serialized with `serialize_value_compact` are prefixed with a header of the form
+# `dgz<version>:`. JSON text never starts with `dgz`, so compact and JSON values can be stored in the
+# same column and told apart on read.
+COMPACT_SERIALIZATION_PREFIX: Final[str] = "dgz"
+COMPACT_SERIALIZATION_VERSION: Final[int] = 1
+
+
+def serialize_value_compact(
+    val: PackableValue,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> str:
+    """Serialize an object to a compact, versioned string.
+
+    The object is serialized to JSON as in `serialize_value`, then zlib-compressed and base64
+    encoded, so that the result can still be stored in text columns. `deserialize_value` detects
+    and decodes values in this format transparently.
+    """
+    json_str = serialize_value(val, whitelist_map=whitelist_map, separators=(",", ":"))
+    payload = base64.b64encode(zlib.compress(json_str.encode("utf-8"))).decode("ascii")
+    return f"{COMPACT_SERIALIZATION_PREFIX}{COMPACT_SERIALIZATION_VERSION}:{payload}"
+
+
+def is_compact_serialized_value(val: str) -> bool:
+    return val.startswith(COMPACT_SERIALIZATION_PREFIX)
+
+
+def _decode_compact_value(val: str) -> str:
+    header, sep, payload = val.partition(":")
+    version = header[len(COMPACT_SERIALIZATION_PREFIX) :]
+    if not sep or version != str(COMPACT_SERIALIZATION_VERSION):
+        raise DeserializationError(
+            f"Unsupported compact serialization header {header!r}, expected"
+            f" {COMPACT_SERIALIZATION_PREFIX}{COMPACT_SERIALIZATION_VERSION}"
+        )
+    try:
+        return zlib.decompress(base64.b64decode(payload)).decode("utf-8")
+    except (ValueError, zlib.error) as e:
+        raise DeserializationError(f"Could not decode compact serialized value: {e}") from e
+
+
 @overload
 def pack_value(
     val: T_Scalar,
@@ -793,9 +956,17 @@ def pack_value(
         * frozenset
     """
     descent_path = _root(val) if descent_path is None else descent_path
-    return _pack_value(val, whitelist_map=whitelist_map, descent_path=descent_path)
+    try:
+        return _pack_value(val, whitelist_map=whitelist_map, descent_path=descent_path)
+    except DescentPathSerializationError as e:
+        # the outermost call to pack_value determines the root of the reported descent path
+        e.root = descent_path
+        raise
 
 
+# The descent path to each packed value is only reported in serialization errors, so rather than
+# building it up as a string for every value that is packed, _pack_value passes descent_path through
+# unchanged and path segments are added to a DescentPathSerializationError as it propagates out.
 def _pack_value(
     val: PackableValue,
     whitelist_map: WhitelistMap,
@@ -806,32 +977,37 @@ def _pack_value(
     if tval in (int, float, str, bool) or val is None:
         return cast(JsonSerializableValue, val)
     if tval is list:
-        return [
-            _pack_value(item, whitelist_map, f"{descent_path}[{idx}]")
-            for idx, item in enumerate(cast(list, val))
-        ]
+        packed_list = []
+        try:
+            for item in cast(list, val):
+                packed_list.append(_pack_value(item, whitelist_map, descent_path))
+        except DescentPathSerializationError as e:
+            e.add_path_segment(f"[{len(packed_list)}]")
+            raise
+        return packed_list
     if tval is dict:
-        return {
-            key: _pack_value(value, whitelist_map, f"{descent_path}.{key}")
-            for key, value in cast(dict, val).items()
-        }
+        return _pack_dict(cast(dict, val), whitelist_map, descent_path)
     if tval is SerializableNonScalarKeyMapping:
-        return {
-            "__mapping_items__": [
-                [
-                    _pack_value(k, whitelist_map, f"{descent_path}.{k}"),
-                    _pack_value(v, whitelist_map, f"{descent_path}.{k}"),
-                ]
-                for k, v in cast(dict, val).items()
-            ]
-        }
+        packed_items = []
+        k = None
+        try:
+            for k, v in cast(dict, val).items():
+                packed_items.append(
+                    [
+                        _pack_value(k, whitelist_map, descent_path),
+                        _pack_value(v, whitelist_map, descent_path),
+                    ]
+                )
+        except DescentPathSerializationError as e:
+            e.add_path_segment(f".{k}")
+            raise
+        return {"__mapping_items__": packed_items}
 
     if isinstance(val, Enum):
         klass_name = val.__class__.__name__
         if not whitelist_map.has_enum_entry(klass_name):
-            raise SerializationError(
-                "Can only serialize whitelisted Enums, received"
-                f" {klass_name}.\nDescent path: {descent_path}",
+            raise DescentPathSerializationError(
+                f"Can only serialize whitelisted Enums, received {klass_name}."
             )
         enum_serializer = whitelist_map.get_enum_entry(klass_name)
         return {"__enum__": enum_serializer.pack(val, whitelist_map, descent_path)}
@@ -842,27 +1018,15 @@ def _pack_value(
     ):
         klass_name = val.__class__.__name__
         if not whitelist_map.has_object_serializer(klass_name):
-            raise SerializationError(
-                "Can only serialize whitelisted namedtuples, received"
-                f" {val}.\nDescent path: {descent_path}",
+            raise DescentPathSerializationError(
+                f"Can only serialize whitelisted namedtuples, received {val}."
             )
         serializer = whitelist_map.get_object_serializer(klass_name)
         return serializer.pack(val, whitelist_map, descent_path)
     if isinstance(val, set):
-        set_path = descent_path + "{}"
-        return {
-            "__set__": [
-                _pack_value(item, whitelist_map, set_path) for item in sorted(list(val), key=str)
-            ]
-        }
+        return {"__set__": _pack_set_items(val, whitelist_map, descent_path)}
     if isinstance(val, frozenset):
-        frz_set_path = descent_path + "{}"
-        return {
-            "__frozenset__": [
-                _pack_value(item, whitelist_map, frz_set_path)
-                for item in sorted(list(val), key=str)
-            ]
-        }
+        return {"__frozenset__": _pack_set_items(val, whitelist_map, descent_path)}
 
     # custom string subclasses
     if isinstance(val, str):
@@ -870,19 +1034,48 @@ def _pack_value(
 
     # handle more expensive and uncommon abc instance checks last
     if isinstance(val, collections.abc.Mapping):
-        return {
-            key: _pack_value(value, whitelist_map, f"{descent_path}.{key}")
-            for key, value in val.items()
-        }
+        return _pack_dict(val, whitelist_map, descent_path)
     if isinstance(val, collections.abc.Sequence):
-        return [
-            _pack_value(item, whitelist_map, f"{descent_path}[{idx}]")
-            for idx, item in enumerate(val)
-        ]
+        packed_seq = []
+        try:
+            for item in val:
+                packed_seq.append(_pack_value(item, whitelist_map, descent_path))
+        except DescentPathSerializationError as e:
+            e.add_path_segment(f"[{len(packed_seq)}]")
+            raise
+        return packed_seq
 
     raise SerializationError(f"Unhandled value type {tval}")
 
 
+def _pack_dict(
+    val: Mapping[str, PackableValue],
+    whitelist_map: WhitelistMap,
+    descent_path: str,
+) -> Dict[str, JsonSerializableValue]:
+    packed_dict = {}
+    key = None
+    try:
+        for key, value in val.items():
+            packed_dict[key] = _pack_value(value, whitelist_map, descent_path)
+    except DescentPathSerializationError as e:
+        e.add_path_segment(f".{key}")
+        raise
+    return packed_dict
+
+
+def _pack_set_items(
+    val: AbstractSet[PackableValue],
+    whitelist_map: WhitelistMap,
+    descent_path: str,
+) -> List[JsonSerializableValue]:
+    try:
+        return [_pack_value(item, whitelist_map, descent_path) for item in sorted(val, key=str)]
+    except DescentPathSerializationError as e:
+        e.add_path_segment("{}")
+        raise
+
+
 ###################################################################################################
 # Deserialize / Unpack
 ###################################################################################################
@@ -931,9 +1124,14 @@ def deserialize_value(
 
     - Parse the input string as JSON with an object_hook for custom types.
     - Optionally, check that the resulting object is of the expected type.
+
+    Strings produced by `serialize_value_compact` are decoded to JSON before parsing.
     """
     check.str_param(val, "val")
 
+    if is_compact_serialized_value(val):
+        val = _decode_compact_value(val)
+
     # Never issue warnings when deserializing deprecated objects.
     with disable_dagster_warnings():
         context = UnpackContext()
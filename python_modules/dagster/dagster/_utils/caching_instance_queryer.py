@@ -1,4 +1,5 @@
 import logging
+import threading
 from collections import defaultdict
 from datetime import datetime
 from typing import (
@@ -59,6 +60,10 @@ class CachingInstanceQueryer(DynamicPartitionsStore):
     instance which will attempt to limit redundant expensive calls. Intended for use within the
     scope of a single "request" (e.g. GQL request, sensor tick).
 
+    A queryer may be shared between threads. Cached values are never mutated once computed, so
+    threads that miss the cache for the same key at the same time just run the same query more than
+    once, while updates to the asset status cache are made by one thread at a time.
+
     Args:
         instance (DagsterInstance): The instance to query.
     """
@@ -84,6 +89,8 @@ def __init__(
 
         self._dynamic_partitions_cache: Dict[str, Sequence[str]] = {}
 
+        self._asset_status_cache_lock = threading.Lock()
+
         self._evaluation_time = evaluation_time if evaluation_time else pendulum.now("UTC")
 
         self._respect_materialization_data_versions = (
@@ -131,13 +138,16 @@ def _get_updated_cache_value(self, *, asset_key: AssetKey) -> Optional["AssetSta
 
         partitions_def = check.not_none(self.asset_graph.get_partitions_def(asset_key))
         asset_record = self.get_asset_record(asset_key)
-        return get_and_update_asset_status_cache_value(
-            instance=self.instance,
-            asset_key=asset_key,
-            partitions_def=partitions_def,
-            dynamic_partitions_loader=self,
-            asset_record=asset_record,
-        )
+        # updating the cache writes to the event log storage, so avoid concurrent writes from
+        # threads sharing this queryer
+        with self._asset_status_cache_lock:
+            return get_and_update_asset_status_cache_value(
+                instance=self.instance,
+                asset_key=asset_key,
+                partitions_def=partitions_def,
+                dynamic_partitions_loader=self,
+                asset_record=asset_record,
+            )
 
     @cached_method
     def get_failed_or_in_progress_subset(self, *, asset_key: AssetKey) -> PartitionsSubset:
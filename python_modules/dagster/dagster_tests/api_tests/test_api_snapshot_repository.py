@@ -1,9 +1,12 @@
 import sys
 from contextlib import contextmanager
+from unittest import mock
 
 import pytest
 from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
+from dagster._api.list_repositories import sync_list_repositories_grpc
 from dagster._api.snapshot_repository import (
+    clear_external_repository_data_cache,
     sync_get_streaming_external_repositories_data_grpc,
 )
 from dagster._core.errors import DagsterUserCodeProcessError
@@ -12,13 +15,19 @@
     ManagedGrpcPythonEnvCodeLocationOrigin,
 )
 from dagster._core.host_representation.external import ExternalRepository
-from dagster._core.host_representation.external_data import ExternalJobData
+from dagster._core.host_representation.external_data import (
+    ExternalJobData,
+    external_repository_data_from_def,
+)
 from dagster._core.host_representation.handle import RepositoryHandle
 from dagster._core.host_representation.origin import ExternalRepositoryOrigin
 from dagster._core.instance import DagsterInstance
-from dagster._core.test_utils import instance_for_test
+from dagster._core.test_utils import environ, instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._grpc.server import LoadedRepositories
 from dagster._serdes.serdes import deserialize_value
+from dagster._serdes.utils import hash_str
+from dagster._utils import file_relative_path
 
 from .utils import get_bar_repo_code_location
 
@@ -41,6 +50,94 @@ def test_streaming_external_repositories_api_grpc(instance):
         }
 
 
+def test_serialized_external_repository_data_cached():
+    loaded_repositories = LoadedRepositories(
+        LoadableTargetOrigin(
+            executable_path=sys.executable,
+            python_file=file_relative_path(__file__, "api_tests_repo.py"),
+            attribute="bar_repo",
+        ),
+        entry_point=["dagster"],
+    )
+
+    with mock.patch(
+        "dagster._grpc.server.external_repository_data_from_def",
+        wraps=external_repository_data_from_def,
+    ) as external_repository_data_mock:
+        deferred = loaded_repositories.get_serialized_external_repository_data(
+            "bar_repo", defer_snapshots=True
+        )
+        assert external_repository_data_mock.call_count == 1
+        assert (
+            loaded_repositories.get_serialized_external_repository_data(
+                "bar_repo", defer_snapshots=True
+            )
+            is deferred
+        )
+        assert external_repository_data_mock.call_count == 1
+
+        full = loaded_repositories.get_serialized_external_repository_data(
+            "bar_repo", defer_snapshots=False
+        )
+        assert external_repository_data_mock.call_count == 2
+
+    assert deserialize_value(deferred, ExternalRepositoryData).external_job_datas is None
+    assert deserialize_value(full, ExternalRepositoryData).external_job_datas
+
+
+def test_streaming_external_repositories_snapshot_ids(instance, tmp_path):
+    with get_bar_repo_code_location(instance) as code_location:
+        # loading the code location already cached its repository
+        clear_external_repository_data_cache()
+
+        snapshot_ids = sync_list_repositories_grpc(code_location.client).repository_snapshot_ids
+        assert snapshot_ids and set(snapshot_ids) == {"bar_repo"}
+
+        serialized = "".join(
+            chunk["serialized_external_repository_chunk"]
+            for chunk in code_location.client.streaming_external_repository(
+                ExternalRepositoryOrigin(code_location.origin, "bar_repo")
+            )
+        )
+        assert hash_str(serialized) == snapshot_ids["bar_repo"]
+
+        with environ({"DAGSTER_REPOSITORY_SNAPSHOT_CACHE_DIR": str(tmp_path)}), mock.patch.object(
+            code_location.client,
+            "streaming_external_repository",
+            wraps=code_location.client.streaming_external_repository,
+        ) as streaming_mock:
+            first = sync_get_streaming_external_repositories_data_grpc(
+                code_location.client, code_location, snapshot_ids
+            )
+            assert streaming_mock.call_count == 1
+
+            # served from memory
+            second = sync_get_streaming_external_repositories_data_grpc(
+                code_location.client, code_location, snapshot_ids
+            )
+            assert streaming_mock.call_count == 1
+            assert second["bar_repo"] is first["bar_repo"]
+
+            # served from disk, e.g. after a restart
+            clear_external_repository_data_cache()
+            third = sync_get_streaming_external_repositories_data_grpc(
+                code_location.client, code_location, snapshot_ids
+            )
+            assert streaming_mock.call_count == 1
+            assert third["bar_repo"] == first["bar_repo"]
+
+            # a snapshot id that does not match the fetched data is not cached
+            sync_get_streaming_external_repositories_data_grpc(
+                code_location.client, code_location, {"bar_repo": "not_the_snapshot_id"}
+            )
+            sync_get_streaming_external_repositories_data_grpc(
+                code_location.client, code_location, {"bar_repo": "not_the_snapshot_id"}
+            )
+            assert streaming_mock.call_count == 3
+
+    clear_external_repository_data_cache()
+
+
 def test_streaming_external_repositories_error(instance):
     with get_bar_repo_code_location(instance) as code_location:
         code_location.repository_names = {"does_not_exist"}
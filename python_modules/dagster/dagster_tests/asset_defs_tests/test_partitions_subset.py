@@ -1,3 +1,4 @@
+import json
 from typing import cast
 from unittest.mock import Mock
 
@@ -8,7 +9,12 @@
     MultiPartitionsDefinition,
     StaticPartitionsDefinition,
 )
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsSubset
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    DefaultPartitionsSubset,
+    StaticPartitionsSubset,
+)
 from dagster._core.definitions.time_window_partitions import (
     PartitionKeysTimeWindowPartitionsSubset,
     TimeWindowPartitionsDefinition,
@@ -86,7 +92,7 @@ def test_get_subset_type():
 
 
 def test_empty_subsets():
-    assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
+    assert type(static_partitions.empty_subset()) is StaticPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is PartitionKeysTimeWindowPartitionsSubset
 
 
@@ -196,3 +202,162 @@ def test_all_partitions_subset_time_window_partitions_def() -> None:
         round_trip_subset = deserialize_value(serialize_value(all_subset.to_serializable_subset()))  # type: ignore
         assert isinstance(round_trip_subset, TimeWindowPartitionsSubset)
         assert set(round_trip_subset.get_partition_keys()) == set(all_subset.get_partition_keys())
+
+
+@pytest.mark.parametrize("time_dimension_name", ["a_time", "z_time"])
+def test_multi_partitions_subset_key_ranges(time_dimension_name: str) -> None:
+    partitions_def = MultiPartitionsDefinition(
+        {
+            time_dimension_name: DailyPartitionsDefinition(start_date="2023-01-01"),
+            "static": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+    current_time = create_pendulum_time(2023, 1, 11)
+    all_keys = partitions_def.get_partition_keys(current_time=current_time)
+    key_sets = [
+        all_keys[:7],
+        all_keys[3:20] + all_keys[25:27],
+        [key for key in all_keys if key.keys_by_dimension["static"] != "b"],
+        [key for key in all_keys if key.keys_by_dimension[time_dimension_name] >= "2023-01-05"],
+        all_keys,
+        [],
+    ]
+
+    for keys in key_sets:
+        subset = partitions_def.empty_subset().with_partition_keys(keys)
+        assert isinstance(subset, MultiPartitionsSubset)
+        assert set(subset.get_partition_keys()) == set(keys)
+        assert len(subset) == len(keys)
+        assert subset.get_partition_key_ranges(
+            partitions_def, current_time=current_time
+        ) == DefaultPartitionsSubset(set(keys)).get_partition_key_ranges(
+            partitions_def, current_time=current_time
+        )
+        assert set(
+            subset.get_partition_keys_not_in_subset(partitions_def, current_time=current_time)
+        ) == set(all_keys) - set(keys)
+
+
+def test_multi_partitions_subset_set_operations() -> None:
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2023-01-01", end_date="2023-01-10"),
+            "static": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+    all_keys = partitions_def.get_partition_keys()
+    keys1 = set(all_keys[:15])
+    keys2 = set(all_keys[10:20])
+    subset1 = partitions_def.empty_subset().with_partition_keys(keys1)
+    subset2 = partitions_def.empty_subset().with_partition_keys(keys2)
+    default_subset2 = DefaultPartitionsSubset(keys2)
+
+    assert set((subset1 | subset2).get_partition_keys()) == keys1 | keys2
+    assert set((subset1 - subset2).get_partition_keys()) == keys1 - keys2
+    assert set((subset1 & subset2).get_partition_keys()) == keys1 & keys2
+    assert set((subset1 | default_subset2).get_partition_keys()) == keys1 | keys2
+    assert set((subset1 - default_subset2).get_partition_keys()) == keys1 - keys2
+    assert set((subset1 & default_subset2).get_partition_keys()) == keys1 & keys2
+
+    assert subset1 | subset2 == (subset2 | subset1)
+    assert subset1 - subset1 == partitions_def.empty_subset()
+    assert subset2 == default_subset2
+    assert default_subset2 == subset2
+    assert subset1 != subset2
+
+
+def test_multi_partitions_subset_serialization() -> None:
+    partitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2023-01-01", end_date="2023-01-10"),
+            "static": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+    keys = set(partitions_def.get_partition_keys()[4:17])
+    subset = partitions_def.empty_subset().with_partition_keys(keys)
+
+    serialized = subset.serialize()
+    assert partitions_def.can_deserialize_subset(serialized, None, None)
+    assert partitions_def.deserialize_subset(serialized) == subset
+
+    # subsets serialized before MultiPartitionsSubset existed
+    legacy_serialized = DefaultPartitionsSubset(keys).serialize()
+    assert partitions_def.can_deserialize_subset(legacy_serialized, None, None)
+    deserialized = partitions_def.deserialize_subset(legacy_serialized)
+    assert isinstance(deserialized, MultiPartitionsSubset)
+    assert deserialized == subset
+
+    other_partitions_def = MultiPartitionsDefinition(
+        {
+            "other_date": DailyPartitionsDefinition(start_date="2023-01-01"),
+            "static": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+    assert not other_partitions_def.can_deserialize_subset(serialized, None, None)
+
+    # serdes keeps the DefaultPartitionsSubset format
+    assert deserialize_value(serialize_value(subset.to_serializable_subset())) == subset
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        set(),
+        {"b"},
+        {"a", "b", "c", "e"},
+        {"a", "c", "e", "f"},
+        {"a", "b", "c", "d", "e", "f"},
+        {"a", "b", "removed"},
+    ],
+)
+def test_static_partitions_subset(keys) -> None:
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d", "e", "f"])
+    subset = partitions_def.empty_subset().with_partition_keys(keys)
+    default_subset = DefaultPartitionsSubset(keys)
+
+    assert isinstance(subset, StaticPartitionsSubset)
+    assert subset.get_partition_keys() == keys
+    assert len(subset) == len(keys)
+    assert all((key in subset) == (key in keys) for key in ["a", "d", "f", "removed", "other"])
+    assert subset.get_partition_key_ranges(
+        partitions_def
+    ) == default_subset.get_partition_key_ranges(partitions_def)
+    assert subset.get_partition_keys_not_in_subset(
+        partitions_def
+    ) == default_subset.get_partition_keys_not_in_subset(partitions_def)
+    assert subset == default_subset
+    assert default_subset == subset
+
+    other_keys = {"b", "c", "d", "removed"}
+    other_subset = partitions_def.empty_subset().with_partition_keys(other_keys)
+    for other in [other_subset, DefaultPartitionsSubset(other_keys)]:
+        assert (subset | other).get_partition_keys() == keys | other_keys
+        assert (subset - other).get_partition_keys() == keys - other_keys
+        assert (subset & other).get_partition_keys() == keys & other_keys
+
+
+def test_static_partitions_subset_serialization() -> None:
+    partitions_def = StaticPartitionsDefinition([str(i) for i in range(1000)])
+    keys = {str(i) for i in range(1000) if i % 3 != 0} | {"removed"}
+    subset = partitions_def.empty_subset().with_partition_keys(keys)
+
+    serialized = subset.serialize()
+    assert partitions_def.can_deserialize_subset(serialized, None, None)
+    assert partitions_def.deserialize_subset(serialized) == subset
+    assert len(serialized) < len(DefaultPartitionsSubset(keys).serialize()) / 10
+
+    # subsets serialized before StaticPartitionsSubset existed
+    for legacy_serialized in [
+        DefaultPartitionsSubset(keys).serialize(),
+        json.dumps(sorted(keys)),
+    ]:
+        assert partitions_def.can_deserialize_subset(legacy_serialized, None, None)
+        deserialized = partitions_def.deserialize_subset(legacy_serialized)
+        assert isinstance(deserialized, StaticPartitionsSubset)
+        assert deserialized == subset
+
+    # the bitmap cannot be read with different partition keys
+    assert not StaticPartitionsDefinition(["0", "1"]).can_deserialize_subset(serialized, None, None)
+
+    # serdes keeps the DefaultPartitionsSubset format
+    assert deserialize_value(serialize_value(subset.to_serializable_subset())) == subset
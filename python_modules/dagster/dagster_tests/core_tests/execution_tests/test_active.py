@@ -12,7 +12,11 @@
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
-from dagster._core.execution.plan.objects import StepRetryData, StepSuccessData
+from dagster._core.execution.plan.objects import (
+    StepFailureData,
+    StepRetryData,
+    StepSuccessData,
+)
 from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster._core.execution.retries import RetryMode
 from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG
@@ -354,3 +358,122 @@ def test_active_concurrency_sleep():
             )
             assert math.isclose(active_execution.sleep_interval(), 2.0, abs_tol=0.1)
             active_execution.mark_interrupted()
+
+
+def define_diamond_job():
+    @op
+    def top():
+        return 1
+
+    @op
+    def left(x):
+        return x
+
+    @op
+    def right(x):
+        return x
+
+    @op
+    def bottom(x, y):
+        return x + y
+
+    @job
+    def diamond_job():
+        x = top()
+        bottom(left(x), right(x))
+
+    return diamond_job
+
+
+def _step_success_events(job_name: str, step_key: str) -> List[DagsterEvent]:
+    return [
+        DagsterEvent(
+            DagsterEventType.STEP_OUTPUT.value,
+            job_name=job_name,
+            event_specific_data=StepOutputData(
+                StepOutputHandle(step_key=step_key, output_name="result")
+            ),
+            step_key=step_key,
+        ),
+        DagsterEvent(
+            DagsterEventType.STEP_SUCCESS.value,
+            job_name=job_name,
+            event_specific_data=StepSuccessData(duration_ms=10.0),
+            step_key=step_key,
+        ),
+    ]
+
+
+def test_active_waits_for_all_upstream_steps():
+    diamond_job = define_diamond_job()
+
+    with create_execution_plan(diamond_job).start(RetryMode.DISABLED) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["top"]
+        assert not active_execution.get_steps_to_execute()
+
+        for event in _step_success_events(diamond_job.name, "top"):
+            active_execution.handle_event(event)
+
+        assert sorted(step.key for step in active_execution.get_steps_to_execute()) == [
+            "left",
+            "right",
+        ]
+
+        for event in _step_success_events(diamond_job.name, "left"):
+            active_execution.handle_event(event)
+
+        # bottom still depends on right
+        assert not active_execution.get_steps_to_execute()
+
+        for event in _step_success_events(diamond_job.name, "right"):
+            active_execution.handle_event(event)
+
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["bottom"]
+
+        for event in _step_success_events(diamond_job.name, "bottom"):
+            active_execution.handle_event(event)
+
+        assert active_execution.is_complete
+
+
+def test_active_abandons_downstream_of_failure():
+    diamond_job = define_diamond_job()
+    error_info = SerializableErrorInfo("Exception", [], None)
+
+    with create_execution_plan(diamond_job).start(RetryMode.ENABLED) as active_execution:
+        active_execution.get_steps_to_execute()
+        for event in _step_success_events(diamond_job.name, "top"):
+            active_execution.handle_event(event)
+
+        assert len(active_execution.get_steps_to_execute()) == 2
+
+        # left is retried and is queued up again, bottom keeps waiting on it
+        active_execution.handle_event(
+            DagsterEvent(
+                DagsterEventType.STEP_UP_FOR_RETRY.value,
+                job_name=diamond_job.name,
+                step_key="left",
+                event_specific_data=StepRetryData(error=error_info),
+            )
+        )
+        for event in _step_success_events(diamond_job.name, "right"):
+            active_execution.handle_event(event)
+
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["left"]
+        assert not active_execution.get_steps_to_abandon()
+
+        active_execution.handle_event(
+            DagsterEvent(
+                DagsterEventType.STEP_FAILURE.value,
+                job_name=diamond_job.name,
+                step_key="left",
+                event_specific_data=StepFailureData(error=error_info, user_failure_data=None),
+            )
+        )
+
+        assert not active_execution.get_steps_to_execute()
+        steps_to_abandon = active_execution.get_steps_to_abandon()
+        assert [step.key for step in steps_to_abandon] == ["bottom"]
+        active_execution.mark_abandoned("bottom")
+
+        assert active_execution.is_complete
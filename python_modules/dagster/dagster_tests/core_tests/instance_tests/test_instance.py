@@ -1,6 +1,7 @@
 import os
 import re
 import tempfile
+import time
 from typing import Any, Mapping, Optional
 from unittest.mock import MagicMock, patch
 
@@ -42,6 +43,7 @@
     create_job_snapshot_id,
     snapshot_from_execution_plan,
 )
+from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.partition_status_cache import (
     AssetPartitionStatus,
     AssetStatusCacheValue,
@@ -780,3 +782,80 @@ def test_report_runless_asset_event():
             limit=1,
         )
         assert len(records) == 1
+
+
+def test_event_log_buffer():
+    with instance_for_test(
+        overrides={
+            "event_log_buffer": {
+                "enabled": True,
+                "max_batch_size": 3,
+                "max_batch_interval_seconds": 600.0,
+            }
+        }
+    ) as instance:
+        run = create_run_for_test(instance, job_name="foo")
+        received = []
+        instance.add_event_listener(run.run_id, received.append)
+
+        instance.report_engine_event("one", run)
+        instance.report_engine_event("two", run)
+        assert len(instance.all_logs(run.run_id)) == 0
+        assert received == []
+
+        # reaching the max batch size flushes the buffer
+        instance.report_engine_event("three", run)
+        assert len(instance.all_logs(run.run_id)) == 3
+        assert [event.message for event in received] == ["one", "two", "three"]
+
+        # run boundary events flush the buffer and update the run storage
+        instance.report_engine_event("four", run)
+        instance.report_run_canceling(run)
+        assert len(instance.all_logs(run.run_id)) == 5
+        assert (
+            check.not_none(instance.get_run_by_id(run.run_id)).status == DagsterRunStatus.CANCELING
+        )
+
+        instance.report_engine_event("five", run)
+        instance.flush_event_log_buffer()
+        assert len(instance.all_logs(run.run_id)) == 6
+
+
+def test_event_log_buffer_flushes_on_interval():
+    with instance_for_test(
+        overrides={
+            "event_log_buffer": {
+                "enabled": True,
+                "max_batch_interval_seconds": 0.1,
+            }
+        }
+    ) as instance:
+        run = create_run_for_test(instance, job_name="foo")
+        instance.report_engine_event("one", run)
+
+        start_time = time.time()
+        while not instance.all_logs(run.run_id):
+            assert time.time() - start_time < 10
+            time.sleep(0.05)
+
+
+def test_event_log_buffer_execute_job():
+    with instance_for_test(overrides={"event_log_buffer": {"enabled": True}}) as instance:
+        result = execute_job(reconstructable(define_buffered_asset_job), instance=instance)
+        assert result.success
+
+        run = check.not_none(instance.get_run_by_id(result.run_id))
+        assert run.status == DagsterRunStatus.SUCCESS
+        assert instance.get_latest_materialization_event(AssetKey("buffered_asset"))
+        assert (
+            instance.all_logs(result.run_id)[-1].dagster_event_type == DagsterEventType.RUN_SUCCESS
+        )
+
+
+@asset
+def buffered_asset():
+    return 1
+
+
+def define_buffered_asset_job():
+    return build_assets_job("buffered_asset_job", [buffered_asset])
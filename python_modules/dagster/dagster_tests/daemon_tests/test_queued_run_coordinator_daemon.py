@@ -246,6 +246,44 @@ def test_priority_on_malformed_tag(self, instance, workspace_context, job_handle
 
         assert self.get_run_ids(instance.run_launcher.queue()) == ["bad-pri-run"]
 
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [dict(max_concurrent_runs=1)],
+    )
+    def test_queue_changes_between_iterations(
+        self, instance, workspace_context, job_handle, daemon
+    ):
+        for i in range(4):
+            self.create_queued_run(instance, job_handle, run_id=f"run-{i}")
+
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == ["run-0"]
+
+        # runs that were already queued during the previous iteration are re-prioritized and
+        # canceled while still queued
+        instance.report_run_failed(instance.get_run_by_id("run-0"))
+        instance.report_run_canceled(instance.get_run_by_id("run-1"))
+        instance.add_run_tags("run-3", {PRIORITY_TAG: "5"})
+
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == ["run-0", "run-3"]
+
+        instance.report_run_failed(instance.get_run_by_id("run-3"))
+        self.create_queued_run(instance, job_handle, run_id="run-4", tags={PRIORITY_TAG: "-1"})
+
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == ["run-0", "run-3", "run-2"]
+
+        instance.report_run_failed(instance.get_run_by_id("run-2"))
+
+        list(daemon.run_iteration(workspace_context))
+        assert self.get_run_ids(instance.run_launcher.queue()) == [
+            "run-0",
+            "run-3",
+            "run-2",
+            "run-4",
+        ]
+
     @pytest.mark.parametrize(
         "run_coordinator_config",
         [
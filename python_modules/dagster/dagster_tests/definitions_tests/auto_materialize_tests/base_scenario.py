@@ -252,6 +252,8 @@ def do_sensor_scenario(
         scenario_name=None,
         with_external_asset_graph=False,
         respect_materialization_data_versions=False,
+        num_evaluation_workers=None,
+        incremental_evaluation=False,
     ):
         if (
             self.requires_respect_materialization_data_versions
@@ -337,6 +339,8 @@ def prior_repo():
                     instance,
                     scenario_name=scenario_name,
                     with_external_asset_graph=with_external_asset_graph,
+                    num_evaluation_workers=num_evaluation_workers,
+                    incremental_evaluation=incremental_evaluation,
                 )
                 for run_request in run_requests:
                     instance.create_run_for_job(
@@ -422,6 +426,8 @@ def test_time_fn():
                 },
                 respect_materialization_data_versions=respect_materialization_data_versions,
                 logger=logging.getLogger("dagster.amp"),
+                num_evaluation_workers=num_evaluation_workers,
+                incremental_evaluation=incremental_evaluation,
             ).evaluate()
 
         for run_request in run_requests:
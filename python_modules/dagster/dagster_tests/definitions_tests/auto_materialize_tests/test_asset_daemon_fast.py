@@ -1,11 +1,21 @@
+import logging
+
+import pendulum
 import pytest
 from dagster import (
     AssetMaterialization,
     AssetSelection,
+    AutoMaterializePolicy,
     DagsterInstance,
+    Definitions,
+    asset,
     job,
+    materialize,
     op,
 )
+from dagster._core.definitions.asset_daemon_context import AssetDaemonContext
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.test_utils import instance_for_test
 from dagster._core.definitions.time_window_partitions import (
     HourlyPartitionsDefinition,
 )
@@ -53,6 +63,121 @@ def sort_run_request_key_fn(run_request):
         assert run_request.partition_key == expected_run_request.partition_key
 
 
+@pytest.mark.parametrize(
+    "scenario",
+    list(ASSET_RECONCILIATION_SCENARIOS.values()),
+    ids=list(ASSET_RECONCILIATION_SCENARIOS.keys()),
+)
+def test_reconciliation_parallel_evaluation(scenario):
+    if scenario.requires_respect_materialization_data_versions:
+        pytest.skip("requires respect_materialization_data_versions to be True")
+
+    # use a sqlite instance, as the in-memory storage of an ephemeral instance does not support
+    # concurrent reads and writes
+    with instance_for_test() as instance:
+        run_requests, _, evaluations = scenario.do_sensor_scenario(instance)
+    with instance_for_test() as instance:
+        parallel_run_requests, _, parallel_evaluations = scenario.do_sensor_scenario(
+            instance, num_evaluation_workers=4
+        )
+
+    # evaluating each level of the asset graph in parallel produces the same output, in the same
+    # order, as evaluating one asset at a time
+    assert parallel_run_requests == run_requests
+    assert [evaluation.asset_key for evaluation in parallel_evaluations] == [
+        evaluation.asset_key for evaluation in evaluations
+    ]
+    for parallel_evaluation, evaluation in zip(parallel_evaluations, evaluations):
+        assert parallel_evaluation.equivalent_to_stored_evaluation(evaluation)
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    list(ASSET_RECONCILIATION_SCENARIOS.values()),
+    ids=list(ASSET_RECONCILIATION_SCENARIOS.keys()),
+)
+def test_reconciliation_incremental_evaluation(scenario):
+    run_requests, _, evaluations = scenario.do_sensor_scenario(DagsterInstance.ephemeral())
+    incremental_run_requests, _, incremental_evaluations = scenario.do_sensor_scenario(
+        DagsterInstance.ephemeral(), incremental_evaluation=True
+    )
+
+    # reusing the previous evaluation of assets that did not change produces the same output as
+    # evaluating every asset
+    assert incremental_run_requests == run_requests
+    evaluations_by_key = {evaluation.asset_key: evaluation for evaluation in evaluations}
+    assert {evaluation.asset_key for evaluation in incremental_evaluations} == set(
+        evaluations_by_key.keys()
+    )
+    for evaluation in incremental_evaluations:
+        assert evaluation.equivalent_to_stored_evaluation(evaluations_by_key[evaluation.asset_key])
+
+
+def test_incremental_evaluation_skips_unchanged_assets():
+    @asset(auto_materialize_policy=AutoMaterializePolicy.eager())
+    def a():
+        ...
+
+    @asset(deps=[a], auto_materialize_policy=AutoMaterializePolicy.eager())
+    def b():
+        ...
+
+    @asset(auto_materialize_policy=AutoMaterializePolicy.eager())
+    def c():
+        ...
+
+    @asset(deps=[c], auto_materialize_policy=AutoMaterializePolicy.eager())
+    def d():
+        ...
+
+    asset_graph = Definitions(assets=[a, b, c, d]).get_repository_def().asset_graph
+
+    def _evaluate(instance, cursor, incremental_evaluation=True):
+        # tick well after the runs above finished, as recently finished runs are treated as changes
+        context = AssetDaemonContext(
+            evaluation_time=pendulum.now("UTC").add(minutes=cursor.evaluation_id + 5),
+            evaluation_id=cursor.evaluation_id + 1,
+            instance=instance,
+            asset_graph=asset_graph,
+            cursor=cursor,
+            materialize_run_tags=None,
+            observe_run_tags=None,
+            auto_observe_asset_keys=None,
+            auto_materialize_asset_keys=asset_graph.materializable_asset_keys,
+            respect_materialization_data_versions=False,
+            logger=logging.getLogger("dagster.amp"),
+            incremental_evaluation=incremental_evaluation,
+        )
+        run_requests, new_cursor, _ = context.evaluate()
+        return run_requests, new_cursor, context.num_skipped_assets
+
+    with instance_for_test() as instance:
+        materialize([a, b, c, d], instance=instance)
+
+        # the first tick has no previous evaluations to reuse
+        run_requests, cursor, num_skipped_assets = _evaluate(instance, AssetDaemonCursor.empty())
+        assert run_requests == []
+        assert num_skipped_assets == 0
+        assert cursor.latest_storage_id is not None
+        assert cursor.asset_graph_fingerprint is not None
+
+        run_requests, cursor, num_skipped_assets = _evaluate(instance, cursor)
+        assert run_requests == []
+        assert num_skipped_assets == 4
+
+        # only the updated asset and its descendants are evaluated
+        materialize([a], instance=instance)
+        run_requests, incremental_cursor, num_skipped_assets = _evaluate(instance, cursor)
+        assert num_skipped_assets == 2
+        assert [run_request.asset_selection for run_request in run_requests] == [[b.key]]
+        full_run_requests, _, _ = _evaluate(instance, cursor, incremental_evaluation=False)
+        assert run_requests == full_run_requests
+
+        # the requested asset is evaluated again on the next tick
+        _, _, num_skipped_assets = _evaluate(instance, incremental_cursor)
+        assert num_skipped_assets == 3
+
+
 @pytest.mark.parametrize(
     "scenario",
     [ASSET_RECONCILIATION_SCENARIOS["freshness_complex_subsettable"]],
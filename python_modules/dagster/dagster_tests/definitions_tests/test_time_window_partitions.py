@@ -1514,3 +1514,138 @@ def test_time_window_partitions_subset_add_partition_to_front():
     assert combined == PartitionKeysTimeWindowPartitionsSubset(
         partitions_def, {"2023-01-01", "2023-01-02"}
     )
+
+
+def _get_time_window_partitions_def_results(
+    partitions_def: TimeWindowPartitionsDefinition, current_time: datetime
+) -> dict:
+    for method in [
+        TimeWindowPartitionsDefinition.time_window_for_partition_key,
+        TimeWindowPartitionsDefinition.time_windows_for_partition_keys,
+        TimeWindowPartitionsDefinition._get_first_partition_window,  # noqa: SLF001
+        TimeWindowPartitionsDefinition._get_last_partition_window,  # noqa: SLF001
+        TimeWindowPartitionsDefinition.get_partition_keys_in_time_window,
+    ]:
+        method.cache_clear()
+
+    partition_keys = partitions_def.get_partition_keys(current_time=current_time)
+    timestamps = [
+        current_time.timestamp() + offset for offset in [-86400 * 40, -3600, -1, 0, 1, 59, 1800]
+    ]
+    results = {
+        "num_partitions": partitions_def.get_num_partitions(current_time=current_time),
+        "partition_keys": partition_keys,
+        "partition_keys_between_indexes": partitions_def.get_partition_keys_between_indexes(
+            2, 7, current_time=current_time
+        ),
+        "first_window": partitions_def.get_first_partition_window(current_time=current_time),
+        "last_window": partitions_def.get_last_partition_window(current_time=current_time),
+        "partition_keys_for_timestamps": [
+            partitions_def.get_partition_key_for_timestamp(timestamp, end_closed)
+            for timestamp in timestamps
+            for end_closed in [True, False]
+        ],
+        "next_windows": [
+            partitions_def.get_next_partition_window(
+                pendulum.from_timestamp(timestamp), respect_bounds=False
+            )
+            for timestamp in timestamps
+        ],
+        "prev_windows": [
+            partitions_def.get_prev_partition_window(
+                pendulum.from_timestamp(timestamp), respect_bounds=False
+            )
+            for timestamp in timestamps
+        ],
+    }
+    if partition_keys:
+        time_windows = partitions_def.time_windows_for_partition_keys(
+            frozenset(partition_keys[::3]), validate=False
+        )
+        results["time_windows"] = time_windows
+        results["time_windows_tz"] = [tw.start.timezone.name for tw in time_windows]  # type: ignore
+        results["window_for_key"] = partitions_def.time_window_for_partition_key(partition_keys[-1])
+        results["start_times"] = [
+            partitions_def.start_time_for_partition_key(partition_key)
+            for partition_key in partition_keys[:3]
+        ]
+        results["keys_in_window"] = partitions_def.get_partition_keys_in_time_window(
+            TimeWindow(time_windows[0].start, time_windows[-1].end)
+        )
+        results["has_partition_key"] = [
+            partitions_def.has_partition_key(partition_key, current_time=current_time)
+            for partition_key in partition_keys[:2] + partition_keys[-2:]
+        ]
+    return results
+
+
+@pytest.mark.parametrize("timezone", ["UTC", "Etc/GMT+5", "Etc/GMT-14"])
+@pytest.mark.parametrize(
+    "cron_schedule,fmt",
+    [
+        ("0 * * * *", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE),
+        ("45 * * * *", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE),
+        ("0 0 * * *", DATE_FORMAT),
+        ("30 7 * * *", "%Y-%m-%d"),
+        ("15 3 * * *", "%Y-%m-%d %H:%M%z"),
+        ("0 0 * * 0", DATE_FORMAT),
+        ("0 22 * * 4", DATE_FORMAT),
+        ("0 0 1 * *", DATE_FORMAT),
+        ("30 5 28 * *", DATE_FORMAT),
+    ],
+)
+@pytest.mark.parametrize(
+    "start,end,end_offset",
+    [
+        ("2020-02-28 23:30", None, 0),
+        ("2020-02-28 23:30", None, 2),
+        ("2020-02-28 23:30", None, -3),
+        ("2019-12-31 00:00", "2020-03-05 00:00", 0),
+        ("2019-12-31 00:00", "2020-03-05 00:00", 1),
+        ("2019-12-31 00:00", "2020-03-05 00:00", -1),
+    ],
+)
+def test_fixed_interval_schedule_matches_cron_schedule(
+    monkeypatch, timezone, cron_schedule, fmt, start, end, end_offset
+):
+    partitions_def = TimeWindowPartitionsDefinition(
+        start=pendulum.parser.parse(start, tz=timezone),
+        end=pendulum.parser.parse(end, tz=timezone) if end else None,
+        cron_schedule=cron_schedule,
+        fmt=fmt,
+        timezone=timezone,
+        end_offset=end_offset,
+    )
+    assert partitions_def._fixed_interval_schedule is not None  # noqa: SLF001
+
+    for current_time in [
+        create_pendulum_time(2020, 1, 1, tz=timezone),
+        create_pendulum_time(2020, 3, 1, 0, 30, tz=timezone),
+        create_pendulum_time(2020, 5, 14, 17, 12, 3, tz=timezone),
+    ]:
+        results = _get_time_window_partitions_def_results(partitions_def, current_time)
+        with monkeypatch.context() as m:
+            m.setattr(
+                "dagster._core.definitions.time_window_partitions._get_fixed_interval_schedule",
+                lambda *args: None,
+            )
+            assert partitions_def._fixed_interval_schedule is None  # noqa: SLF001
+            assert results == _get_time_window_partitions_def_results(partitions_def, current_time)
+
+
+@pytest.mark.parametrize(
+    "cron_schedule,timezone",
+    [
+        ("0 0 * * *", "America/Los_Angeles"),
+        ("0 * * * *", "Asia/Kolkata"),
+        ("0 0 29 * *", "UTC"),
+        ("0 0 * * 1-5", "UTC"),
+        ("0,30 * * * *", "UTC"),
+        ("*/15 * * * *", "UTC"),
+    ],
+)
+def test_no_fixed_interval_schedule(cron_schedule, timezone):
+    partitions_def = TimeWindowPartitionsDefinition(
+        start="2020-01-01", cron_schedule=cron_schedule, fmt=DATE_FORMAT, timezone=timezone
+    )
+    assert partitions_def._fixed_interval_schedule is None  # noqa: SLF001
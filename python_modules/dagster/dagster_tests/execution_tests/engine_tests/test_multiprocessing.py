@@ -443,6 +443,20 @@ def test_crash_multiprocessing():
             # )
 
 
+def test_crash_multiprocessing_worker_pool():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(sys_exit_job),
+            instance=instance,
+            run_config={"execution": {"config": {"multiprocess": {"worker_pool": {}}}}},
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("sys_exit")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"
+
+
 # segfault test
 @op
 def segfault_op(context):
@@ -515,3 +529,51 @@ def get_dynamic_op_failure_job():
 )
 def test_dynamic_failure_retry(job_fn, config_fn):
     assert_expected_failure_behavior(job_fn, config_fn)
+
+
+@op
+def get_pid():
+    return os.getpid()
+
+
+@job
+def pid_job():
+    for i in range(6):
+        get_pid.alias(f"get_pid_{i}")()
+
+
+def test_worker_pool():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(pid_job),
+            instance=instance,
+            run_config={
+                "execution": {"config": {"multiprocess": {"max_concurrent": 2, "worker_pool": {}}}}
+            },
+        ) as result:
+            assert result.success
+            pids = {result.output_for_node(f"get_pid_{i}") for i in range(6)}
+            assert os.getpid() not in pids
+            # steps are executed by at most max_concurrent reused worker processes
+            assert len(pids) <= 2
+
+
+def test_worker_pool_max_tasks_per_worker():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(pid_job),
+            instance=instance,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 2,
+                            "worker_pool": {"max_tasks_per_worker": 1},
+                        }
+                    }
+                }
+            },
+        ) as result:
+            assert result.success
+            pids = {result.output_for_node(f"get_pid_{i}") for i in range(6)}
+            assert len(pids) == 6
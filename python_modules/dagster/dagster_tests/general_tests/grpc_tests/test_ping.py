@@ -238,6 +238,35 @@ def test_detect_server_restart():
     assert server_id_one != server_id_two
 
 
+def test_shared_channel_across_server_restart():
+    port, server_process = create_server_process()
+    try:
+        api_client = DagsterGrpcClient(port=port)
+        server_id_one = api_client.get_server_id()
+
+        # clients of the same server share a single channel
+        with api_client._channel() as channel:  # noqa: SLF001
+            with DagsterGrpcClient(port=port)._channel() as other_channel:  # noqa: SLF001
+                assert channel is other_channel
+    finally:
+        _cleanup_process(server_process)
+
+    seven.wait_for_process(server_process, timeout=5)
+    with pytest.raises(DagsterUserCodeUnreachableError):
+        api_client.get_server_id()
+
+    # a new server on the same port is reachable through the same client
+    with instance_for_test() as instance:
+        server_process = open_server_process(instance.get_ref(), port=port, socket=None)
+    try:
+        server_id_two = api_client.get_server_id()
+        assert server_id_two != server_id_one
+        assert api_client.heartbeat("foo") == "foo"
+        assert api_client.shutdown_server()
+    finally:
+        _cleanup_process(server_process)
+
+
 def test_ping_metrics_retrieval():
     with instance_for_test() as instance:
         port = find_free_port()
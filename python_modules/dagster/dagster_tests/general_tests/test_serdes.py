@@ -21,6 +21,7 @@
     deserialize_value,
     pack_value,
     serialize_value,
+    serialize_value_compact,
     unpack_value,
 )
 from dagster._serdes.utils import hash_str
@@ -81,6 +82,28 @@ class Fizz(NamedTuple):
         deserialize_value(ser, whitelist_map=blank_map)
 
 
+def test_descent_path_through_objects():
+    test_map = WhitelistMap.create()
+
+    class Foo(NamedTuple):
+        bar: int
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Fizz(NamedTuple):
+        buzz: Any
+
+    with pytest.raises(
+        SerializationError, match=re.escape("Descent path: <root:Fizz>.buzz[1].a{}.buzz")
+    ):
+        serialize_value(
+            Fizz([1, {"a": frozenset([Fizz(Foo(1))])}]),
+            whitelist_map=test_map,
+        )
+
+    with pytest.raises(SerializationError, match=re.escape("Descent path: custom.buzz")):
+        pack_value(Fizz(Foo(1)), whitelist_map=test_map, descent_path="custom")
+
+
 def test_forward_compat_serdes_new_field_with_default():
     test_map = WhitelistMap.create()
 
@@ -488,6 +511,47 @@ class Foo(NamedTuple):
     assert deserialized == val
 
 
+def test_named_tuple_storage_field_names_load_unmapped() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env, storage_field_names={"color": "colour", "shape": "form"})
+    class Foo(NamedTuple):
+        color: str
+        size: int
+
+    # values stored under the loaded field name are still loaded, unless that name is itself
+    # used as a storage name
+    assert deserialize_value(
+        '{"__class__": "Foo", "color": "red", "size": 1}', whitelist_map=test_env
+    ) == Foo("red", 1)
+    assert deserialize_value(
+        '{"__class__": "Foo", "colour": "red", "form": "square", "size": 1}', whitelist_map=test_env
+    ) == Foo("red", 1)
+
+
+def test_named_tuple_subclass_instance() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Foo(NamedTuple("_Foo", [("color", str)])):
+        pass
+
+    class SubFoo(NamedTuple("_Foo", [("color", str), ("size", int)])):
+        pass
+
+    # a non-whitelisted class that shares the whitelisted class name is packed using the fields of
+    # the instance
+    SubFoo.__name__ = "Foo"
+    assert (
+        serialize_value(SubFoo("red", 1), whitelist_map=test_env)
+        == '{"__class__": "Foo", "color": "red", "size": 1}'
+    )
+    assert (
+        serialize_value(Foo("red"), whitelist_map=test_env)
+        == '{"__class__": "Foo", "color": "red"}'
+    )
+
+
 def test_named_tuple_old_fields() -> None:
     test_env = WhitelistMap.create()
 
@@ -851,3 +915,24 @@ class MyEnt(pydantic.BaseModel):
     # can deserialize previous NamedTuples in to future pydantic models
     py_dc_ent = deserialize_value(ser_nt_ent, whitelist_map=py_m_env)
     assert py_dc_ent
+
+
+def test_serialize_value_compact():
+    test_map = WhitelistMap.create()
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class Foo(NamedTuple):
+        name: str
+        values: Sequence[int]
+
+    foo = Foo("foo", list(range(100)))
+    serialized = serialize_value_compact(foo, whitelist_map=test_map)
+    assert serialized.startswith("dgz1:")
+    assert len(serialized) < len(serialize_value(foo, whitelist_map=test_map))
+    assert deserialize_value(serialized, Foo, whitelist_map=test_map) == foo
+
+    with pytest.raises(DeserializationError, match="Unsupported compact serialization header"):
+        deserialize_value("dgz99:" + serialized[5:], whitelist_map=test_map)
+
+    with pytest.raises(DeserializationError, match="Could not decode"):
+        deserialize_value("dgz1:not-a-payload", whitelist_map=test_map)
@@ -9,6 +9,7 @@
 import pytest
 import sqlalchemy
 import sqlalchemy as db
+from dagster import job, op
 from dagster._core.errors import DagsterEventLogInvalidForRun
 from dagster._core.storage.event_log import (
     ConsolidatedSqliteEventLogStorage,
@@ -21,7 +22,10 @@
 from dagster._core.storage.legacy_storage import LegacyEventLogStorage
 from dagster._core.storage.sql import create_engine
 from dagster._core.storage.sqlalchemy_compat import db_select
+from dagster._core.storage.runs.schema import RunsTable
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
+from dagster._core.test_utils import instance_for_test
+from dagster._serdes.serdes import is_compact_serialized_value
 from dagster._utils.test import ConcurrencyEnabledSqliteTestEventLogStorage
 from sqlalchemy.engine import Connection
 
@@ -246,3 +250,55 @@ def test_concurrency_reconcile():
             assert _get_slot_count(conn, "bar") == 3
             assert _get_limit_row_num(conn, "foo") == 5
             assert _get_limit_row_num(conn, "bar") == 3
+
+
+def test_compact_serialization_columns():
+    @op
+    def noop_op():
+        pass
+
+    @job
+    def noop_job():
+        noop_op()
+
+    def _stored_values(instance, run_id):
+        with instance.event_log_storage.run_connection(run_id) as conn:
+            events = [
+                row[0]
+                for row in conn.execute(
+                    db_select([SqlEventLogStorageTable.c.event]).where(
+                        SqlEventLogStorageTable.c.run_id == run_id
+                    )
+                ).fetchall()
+            ]
+        with instance.run_storage.connect() as conn:
+            run_body = conn.execute(
+                db_select([RunsTable.c.run_body]).where(RunsTable.c.run_id == run_id)
+            ).scalar()
+        return events, run_body
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with instance_for_test(temp_dir=temp_dir) as instance:
+            json_run_id = noop_job.execute_in_process(instance=instance).run_id
+
+        overrides = {
+            "storage_serialization": {"compact_columns": ["event_logs.event", "runs.run_body"]}
+        }
+        with instance_for_test(temp_dir=temp_dir, overrides=overrides) as instance:
+            compact_run_id = noop_job.execute_in_process(instance=instance).run_id
+
+            events, run_body = _stored_values(instance, json_run_id)
+            assert events
+            assert not any(is_compact_serialized_value(event) for event in events)
+            assert not is_compact_serialized_value(run_body)
+
+            events, run_body = _stored_values(instance, compact_run_id)
+            assert events
+            assert all(is_compact_serialized_value(event) for event in events)
+            assert is_compact_serialized_value(run_body)
+
+            # rows in both encodings are readable
+            for run_id in [json_run_id, compact_run_id]:
+                run = instance.get_run_by_id(run_id)
+                assert run and run.is_success
+                assert len(instance.all_logs(run_id)) == len(events)
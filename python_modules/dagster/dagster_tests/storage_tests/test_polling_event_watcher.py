@@ -1,4 +1,5 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from typing import Any, Callable, Mapping, Union
@@ -6,7 +7,11 @@
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
@@ -20,9 +25,11 @@ class SqlitePollingEventLogStorage(SqliteEventLogStorage):
     observe runs.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, callback_dispatch_workers=None, **kwargs):
         super(SqlitePollingEventLogStorage, self).__init__(*args, **kwargs)
-        self._watcher = SqlPollingEventWatcher(self)
+        self._watcher = SqlPollingEventWatcher(
+            self, callback_dispatch_workers=callback_dispatch_workers
+        )
         self._disposed = False
 
     @classmethod
@@ -72,9 +79,11 @@ def create_event(count: int, run_id: str = RUN_ID):
 
 
 @contextmanager
-def create_sqlite_run_event_logstorage():
+def create_sqlite_run_event_logstorage(callback_dispatch_workers=None):
     with tempfile.TemporaryDirectory() as tmpdir_path:
-        storage = SqlitePollingEventLogStorage(tmpdir_path)
+        storage = SqlitePollingEventLogStorage(
+            tmpdir_path, callback_dispatch_workers=callback_dispatch_workers
+        )
         yield storage
         storage.dispose()
 
@@ -138,3 +147,57 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def test_watch_many_runs():
+    run_ids = [f"run_{i}" for i in range(20)]
+    watched = {run_id: [] for run_id in run_ids}
+
+    with create_sqlite_run_event_logstorage(callback_dispatch_workers=4) as storage:
+        for run_id in run_ids:
+            storage.watch(
+                run_id, None, lambda event, _cursor, run_id=run_id: watched[run_id].append(event)
+            )
+
+        # all runs are polled by a single thread
+        assert (
+            len([thread for thread in threading.enumerate() if thread.name == "sql-event-watch"])
+            == 1
+        )
+
+        for i in range(3):
+            for run_id in run_ids:
+                storage.store_event(create_event(i, run_id=run_id))
+
+        attempts = 20
+        while any(len(events) < 3 for events in watched.values()) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        for run_id in run_ids:
+            assert [int(evt.message) for evt in watched[run_id]] == [0, 1, 2]
+            assert all(evt.run_id == run_id for evt in watched[run_id])
+
+
+def test_get_records_for_runs():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        for i in range(4):
+            for run_id in ["a", "b", "c"]:
+                storage.store_event(create_event(i, run_id=run_id))
+
+        cursor_a = storage.get_records_for_run("a", limit=2).cursor
+        cursors_by_run_id = {"a": cursor_a, "b": None, "c": None, "d": None}
+
+        connections = storage.get_records_for_runs(cursors_by_run_id)
+        assert set(connections) == set(cursors_by_run_id)
+        for run_id, cursor in cursors_by_run_id.items():
+            expected = storage.get_records_for_run(run_id, cursor=cursor)
+            assert connections[run_id].records == expected.records
+            assert connections[run_id].cursor == expected.cursor
+
+        assert [int(record.event_log_entry.message) for record in connections["a"].records] == [
+            2,
+            3,
+        ]
+        storage.dispose()
@@ -93,6 +93,7 @@
 from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
 from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+from dagster._core.storage.sql import get_column_names
 from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.test_utils import create_run_for_test, instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
@@ -523,6 +524,60 @@ def test_event_log_storage_store_with_multiple_runs(
             for run in runs:
                 instance.delete_run(run)
 
+    def test_schema_checks_cached(self, storage: EventLogStorage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("storage does not introspect a SQL schema")
+
+        with mock.patch(
+            "dagster._core.storage.event_log.sql_event_log.get_column_names",
+            wraps=get_column_names,
+        ) as get_column_names_mock:
+            storage._schema_cache.clear()  # noqa: SLF001
+            for _ in range(3):
+                assert storage.has_asset_key_index_cols()
+            assert get_column_names_mock.call_count == 1
+
+        index_name = f"test_secondary_index_{make_new_run_id()}"
+        assert not storage.has_secondary_index(index_name)
+        storage.enable_secondary_index(index_name)
+        assert storage.has_secondary_index(index_name)
+
+    def test_store_events_batch(self, storage: EventLogStorage, instance: DagsterInstance):
+        key = AssetKey("batched")
+
+        @op
+        def batched_op():
+            yield AssetMaterialization(asset_key=key, tags={"dagster/code_version": "1"})
+            yield AssetObservation(asset_key=key, tags={"dagster/data_version": "2"})
+            yield AssetMaterialization(asset_key=key, tags={"dagster/code_version": "3"})
+            yield Output(1)
+
+        run_id = make_new_run_id()
+        with create_and_delete_test_runs(instance, [run_id]):
+            events, _ = _synthesize_events(lambda: batched_op(), run_id)
+            storage.store_events(events)
+
+            logs = storage.get_logs_for_run(run_id)
+            assert [log.dagster_event_type for log in logs] == [
+                event.dagster_event_type for event in events
+            ]
+            assert [log.timestamp for log in logs] == [event.timestamp for event in events]
+
+            materializations = storage.fetch_materializations(key, limit=10, ascending=True).records
+            assert len(materializations) == 2
+            assert materializations[0].storage_id < materializations[1].storage_id
+
+            asset_records = list(storage.get_asset_records([key]))
+            assert len(asset_records) == 1
+            last_materialization = asset_records[0].asset_entry.last_materialization_record
+            assert last_materialization
+            assert last_materialization.storage_id == materializations[1].storage_id
+
+            if storage.supports_add_asset_event_tags():
+                assert storage.get_event_tags_for_asset(
+                    key, filter_event_id=materializations[1].storage_id
+                ) == [{"dagster/code_version": "3"}]
+
     # .watch() is async, there's a small chance they don't run before the asserts
     @pytest.mark.flaky(reruns=1)
     def test_event_log_storage_watch(
@@ -774,6 +774,88 @@ def test_fetch_records_by_update_timestamp(self, storage):
             )
         ] == [two]
 
+    def test_fetch_run_projections(self, storage):
+        assert storage
+        self._skip_in_memory(storage)
+
+        one = make_new_run_id()
+        two = make_new_run_id()
+        three = make_new_run_id()
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=one,
+                job_name="some_pipeline",
+                tags={"foo": "bar", "baz": "quux"},
+                status=DagsterRunStatus.STARTED,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=two,
+                job_name="other_pipeline",
+                tags={"foo": "baz"},
+                status=DagsterRunStatus.CANCELED,
+            )
+        )
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=three, job_name="some_pipeline", status=DagsterRunStatus.STARTED
+            )
+        )
+        storage.handle_run_event(
+            one,
+            DagsterEvent(
+                message="a message",
+                event_type_value=DagsterEventType.PIPELINE_SUCCESS.value,
+                job_name="some_pipeline",
+            ),
+        )
+
+        records_by_id = {
+            record.dagster_run.run_id: record for record in storage.get_run_records()
+        }
+        projections = storage.get_run_projections()
+        assert [projection.run_id for projection in projections] == [three, two, one]
+        for projection in projections:
+            record = records_by_id[projection.run_id]
+            assert projection.storage_id == record.storage_id
+            assert projection.job_name == record.dagster_run.job_name
+            assert projection.status == record.dagster_run.status
+            assert projection.tags == record.dagster_run.tags
+            assert projection.create_timestamp == record.create_timestamp
+            assert projection.update_timestamp == record.update_timestamp
+            assert projection.start_time == record.start_time
+            assert projection.end_time == record.end_time
+
+        assert storage.get_run_projections(RunsFilter(run_ids=[one]))[0].status == (
+            DagsterRunStatus.SUCCESS
+        )
+
+        assert {
+            projection.run_id: projection.tags
+            for projection in storage.get_run_projections(tag_keys=["foo"])
+        } == {one: {"foo": "bar"}, two: {"foo": "baz"}, three: {}}
+        assert all(not projection.tags for projection in storage.get_run_projections(tag_keys=[]))
+
+        assert [
+            projection.run_id
+            for projection in storage.get_run_projections(
+                RunsFilter(statuses=[DagsterRunStatus.STARTED, DagsterRunStatus.CANCELED]),
+                tag_keys=["foo"],
+                limit=1,
+                ascending=True,
+            )
+        ] == [two]
+        assert [
+            projection.run_id
+            for projection in storage.get_run_projections(
+                RunsFilter(tags={"foo": "bar"}), tag_keys=["baz"]
+            )
+        ] == [one]
+        assert [
+            projection.run_id for projection in storage.get_run_projections(cursor=two, limit=1)
+        ] == [one]
+
     def test_fetch_records_by_create_timestamp(self, storage):
         assert storage
         self._skip_in_memory(storage)
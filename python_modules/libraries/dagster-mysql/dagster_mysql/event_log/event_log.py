@@ -68,7 +68,6 @@ def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] =
             isolation_level=mysql_isolation_level(),
             poolclass=db_pool.NullPool,
         )
-        self._secondary_index_cache = {}
 
         table_names = retry_mysql_connection_fn(db.inspect(self._engine).get_table_names)
 
@@ -102,6 +101,7 @@ def upgrade(self) -> None:
         alembic_config = mysql_alembic_config(__file__)
         with self._connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+        self._schema_cache.clear()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -182,21 +182,12 @@ def index_connection(self) -> ContextManager[Connection]:
         return self._connect()
 
     def has_table(self, table_name: str) -> bool:
+        return self._schema_cache.has_table(table_name, lambda: self._has_table(table_name))
+
+    def _has_table(self, table_name: str) -> bool:
         with self._connect() as conn:
             return table_name in db.inspect(conn).get_table_names()
 
-    def has_secondary_index(self, name: str) -> bool:
-        if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                MySQLEventLogStorage, self
-            ).has_secondary_index(name)
-        return self._secondary_index_cache[name]
-
-    def enable_secondary_index(self, name: str) -> None:
-        super(MySQLEventLogStorage, self).enable_secondary_index(name)
-        if name in self._secondary_index_cache:
-            del self._secondary_index_cache[name]
-
     def watch(self, run_id: str, cursor: Optional[str], callback: EventHandlerFn) -> None:
         if cursor and EventLogCursor.parse(cursor).is_offset_cursor():
             check.failed("Cannot call `watch` with an offset cursor")
@@ -66,7 +66,6 @@ def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] =
             poolclass=db_pool.NullPool,
         )
 
-        self._index_migration_cache = {}
         table_names = retry_mysql_connection_fn(db.inspect(self._engine).get_table_names)
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
@@ -143,18 +142,7 @@ def upgrade(self) -> None:
         alembic_config = mysql_alembic_config(__file__)
         with self.connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
-
-    def has_built_index(self, migration_name: str) -> None:
-        if migration_name not in self._index_migration_cache:
-            self._index_migration_cache[migration_name] = super(
-                MySQLRunStorage, self
-            ).has_built_index(migration_name)
-        return self._index_migration_cache[migration_name]
-
-    def mark_index_built(self, migration_name: str) -> None:
-        super(MySQLRunStorage, self).mark_index_built(migration_name)
-        if migration_name in self._index_migration_cache:
-            del self._index_migration_cache[migration_name]
+        self._schema_cache.clear()
 
     def add_daemon_heartbeat(self, daemon_heartbeat: DaemonHeartbeat) -> None:
         with self.connect() as conn:
@@ -151,6 +151,7 @@ def upgrade(self) -> None:
         with self.connect() as conn:
             alembic_config = mysql_alembic_config(__file__)
             run_alembic_upgrade(alembic_config, conn)
+        self._schema_cache.clear()
 
     def _add_or_update_instigators_table(self, conn: Connection, state) -> None:
         selector_id = state.selector_id
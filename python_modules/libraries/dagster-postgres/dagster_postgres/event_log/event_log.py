@@ -20,7 +20,6 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
-from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -40,9 +39,13 @@
     retry_pg_connection_fn,
     retry_pg_creation_fn,
 )
+from .event_watcher import PostgresEventWatcher
 
 CHANNEL_NAME = "run_events"
 
+# keeps multi-row inserts well below the postgres limit on bind parameters per statement
+EVENT_INSERT_CHUNK_SIZE = 1000
+
 
 class PostgresEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """Postgres-backed event log storage.
@@ -92,9 +95,7 @@ def __init__(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
 
-        self._event_watcher = SqlPollingEventWatcher(self)
-
-        self._secondary_index_cache = {}
+        self._event_watcher = PostgresEventWatcher(self, self.postgres_url, CHANNEL_NAME)
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
         # revision because alembic config may be shared with other storage classes)
@@ -133,6 +134,7 @@ def upgrade(self) -> None:
         alembic_config = pg_alembic_config(__file__)
         with self._connect() as conn:
             run_alembic_upgrade(alembic_config, conn)
+        self._schema_cache.clear()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
@@ -183,7 +185,7 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # wakes up the PostgresEventWatcher of any process watching this run
             conn.execute(
                 db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
                 {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
@@ -207,6 +209,40 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def _insert_event_rows(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Overridden to insert the whole batch with multi-row inserts, using RETURNING to fetch
+        every storage id.
+        """
+        event_ids = []
+        for start in range(0, len(events), EVENT_INSERT_CHUNK_SIZE):
+            chunk = events[start : start + EVENT_INSERT_CHUNK_SIZE]
+            result = conn.execute(
+                SqlEventLogStorageTable.insert()
+                .values([self._get_event_insert_values(event) for event in chunk])
+                .returning(SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id)
+            )
+            rows = result.fetchall()
+            result.close()
+
+            # wakes up the PostgresEventWatcher of any process watching this run
+            conn.execute(
+                db.text(
+                    "SELECT pg_notify(:channel, notify_id) FROM unnest(:notify_ids) AS notify_id"
+                ),
+                {
+                    "channel": CHANNEL_NAME,
+                    "notify_ids": [f"{row[0]}_{row[1]}" for row in rows],
+                },
+            )
+
+            # ids are drawn from the sequence in VALUES order, so sorting them restores the
+            # order of the events in the chunk
+            event_ids.extend(sorted(int(row[1]) for row in rows))
+
+        return event_ids
+
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
         if not (event.dagster_event and event.dagster_event.asset_key):
@@ -300,19 +336,10 @@ def index_transaction(self) -> Iterator[Connection]:
                     yield conn
 
     def has_table(self, table_name: str) -> bool:
-        return bool(self._engine.dialect.has_table(self._engine.connect(), table_name))
-
-    def has_secondary_index(self, name: str) -> bool:
-        if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                PostgresEventLogStorage, self
-            ).has_secondary_index(name)
-        return self._secondary_index_cache[name]
-
-    def enable_secondary_index(self, name: str) -> None:
-        super(PostgresEventLogStorage, self).enable_secondary_index(name)
-        if name in self._secondary_index_cache:
-            del self._secondary_index_cache[name]
+        return self._schema_cache.has_table(
+            table_name,
+            lambda: bool(self._engine.dialect.has_table(self._engine.connect(), table_name)),
+        )
 
     def watch(
         self,
@@ -0,0 +1,197 @@
+import logging
+import select
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+import dagster._check as check
+import sqlalchemy.pool as db_pool
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
+from dagster._core.storage.event_log.polling_event_watcher import CallbackAfterCursor
+from dagster._core.storage.sql import create_engine
+
+NOTIFICATION_WAIT_TIMEOUT = 0.250  # 250ms
+FALLBACK_POLL_PERIOD = 16.0  # 16s
+RECONNECT_DELAY = 1.0  # 1s
+
+
+class _RunWatch:
+    """The callbacks registered for a watched run, and the cursor up to which events for the run
+    have already been dispatched to them.
+    """
+
+    def __init__(self, cursor: Optional[str]):
+        self.cursor = cursor
+        self.callbacks: List[CallbackAfterCursor] = []
+
+
+class PostgresEventWatcher:
+    """Event log watcher that is driven by the `NOTIFY` issued by `PostgresEventLogStorage` for
+    every event that is written, instead of polling the event log once per watched run.
+
+    A single daemon thread holds a dedicated connection that LISTENs on the event channel. When a
+    notification arrives for a watched run, the thread fetches the new events for that run and fires
+    the callbacks registered for it. Notifications are lost while the connection is down, so every
+    watched run is also fetched after (re)connecting and every FALLBACK_POLL_PERIOD seconds.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _watches and _runs_to_fetch. Callbacks are fired without holding
+            _lock, so they may call `watch_run` / `unwatch_run`.
+    """
+
+    def __init__(self, event_log_storage: EventLogStorage, postgres_url: str, channel: str):
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", EventLogStorage
+        )
+        self._postgres_url = check.str_param(postgres_url, "postgres_url")
+        self._channel = check.str_param(channel, "channel")
+
+        self._lock = threading.Lock()
+        self._watches: Dict[str, _RunWatch] = {}
+        self._runs_to_fetch: Set[str] = set()
+
+        self._should_thread_exit = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._disposed = False
+
+    def has_run_id(self, run_id: str) -> bool:
+        run_id = check.str_param(run_id, "run_id")
+        with self._lock:
+            return run_id in self._watches
+
+    def watch_run(
+        self, run_id: str, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]
+    ):
+        run_id = check.str_param(run_id, "run_id")
+        cursor = check.opt_str_param(cursor, "cursor")
+        callback = check.callable_param(callback, "callback")
+        with self._lock:
+            if run_id not in self._watches:
+                self._watches[run_id] = _RunWatch(cursor)
+            self._watches[run_id].callbacks.append(CallbackAfterCursor(cursor, callback))
+            # pick up any events written before the watch was registered
+            self._runs_to_fetch.add(run_id)
+
+            if self._thread is None and not self._disposed:
+                self._thread = threading.Thread(
+                    target=self._run, name="postgres-event-watch", daemon=True
+                )
+                self._thread.start()
+
+    def unwatch_run(self, run_id: str, handler: Callable[[EventLogEntry, str], None]):
+        run_id = check.str_param(run_id, "run_id")
+        handler = check.callable_param(handler, "handler")
+        with self._lock:
+            if run_id in self._watches:
+                watch = self._watches[run_id]
+                watch.callbacks = [
+                    callback_with_cursor
+                    for callback_with_cursor in watch.callbacks
+                    if callback_with_cursor.callback != handler
+                ]
+                if not watch.callbacks:
+                    del self._watches[run_id]
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        if not self._disposed:
+            self._disposed = True
+            self._should_thread_exit.set()
+            if self._thread and self._thread is not threading.current_thread():
+                self._thread.join()
+            with self._lock:
+                self._watches = {}
+                self._runs_to_fetch = set()
+
+    @contextmanager
+    def _listen(self) -> Iterator[Any]:
+        engine = create_engine(
+            self._postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
+        )
+        # the proxied DBAPI connection exposes psycopg2's fileno / poll / notifies
+        conn = engine.raw_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(f"LISTEN {self._channel};")
+            cursor.close()
+            yield conn
+        finally:
+            conn.close()
+            engine.dispose()
+
+    def _run(self):
+        while not self._should_thread_exit.is_set():
+            try:
+                with self._listen() as conn:
+                    self._process_notifications(conn)
+            except Exception:
+                logging.exception(
+                    "Error while listening for event log notifications, reconnecting in"
+                    f" {RECONNECT_DELAY}s"
+                )
+                self._should_thread_exit.wait(RECONNECT_DELAY)
+
+    def _process_notifications(self, conn: Any):
+        """Waits for notifications on the listening connection and fetches events for the runs that
+        were notified (or newly watched), until `close` is called.
+        """
+        # notifications sent before LISTEN was issued were missed, so start by fetching every run
+        last_poll_time = float("-inf")
+        while not self._should_thread_exit.is_set():
+            notified_run_ids = set()
+            if select.select([conn], [], [], NOTIFICATION_WAIT_TIMEOUT) != ([], [], []):
+                conn.poll()
+                while conn.notifies:
+                    notification = conn.notifies.pop(0)
+                    # the payload is `{run_id}_{storage_id}`
+                    run_id, _, _ = notification.payload.rpartition("_")
+                    notified_run_ids.add(run_id)
+
+            with self._lock:
+                if time.time() - last_poll_time >= FALLBACK_POLL_PERIOD:
+                    last_poll_time = time.time()
+                    run_ids = set(self._watches)
+                else:
+                    run_ids = (notified_run_ids | self._runs_to_fetch) & self._watches.keys()
+                self._runs_to_fetch = set()
+
+            for run_id in run_ids:
+                try:
+                    self._fetch_and_dispatch(run_id)
+                except Exception:
+                    logging.exception(f"Error while fetching watched events for run {run_id}")
+
+    def _fetch_and_dispatch(self, run_id: str):
+        with self._lock:
+            watch = self._watches.get(run_id)
+            if not watch:
+                return
+            cursor = watch.cursor
+
+        conn = self._event_log_storage.get_records_for_run(run_id, cursor=cursor)
+
+        with self._lock:
+            # the run may have been unwatched (and possibly watched again) during the fetch
+            if self._watches.get(run_id) is not watch:
+                return
+            watch.cursor = conn.cursor
+            callbacks = list(watch.callbacks)
+
+        for event_record in conn.records:
+            for callback_with_cursor in callbacks:
+                if (
+                    callback_with_cursor.cursor is None
+                    or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
+                    < event_record.storage_id
+                ):
+                    try:
+                        callback_with_cursor.callback(
+                            event_record.event_log_entry,
+                            str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                        )
+                    except Exception:
+                        logging.exception(f"Error in event log watch callback for run {run_id}")
@@ -84,8 +84,6 @@ def __init__(
             poolclass=db_pool.NullPool,
         )
 
-        self._index_migration_cache = {}
-
         # Stamp and create tables if the main table does not exist (we can't check alembic
         # revision because alembic config may be shared with other storage classes)
         if self.should_autocreate_tables:
@@ -159,18 +157,7 @@ def connect(self) -> ContextManager[Connection]:
     def upgrade(self) -> None:
         with self.connect() as conn:
             run_alembic_upgrade(pg_alembic_config(__file__), conn)
-
-    def has_built_index(self, migration_name: str) -> bool:
-        if migration_name not in self._index_migration_cache:
-            self._index_migration_cache[migration_name] = super(
-                PostgresRunStorage, self
-            ).has_built_index(migration_name)
-        return self._index_migration_cache[migration_name]
-
-    def mark_index_built(self, migration_name: str) -> None:
-        super(PostgresRunStorage, self).mark_index_built(migration_name)
-        if migration_name in self._index_migration_cache:
-            del self._index_migration_cache[migration_name]
+        self._schema_cache.clear()
 
     def add_daemon_heartbeat(self, daemon_heartbeat: DaemonHeartbeat) -> None:
         with self.connect() as conn:
@@ -4,7 +4,9 @@
 import yaml
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.test_utils import instance_for_test
+from dagster._core.utils import make_new_run_id
 from dagster_postgres.event_log import PostgresEventLogStorage
+from dagster_postgres.event_log.event_watcher import FALLBACK_POLL_PERIOD
 from dagster_tests.storage_tests.utils.event_log_storage import (
     TestEventLogStorage,
     create_test_event_log_record,
@@ -81,6 +83,33 @@ def watch_two(event, _cursor):
         assert [int(evt.message) for evt in watched_1] == [2, 3, 4]
         assert [int(evt.message) for evt in watched_2] == [4, 5]
 
+    def test_event_watcher_wakes_on_notify(self, storage):
+        run_id = make_new_run_id()
+        watched = []
+
+        storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+        # give the watcher time to start listening and complete its initial fetch
+        time.sleep(1)
+
+        storage.store_event(create_test_event_log_record(str(1), run_id=run_id))
+        start = time.time()
+        while not watched and time.time() - start < FALLBACK_POLL_PERIOD:
+            time.sleep(0.05)
+
+        # delivered by the notification, not by the fallback poll
+        assert time.time() - start < FALLBACK_POLL_PERIOD / 2
+        assert [int(evt.message) for evt in watched] == [1]
+
+        storage.store_events(
+            [create_test_event_log_record(str(i), run_id=run_id) for i in range(2, 5)]
+        )
+        start = time.time()
+        while len(watched) < 4 and time.time() - start < FALLBACK_POLL_PERIOD:
+            time.sleep(0.05)
+
+        assert time.time() - start < FALLBACK_POLL_PERIOD / 2
+        assert [int(evt.message) for evt in watched] == [1, 2, 3, 4]
+
     def test_load_from_config(self, hostname):
         url_cfg = f"""
         event_log_storage: